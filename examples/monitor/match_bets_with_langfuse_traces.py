@@ -15,7 +15,7 @@ from prediction_market_agent_tooling.deploy.betting_strategy import (
     ProbabilisticAnswer,
     TradeType,
 )
-from prediction_market_agent_tooling.markets.data_models import ResolvedBet
+from prediction_market_agent_tooling.markets.data_models import ResolvedBet, Trade
 from prediction_market_agent_tooling.markets.omen.omen import OmenAgentMarket
 from prediction_market_agent_tooling.tools.langfuse_client_utils import (
     ProcessMarketTrace,
@@ -33,22 +33,36 @@ class SimulatedOutcome(BaseModel):
     profit: float
 
 
-def get_outcome_for_trace(
+def get_outcomes_for_traces(
     strategy: BettingStrategy,
+    traces: list[ProcessMarketTrace],
+    market_outcomes: list[bool],
+) -> list[SimulatedOutcome | None]:
+    all_trades = strategy.calculate_trades_many(
+        existing_positions=[None] * len(traces),
+        answers=[
+            ProbabilisticAnswer(
+                p_yes=trace.answer.p_yes,
+                confidence=trace.answer.confidence,
+            )
+            for trace in traces
+        ],
+        markets=[trace.market for trace in traces],
+    )
+    return [
+        get_outcome_for_trades(trades, trace, market_outcome)
+        for trades, trace, market_outcome in zip(all_trades, traces, market_outcomes)
+    ]
+
+
+def get_outcome_for_trades(
+    trades: list[Trade],
     trace: ProcessMarketTrace,
     market_outcome: bool,
 ) -> SimulatedOutcome | None:
     market = trace.market
     answer = trace.answer
 
-    trades = strategy.calculate_trades(
-        existing_position=None,
-        answer=ProbabilisticAnswer(
-            p_yes=answer.p_yes,
-            confidence=answer.confidence,
-        ),
-        market=market,
-    )
     # For example, when our predicted p_yes is 95%, but market is already trading at 99%, and we don't have anything to sell, Kelly will yield no trades.
     if not trades:
         return None
@@ -167,12 +181,18 @@ if __name__ == "__main__":
             agent_balance = starting_balance
             simulated_outcomes: list[SimulatedOutcome] = []
 
-            for bet_with_trace in bets_with_traces:
+            # Trades for all the bets are calculated at once, which is much faster than one by one.
+            all_simulated_outcomes = get_outcomes_for_traces(
+                strategy=strategy,
+                traces=[bt.trace for bt in bets_with_traces],
+                market_outcomes=[bt.bet.market_outcome for bt in bets_with_traces],
+            )
+
+            for bet_with_trace, simulated_outcome in zip(
+                bets_with_traces, all_simulated_outcomes
+            ):
                 bet = bet_with_trace.bet
                 trace = bet_with_trace.trace
-                simulated_outcome = get_outcome_for_trace(
-                    strategy=strategy, trace=trace, market_outcome=bet.market_outcome
-                )
                 if simulated_outcome is None:
                     continue
                 simulated_outcomes.append(simulated_outcome)
@@ -15,10 +15,12 @@ class AbstractBenchmarkedAgent:
         agent_name: str,
         max_workers: t.Optional[int] = None,
         model: str | None = None,
+        provider: str | None = None,
     ):
         self.model = model
         self.agent_name = agent_name
         self.max_workers = max_workers  # Limit the number of workers that can run this worker in parallel threads
+        self.provider = provider  # Used to rate-limit agents calling the same API, see `Benchmarker.run_agents`
 
     def is_predictable(self, market_question: str) -> bool:
         """
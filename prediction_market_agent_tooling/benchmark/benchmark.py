@@ -1,11 +1,10 @@
 import concurrent.futures
 import os
 import typing as t
-from collections import defaultdict
+from collections import Counter, deque
 
 import numpy as np
 import pandas as pd
-from sklearn.metrics import precision_score, recall_score
 from tqdm import tqdm
 
 from prediction_market_agent_tooling.benchmark.agents import AbstractBenchmarkedAgent
@@ -13,13 +12,17 @@ from prediction_market_agent_tooling.benchmark.utils import (
     Prediction,
     PredictionsCache,
     Resolution,
+    get_shard_index,
 )
 from prediction_market_agent_tooling.markets.agent_market import AgentMarket
 from prediction_market_agent_tooling.tools.costs import openai_costs
-from prediction_market_agent_tooling.tools.utils import (
-    check_not_none,
-    should_not_happen,
-)
+from prediction_market_agent_tooling.tools.parallelism import RateLimiter
+from prediction_market_agent_tooling.tools.utils import should_not_happen
+
+# Same as the default of ThreadPoolExecutor, which was used for agents without `max_workers` before.
+DEFAULT_AGENT_MAX_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+WITHIN_RANGE_TOLERANCES = [0.05, 0.1, 0.2]
 
 
 class Benchmarker:
@@ -31,9 +34,19 @@ class Benchmarker:
             str,
             t.Callable[[list[Prediction], t.Sequence[AgentMarket]], str | float | None],
         ] = {},
+        frame_metric_fns: t.Dict[
+            str, t.Callable[[pd.DataFrame], str | float | None]
+        ] = {},
         cache_path: t.Optional[str] = None,
         only_cached: bool = False,
+        shard_cache_paths: t.Sequence[str] = (),
     ):
+        """
+        :param metric_fns: Extra metrics, computed from the agent's predictions and the markets.
+        :param frame_metric_fns: Extra metrics, computed from the agent's rows of `get_predictions_frame`.
+        :param cache_path: Predictions are loaded from it and new predictions are appended to it, so a killed run can be resumed.
+        :param shard_cache_paths: Caches of the shards of a sharded run (see `run_agents`), merged into the loaded predictions.
+        """
         self.registered_agents: t.List[AbstractBenchmarkedAgent] = agents
         if len(set(a.agent_name for a in self.registered_agents)) != len(
             self.registered_agents
@@ -46,10 +59,14 @@ class Benchmarker:
 
         # Predictions
         self.cache_path = cache_path
-        if self.cache_path and os.path.exists(self.cache_path):
-            self.predictions = PredictionsCache.load(path=self.cache_path)
-        else:
-            self.predictions = PredictionsCache(predictions={})
+        self.predictions = PredictionsCache.load_many(
+            (
+                [self.cache_path]
+                if self.cache_path and os.path.exists(self.cache_path)
+                else []
+            )
+            + list(shard_cache_paths)
+        )
 
         self.only_cached = only_cached
         self.markets: t.Sequence[AgentMarket] = (
@@ -69,47 +86,7 @@ class Benchmarker:
 
         # Metrics
         self.metric_fns = metric_fns
-        predefined_metric_fns = {
-            "MSE for `p_yes`": self._compute_mse,
-            "Mean confidence": self._compute_mean_confidence,
-            "% within +-0.05": lambda predictions, markets: self._compute_percentage_within_range(
-                predictions, markets, tolerance=0.05
-            ),
-            "% within +-0.1": lambda predictions, markets: self._compute_percentage_within_range(
-                predictions, markets, tolerance=0.1
-            ),
-            "% within +-0.2": lambda predictions, markets: self._compute_percentage_within_range(
-                predictions, markets, tolerance=0.2
-            ),
-            "% correct outcome": self._compute_correct_outcome_percentage,
-            "% precision for `yes`": lambda predictions, markets: self._compute_precision_and_recall_percentages(
-                predictions, markets, pos_label=1
-            )[
-                0
-            ],
-            "% precision for `no`": lambda predictions, markets: self._compute_precision_and_recall_percentages(
-                predictions, markets, pos_label=0
-            )[
-                0
-            ],
-            "% recall for `yes`": lambda predictions, markets: self._compute_precision_and_recall_percentages(
-                predictions, markets, pos_label=1
-            )[
-                1
-            ],
-            "% recall for `no`": lambda predictions, markets: self._compute_precision_and_recall_percentages(
-                predictions, markets, pos_label=0
-            )[
-                1
-            ],
-            "confidence/p_yes error correlation": self._compute_confidence_p_yes_error_correlation,
-            "Mean info_utility": self._compute_mean_info_utility,
-            "Proportion answerable": self._compute_ratio_evaluated_as_answerable,
-            "Proportion answered": self._compute_ratio_answered,
-            "Mean cost ($)": self._compute_mean_cost,
-            "Mean time (s)": self._compute_mean_time,
-        }
-        self.metric_fns.update(predefined_metric_fns)
+        self.frame_metric_fns = frame_metric_fns
 
     def add_prediction(
         self,
@@ -126,51 +103,114 @@ class Benchmarker:
     def get_prediction(self, agent_name: str, question: str) -> Prediction:
         return self.predictions.get_prediction(agent_name=agent_name, question=question)
 
-    def run_agents(self, enable_timing: bool = True) -> None:
+    def run_agents(
+        self,
+        enable_timing: bool = True,
+        max_workers: int | None = None,
+        provider_rate_limits: dict[str, float] | None = None,
+        n_shards: int = 1,
+        shard_index: int = 0,
+    ) -> None:
+        """
+        Runs all agents on all markets they don't have a cached prediction for yet, at the same time,
+        so that a slow agent doesn't keep the others waiting.
+
+        :param max_workers: Global limit of predictions running at once, defaults to the sum of the agents' limits.
+        :param provider_rate_limits: Maximum number of predictions started per second, for agents with the given `provider`.
+        :param n_shards: To split the run across processes or machines, run each shard with its own `shard_index` and `cache_path`,
+            then create a benchmarker with all the shards' caches in `shard_cache_paths` to compute the metrics and the report.
+        """
+        if not 0 <= shard_index < n_shards:
+            raise ValueError(f"Invalid {shard_index=} for {n_shards=}.")
         agent: AbstractBenchmarkedAgent  # Fix for mypy issue with tqdm.
-        for agent in tqdm(self.registered_agents, desc="Running agents"):
-            # Filter out cached predictions
-            markets_to_run = [
+        # Filter out cached predictions
+        markets_to_run: dict[str, deque[AgentMarket]] = {
+            agent.agent_name: deque(
                 m
                 for m in self.markets
                 if not self.predictions.has_market(
                     agent_name=agent.agent_name, question=m.question
                 )
-            ]
+                and (
+                    n_shards == 1
+                    or get_shard_index(agent.agent_name, m.question, n_shards)
+                    == shard_index
+                )
+            )
+            for agent in self.registered_agents
+        }
+        rate_limiters = {
+            provider: RateLimiter(calls_per_second)
+            for provider, calls_per_second in (provider_rate_limits or {}).items()
+        }
+        max_workers = max_workers or sum(
+            agent.max_workers or DEFAULT_AGENT_MAX_WORKERS
+            for agent in self.registered_agents
+        )
 
-            def get_prediction_result(
-                market: AgentMarket,
-            ) -> tuple[str, Prediction]:
-                with openai_costs(model=agent.model) as costs:
-                    prediction = (
-                        agent.check_and_predict(market_question=market.question)
-                        if not market.is_resolved()
-                        else (
-                            agent.check_and_predict_restricted(
-                                market_question=market.question,
-                                time_restriction_up_to=market.created_time,  # TODO: Add support for resolved_at and any time in between.
-                            )
-                            if market.created_time is not None
-                            else should_not_happen()
+        def get_prediction_result(
+            agent: AbstractBenchmarkedAgent,
+            market: AgentMarket,
+        ) -> tuple[str, Prediction]:
+            if agent.provider in rate_limiters:
+                rate_limiters[agent.provider].wait()
+            with openai_costs(model=agent.model) as costs:
+                prediction = (
+                    agent.check_and_predict(market_question=market.question)
+                    if not market.is_resolved()
+                    else (
+                        agent.check_and_predict_restricted(
+                            market_question=market.question,
+                            time_restriction_up_to=market.created_time,  # TODO: Add support for resolved_at and any time in between.
                         )
+                        if market.created_time is not None
+                        else should_not_happen()
                     )
-                    prediction.time = costs.time
-                    prediction.cost = costs.cost
-                return market.question, prediction
-
-            # Run agents in parallel
-            with concurrent.futures.ThreadPoolExecutor(
-                max_workers=agent.max_workers
-            ) as executor:
-                futures = [
-                    executor.submit(get_prediction_result, market)
-                    for market in markets_to_run
-                ]
-                for future in tqdm(
-                    concurrent.futures.as_completed(futures),
-                    total=len(futures),
-                    desc=f"Running {agent.agent_name}",
-                ):
+                )
+                prediction.time = costs.time
+                prediction.cost = costs.cost
+            return market.question, prediction
+
+        # Run all agents in one pool, but submit only as many predictions of each agent as its `max_workers` allows,
+        # so that workers never sit blocked on an agent's limit.
+        running: dict[
+            concurrent.futures.Future[tuple[str, Prediction]], AbstractBenchmarkedAgent
+        ] = {}
+        running_per_agent: Counter[str] = Counter()
+
+        def submit_available(executor: concurrent.futures.ThreadPoolExecutor) -> None:
+            submitted = True
+            while submitted:
+                submitted = False
+                # Round-robin over the agents, so each one gets its share of the global limit.
+                for agent in self.registered_agents:
+                    if len(running) >= max_workers:
+                        return
+                    if not markets_to_run[agent.agent_name] or (
+                        agent.max_workers is not None
+                        and running_per_agent[agent.agent_name] >= agent.max_workers
+                    ):
+                        continue
+                    market = markets_to_run[agent.agent_name].popleft()
+                    future = executor.submit(get_prediction_result, agent, market)
+                    running[future] = agent
+                    running_per_agent[agent.agent_name] += 1
+                    submitted = True
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor, tqdm(
+            total=sum(len(markets) for markets in markets_to_run.values()),
+            desc="Running agents",
+        ) as progress:
+            submit_available(executor)
+            while running:
+                done, _ = concurrent.futures.wait(
+                    running, return_when=concurrent.futures.FIRST_COMPLETED
+                )
+                for future in done:
+                    agent = running.pop(future)
+                    running_per_agent[agent.agent_name] -= 1
                     market_question, prediction = future.result()
                     self.add_prediction(
                         agent=agent,
@@ -178,7 +218,14 @@ class Benchmarker:
                         market_question=market_question,
                     )
                     if self.cache_path:
-                        self.predictions.save(self.cache_path)
+                        PredictionsCache.append(
+                            self.cache_path,
+                            agent_name=agent.agent_name,
+                            question=market_question,
+                            prediction=prediction,
+                        )
+                    progress.update()
+                submit_available(executor)
 
     @staticmethod
     def filter_predictions_for_answered(
@@ -191,180 +238,153 @@ class Benchmarker:
                 filtered_markets.append(m)
         return filtered_predictions, filtered_markets
 
-    def _compute_mse(
-        self, predictions: t.List[Prediction], markets: t.Sequence[AgentMarket]
-    ) -> float | None:
-        predictions, markets = self.filter_predictions_for_answered(
-            predictions, markets
+    def get_predictions_frame(self) -> pd.DataFrame:
+        """
+        One row per (agent, market), in the order of the registered agents and markets,
+        with everything needed to compute the metrics.
+        Prediction columns of not answered predictions are NaN.
+        """
+        n_markets = len(self.markets)
+        market_p_yes = np.array([m.current_p_yes for m in self.markets], dtype=float)
+        market_resolution_yes = np.array(
+            [m.probable_resolution == Resolution.YES for m in self.markets], dtype=bool
         )
-        if not predictions:
-            return None
-        mse = sum(
-            [
-                (check_not_none(p.outcome_prediction).p_yes - m.current_p_yes) ** 2
-                for p, m in zip(predictions, markets)
-            ]
-        ) / len(predictions)
-        return mse
-
-    def _compute_mean_confidence(
-        self, predictions: t.List[Prediction], markets: t.Sequence[AgentMarket]
-    ) -> float | None:
-        predictions, markets = self.filter_predictions_for_answered(
-            predictions, markets
+        market_yes_price = np.array(
+            [m.yes_outcome_price for m in self.markets], dtype=float
         )
-        if not predictions:
-            return None
-        mean_confidence = sum(
-            [check_not_none(p.outcome_prediction).confidence for p in predictions]
-        ) / len(predictions)
-        return mean_confidence
-
-    def _compute_mean_info_utility(
-        self, predictions: t.List[Prediction], markets: t.Sequence[AgentMarket]
-    ) -> float | None:
-        predictions, markets = self.filter_predictions_for_answered(
-            predictions, markets
+        market_no_price = np.array(
+            [m.no_outcome_price for m in self.markets], dtype=float
         )
-        predictions_with_info_utility = [
-            p
-            for p in predictions
-            if check_not_none(p.outcome_prediction).info_utility is not None
-        ]
-        if not predictions_with_info_utility:
-            return None
-        mean_info_utility = sum(
-            [
-                check_not_none(check_not_none(p.outcome_prediction).info_utility)
-                for p in predictions_with_info_utility
-            ]
-        ) / len(predictions_with_info_utility)
-        return mean_info_utility
-
-    def _compute_percentage_within_range(
-        self,
-        predictions: t.List[Prediction],
-        markets: t.Sequence[AgentMarket],
-        tolerance: float = 0.05,
-    ) -> float | None:
-        predictions, markets = self.filter_predictions_for_answered(
-            predictions, markets
-        )
-        if not predictions:
-            return None
-
-        within_range_count = 0
-        for p, m in zip(predictions, markets):
-            if (
-                abs(check_not_none(p.outcome_prediction).p_yes - m.current_p_yes)
-                <= tolerance
-            ):
-                within_range_count += 1
 
-        return (100 * within_range_count) / len(predictions)
-
-    def _compute_correct_outcome_percentage(
-        self, predictions: t.List[Prediction], markets: t.Sequence[AgentMarket]
-    ) -> float | None:
-        predictions, markets = self.filter_predictions_for_answered(
-            predictions, markets
+        questions = [m.question for m in self.markets]
+        predictions = [
+            self.predictions.predictions[agent.agent_name][question]
+            for agent in self.registered_agents
+            for question in questions
+        ]
+        outcome_predictions = [p.outcome_prediction for p in predictions]
+
+        n_agents = len(self.registered_agents)
+        return pd.DataFrame(
+            {
+                "agent": np.repeat(
+                    [a.agent_name for a in self.registered_agents], n_markets
+                ),
+                "question": np.tile(questions, n_agents),
+                "market_index": np.tile(np.arange(n_markets), n_agents),
+                "is_predictable": np.array(
+                    [p.is_predictable for p in predictions], dtype=bool
+                ),
+                "is_answered": np.array(
+                    [o is not None for o in outcome_predictions], dtype=bool
+                ),
+                "p_yes": np.array(
+                    [o.p_yes if o else None for o in outcome_predictions], dtype=float
+                ),
+                "confidence": np.array(
+                    [o.confidence if o else None for o in outcome_predictions],
+                    dtype=float,
+                ),
+                "info_utility": np.array(
+                    [o.info_utility if o else None for o in outcome_predictions],
+                    dtype=float,
+                ),
+                "cost": np.array([p.cost for p in predictions], dtype=float),
+                "time": np.array([p.time for p in predictions], dtype=float),
+                "market_p_yes": np.tile(market_p_yes, n_agents),
+                "market_resolution_yes": np.tile(market_resolution_yes, n_agents),
+                "market_yes_price": np.tile(market_yes_price, n_agents),
+                "market_no_price": np.tile(market_no_price, n_agents),
+            }
         )
-        if not predictions:
-            return None
-
-        correct_outcome_count = 0
-        for p, m in zip(predictions, markets):
-            if (
-                check_not_none(p.outcome_prediction).probable_resolution
-                == m.probable_resolution
-            ):
-                correct_outcome_count += 1
-
-        return (100 * correct_outcome_count) / len(predictions)
 
-    def _compute_precision_and_recall_percentages(
-        self,
-        predictions: t.List[Prediction],
-        markets: t.Sequence[AgentMarket],
-        pos_label: int,
-    ) -> tuple[float | None, float | None]:
-        predictions, markets = self.filter_predictions_for_answered(
-            predictions, markets
+    def _compute_predefined_metrics(self, frame: pd.DataFrame) -> pd.DataFrame:
+        """
+        Computes all the predefined metrics at once, as group-by reductions over the predictions frame.
+        Returns a frame indexed by the agent name, with a column per metric.
+        """
+        agent_names = [a.agent_name for a in self.registered_agents]
+        answered = frame[frame["is_answered"]]
+        p_yes_error = (answered["p_yes"] - answered["market_p_yes"]).abs()
+        predicted_yes = answered["p_yes"] > 0.5
+        resolution_yes = answered["market_resolution_yes"]
+        answered_columns = pd.DataFrame(
+            {
+                "agent": answered["agent"],
+                "squared_error": p_yes_error**2,
+                "confidence": answered["confidence"],
+                "info_utility": answered["info_utility"],
+                **{
+                    f"within_{tolerance}": p_yes_error <= tolerance
+                    for tolerance in WITHIN_RANGE_TOLERANCES
+                },
+                "correct": predicted_yes == resolution_yes,
+                "predicted_yes": predicted_yes,
+                "predicted_no": ~predicted_yes,
+                "resolution_yes": resolution_yes,
+                "resolution_no": ~resolution_yes,
+                "true_yes": predicted_yes & resolution_yes,
+                "true_no": ~predicted_yes & ~resolution_yes,
+                # For the correlation between confidence and p_yes error.
+                "x": answered["confidence"],
+                "y": p_yes_error,
+                "xx": answered["confidence"] ** 2,
+                "yy": p_yes_error**2,
+                "xy": answered["confidence"] * p_yes_error,
+            }
         )
-        if not predictions:
-            return None, None
-
-        ground_truth = [
-            (1 if m.probable_resolution == Resolution.YES else 0) for m in markets
-        ]
-        y_pred = [
-            (
-                1
-                if check_not_none(p.outcome_prediction).probable_resolution
-                == Resolution.YES
-                else 0
+        grouped = answered_columns.groupby("agent", sort=False)
+        means = grouped.mean().reindex(agent_names)
+        sums = grouped.sum().reindex(agent_names)
+        counts = grouped.size().reindex(agent_names)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            correlation = (counts * sums["xy"] - sums["x"] * sums["y"]) / np.sqrt(
+                (counts * sums["xx"] - sums["x"] ** 2)
+                * (counts * sums["yy"] - sums["y"] ** 2)
             )
-            for p in predictions
-        ]
-
-        precision = precision_score(
-            ground_truth, y_pred, pos_label=pos_label, zero_division=0.0
-        )
-        recall = recall_score(
-            ground_truth, y_pred, pos_label=pos_label, zero_division=0.0
-        )
 
-        return precision * 100, recall * 100
-
-    def _compute_confidence_p_yes_error_correlation(
-        self, predictions: t.List[Prediction], markets: t.Sequence[AgentMarket]
-    ) -> float | None:
-        predictions, markets = self.filter_predictions_for_answered(
-            predictions, markets
-        )
-        if not predictions:
-            return None
+        def ratio(numerator: pd.Series, denominator: pd.Series) -> pd.Series:
+            # Same as `zero_division=0.0` in sklearn's precision and recall, but still NaN for agents without answers.
+            return (100 * numerator / denominator.where(denominator > 0)).where(
+                denominator > 0, np.where(counts > 0, 0.0, np.nan)
+            )
 
-        p_yes_errors = [
-            abs(check_not_none(p.outcome_prediction).p_yes - m.current_p_yes)
-            for p, m in zip(predictions, markets)
-        ]
-        confidences = [
-            check_not_none(p.outcome_prediction).confidence for p in predictions
+        # Costs and times are optional, and they are averaged over all predictions.
+        all_predictions = frame.assign(
+            cost=frame["cost"].where(frame["cost"] != 0),
+            time=frame["time"].where(frame["time"] != 0),
+        ).groupby("agent", sort=False)[
+            ["cost", "time", "is_predictable", "is_answered"]
         ]
-        return float(np.corrcoef(confidences, p_yes_errors)[0, 1])
-
-    def _compute_mean_cost(
-        self, predictions: t.List[Prediction], markets: t.Sequence[AgentMarket]
-    ) -> float | None:
-        # Note: costs are optional
-        costs = [p.cost for p in predictions if p.cost]
-        if costs:
-            return sum(costs) / len(costs)
-        else:
-            return None
-
-    def _compute_mean_time(
-        self, predictions: t.List[Prediction], markets: t.Sequence[AgentMarket]
-    ) -> float | None:
-        # Note: times are optional
-        times = [p.time for p in predictions if p.time]
-        if times:
-            return sum(times) / len(times)
-        else:
-            return None
-
-    def _compute_ratio_evaluated_as_answerable(
-        self, predictions: t.List[Prediction], markets: t.Sequence[AgentMarket]
-    ) -> float:
-        return sum(1 for p in predictions if p.is_predictable) / len(predictions)
-
-    def _compute_ratio_answered(
-        self, predictions: t.List[Prediction], markets: t.Sequence[AgentMarket]
-    ) -> float:
-        return sum(1 for p in predictions if p.is_answered) / len(predictions)
+        all_means = all_predictions.mean().reindex(agent_names)
+
+        return pd.DataFrame(
+            {
+                "MSE for `p_yes`": means["squared_error"],
+                "Mean confidence": means["confidence"],
+                **{
+                    f"% within +-{tolerance}": 100 * means[f"within_{tolerance}"]
+                    for tolerance in WITHIN_RANGE_TOLERANCES
+                },
+                "% correct outcome": 100 * means["correct"],
+                "% precision for `yes`": ratio(sums["true_yes"], sums["predicted_yes"]),
+                "% precision for `no`": ratio(sums["true_no"], sums["predicted_no"]),
+                "% recall for `yes`": ratio(sums["true_yes"], sums["resolution_yes"]),
+                "% recall for `no`": ratio(sums["true_no"], sums["resolution_no"]),
+                "confidence/p_yes error correlation": correlation,
+                "Mean info_utility": means["info_utility"],
+                "Proportion answerable": all_means["is_predictable"],
+                "Proportion answered": all_means["is_answered"],
+                "Mean cost ($)": all_means["cost"],
+                "Mean time (s)": all_means["time"],
+            },
+            index=agent_names,
+        )
 
-    def compute_metrics(self) -> t.Dict[str, t.List[t.Any]]:
+    def compute_metrics(
+        self, frame: pd.DataFrame | None = None
+    ) -> t.Dict[str, t.List[t.Any]]:
         metrics: dict[str, list[str | float | None]] = {}
         metrics["Agents"] = [a.agent_name for a in self.registered_agents]
 
@@ -379,6 +399,22 @@ class Benchmarker:
                 ]
                 metrics[name].append(fn(ordered_predictions, self.markets))
 
+        frame = self.get_predictions_frame() if frame is None else frame
+        if self.frame_metric_fns:
+            agent_frames = dict(tuple(frame.groupby("agent", sort=False)))
+            for name, frame_fn in self.frame_metric_fns.items():
+                metrics[name] = [
+                    frame_fn(agent_frames[agent.agent_name])
+                    for agent in self.registered_agents
+                ]
+
+        predefined_metrics = self._compute_predefined_metrics(frame)
+        for name in predefined_metrics.columns:
+            metrics[name] = [
+                None if pd.isna(value) else float(value)
+                for value in predefined_metrics[name]
+            ]
+
         return metrics
 
     def get_markets_summary(self) -> t.Dict[str, t.List[str | float]]:
@@ -480,62 +516,67 @@ class Benchmarker:
         return expected_returns_perc
 
     def compute_expected_returns_summary(
-        self,
+        self, frame: pd.DataFrame | None = None
     ) -> t.Tuple[dict[str, list[str | float]], dict[str, list[str | float | None]]]:
-        overall_summary: dict[str, list[str | float]] = defaultdict(list)
-
-        for agent in self.registered_agents:
-            expected_returns = []
-
-            for market in self.markets:
-                if (
-                    prediction := self.get_prediction(agent.agent_name, market.question)
-                ).is_answered and (
-                    expected_return := self.calculate_expected_returns(
-                        prediction, market
-                    )
-                ) is not None:
-                    expected_returns.append(expected_return)
-
-            overall_summary["Agent"].append(agent.agent_name)
-            overall_summary["Mean expected returns"].append(
-                float(np.mean(expected_returns))
-            )
-            overall_summary["Median expected returns"].append(
-                float(np.median(expected_returns))
-            )
-            overall_summary["Total expected returns"].append(
-                float(np.sum(expected_returns))
-            )
-
-        per_market: dict[str, list[str | float | None]] = defaultdict(list)
+        frame = self.get_predictions_frame() if frame is None else frame
+        # Vectorized version of `calculate_expected_returns`.
+        bet_units = 10
+        bet_on_yes = frame["is_answered"] & (frame["p_yes"] > 0.5)
+        bet_on_no = frame["is_answered"] & (frame["p_yes"] <= 0.5)
+        yes_shares = np.where(bet_on_yes & (frame["market_yes_price"] > 0), 20.0, 0.0)
+        no_shares = np.where(bet_on_no & (frame["market_no_price"] > 0), 20.0, 0.0)
+        expected_value = (
+            yes_shares * frame["market_p_yes"]
+            + no_shares * (1 - frame["market_p_yes"])
+            - bet_units
+        )
+        expected_returns = (100 * expected_value / bet_units).where(
+            (yes_shares > 0) | (no_shares > 0)
+        )
 
-        for market in self.markets:
-            per_market["Market Question"].append(market.question)
+        grouped = expected_returns.groupby(frame["agent"], sort=False)
+        agent_names = [a.agent_name for a in self.registered_agents]
+        overall_summary: dict[str, list[str | float]] = {
+            "Agent": list(agent_names),
+            "Mean expected returns": [
+                float(x) for x in grouped.mean().reindex(agent_names)
+            ],
+            "Median expected returns": [
+                float(x) for x in grouped.median().reindex(agent_names)
+            ],
+            "Total expected returns": [
+                float(x) for x in grouped.sum().reindex(agent_names)
+            ],
+        }
 
-            for agent in self.registered_agents:
-                per_market[agent.agent_name].append(
-                    self.calculate_expected_returns(
-                        self.get_prediction(agent.agent_name, market.question), market
-                    )
-                )
+        per_market: dict[str, list[str | float | None]] = {
+            "Market Question": [market.question for market in self.markets]
+        }
+        per_agent_returns = expected_returns.to_numpy().reshape(
+            len(agent_names), len(self.markets)
+        )
+        for agent_name, returns in zip(agent_names, per_agent_returns):
+            per_market[agent_name] = [
+                None if np.isnan(value) else float(value) for value in returns
+            ]
 
-        return dict(overall_summary), dict(per_market)
+        return overall_summary, per_market
 
     def generate_markdown_report(self) -> str:
+        frame = self.get_predictions_frame()
         md = "# Comparison Report\n\n"
         md += "## Market Results\n\n"
         md += pd.DataFrame(self.get_markets_results()).to_markdown(index=False)
         md += "\n\n"
         md += "## Agent Results\n\n"
         md += "### Summary Statistics\n\n"
-        md += pd.DataFrame(self.compute_metrics()).to_markdown(index=False)
+        md += pd.DataFrame(self.compute_metrics(frame)).to_markdown(index=False)
         md += "\n\n"
         md += "### Markets\n\n"
         md += pd.DataFrame(self.get_markets_summary()).to_markdown(index=False)
         md += "\n\n"
         md += "### Expected value\n\n"
-        overall_summary, per_market = self.compute_expected_returns_summary()
+        overall_summary, per_market = self.compute_expected_returns_summary(frame)
         md += pd.DataFrame(overall_summary).to_markdown(index=False)
         md += "\n\n"
         md += pd.DataFrame(per_market).to_markdown(index=False)
@@ -1,8 +1,12 @@
+import hashlib
 import json
+import os
+import re
 import typing as t
 
 from pydantic import BaseModel
 
+from prediction_market_agent_tooling.loggers import logger
 from prediction_market_agent_tooling.markets.data_models import (
     ProbabilisticAnswer,
     Resolution,
@@ -33,7 +37,21 @@ AgentPredictions = t.Dict[str, Prediction]
 Predictions = t.Dict[str, AgentPredictions]
 
 
+class PredictionsCacheRecord(BaseModel):
+    agent_name: str
+    question: str
+    prediction: Prediction
+
+
+_NON_WHITESPACE = re.compile(r"\S")
+
+
 class PredictionsCache(BaseModel):
+    """
+    The cache file is a snapshot written by `save` (optional), followed by records appended by `append`, one JSON per line.
+    Appending is O(1) per prediction, and a record torn by a crash mid-write is skipped on `load`.
+    """
+
     predictions: Predictions
 
     def get_prediction(self, agent_name: str, question: str) -> Prediction:
@@ -58,10 +76,80 @@ class PredictionsCache(BaseModel):
         with open(path, "w") as f:
             json.dump(self.model_dump(), f, indent=2)
 
+    @staticmethod
+    def append(
+        path: str, agent_name: str, question: str, prediction: Prediction
+    ) -> None:
+        record = PredictionsCacheRecord(
+            agent_name=agent_name, question=question, prediction=prediction
+        )
+        line = record.model_dump_json() + "\n"
+        with open(path, "ab+") as f:
+            # Start on a new line if the file ends with a snapshot or with a record torn by a crash.
+            if f.tell() > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    line = "\n" + line
+            f.write(line.encode())
+            f.flush()
+            os.fsync(f.fileno())
+
     @staticmethod
     def load(path: str) -> "PredictionsCache":
         with open(path, "r") as f:
-            return PredictionsCache.model_validate(json.load(f))
+            content = f.read()
+
+        cache = PredictionsCache(predictions={})
+        decoder = json.JSONDecoder()
+        match = _NON_WHITESPACE.search(content)
+        while match is not None:
+            try:
+                item, end = decoder.raw_decode(content, match.start())
+            except json.JSONDecodeError:
+                logger.warning(
+                    f"Skipping a corrupted entry in the predictions cache {path} at position {match.start()}."
+                )
+                line_end = content.find("\n", match.start())
+                if line_end == -1:
+                    break
+                end = line_end
+            else:
+                if "predictions" in item:
+                    snapshot = PredictionsCache.model_validate(item)
+                    for agent_name, agent_predictions in snapshot.predictions.items():
+                        cache.predictions.setdefault(agent_name, {}).update(
+                            agent_predictions
+                        )
+                else:
+                    record = PredictionsCacheRecord.model_validate(item)
+                    cache.predictions.setdefault(record.agent_name, {})[
+                        record.question
+                    ] = record.prediction
+
+            match = _NON_WHITESPACE.search(content, end)
+
+        return cache
+
+    @staticmethod
+    def load_many(paths: t.Sequence[str]) -> "PredictionsCache":
+        """
+        Merges caches written by separate runs, e.g. by the shards of one benchmark run.
+        """
+        cache = PredictionsCache(predictions={})
+        for path in paths:
+            for agent_name, agent_predictions in PredictionsCache.load(
+                path
+            ).predictions.items():
+                cache.predictions.setdefault(agent_name, {}).update(agent_predictions)
+        return cache
+
+
+def get_shard_index(agent_name: str, question: str, n_shards: int) -> int:
+    """
+    Deterministically assigns the (agent, market) pair to one of the shards, same in every process and on every machine.
+    """
+    digest = hashlib.sha256(f"{agent_name}\n{question}".encode()).digest()
+    return int.from_bytes(digest[:8], "big") % n_shards
 
 
 def get_llm_api_call_cost(
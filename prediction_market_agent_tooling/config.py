@@ -52,6 +52,12 @@ class APIKeys(BaseSettings):
     ENABLE_CACHE: bool = True
     CACHE_DIR: str = "./.cache"
 
+    # If set, Omen subgraph queries are answered from a local mirror stored in this database, see `OmenLocalIndex`.
+    OMEN_LOCAL_INDEX_DB_URL: t.Optional[str] = None
+    # If enabled, results of Omen subgraph queries are cached, see `OmenSubgraphQueryCache`. Persisted in `CACHE_DIR` if `..._PERSIST` is enabled as well.
+    OMEN_SUBGRAPH_QUERY_CACHE: bool = False
+    OMEN_SUBGRAPH_QUERY_CACHE_PERSIST: bool = False
+
     @property
     def manifold_user_id(self) -> str:
         return get_authenticated_user(
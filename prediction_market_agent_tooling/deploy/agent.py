@@ -2,8 +2,10 @@ import getpass
 import inspect
 import os
 import tempfile
+import threading
 import time
 import typing as t
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from enum import Enum
 from functools import cached_property
@@ -45,6 +47,7 @@ from prediction_market_agent_tooling.markets.data_models import (
 )
 from prediction_market_agent_tooling.markets.markets import (
     MarketType,
+    RecentBetsIndex,
     have_bet_on_market_since,
 )
 from prediction_market_agent_tooling.markets.omen.omen import (
@@ -60,6 +63,8 @@ from prediction_market_agent_tooling.tools.langfuse_ import langfuse_context, ob
 from prediction_market_agent_tooling.tools.utils import DatetimeWithTimezone, utcnow
 
 MAX_AVAILABLE_MARKETS = 20
+# Agents don't bet on the same market again within this time window, see `verify_market`.
+RECENT_BETS_WINDOW = timedelta(hours=24)
 TRADER_TAG = "trader"
 
 
@@ -283,6 +288,8 @@ class DeployableTraderAgent(DeployableAgent):
     bet_on_n_markets_per_run: int = 1
     min_required_balance_to_operate: xDai | None = xdai_type(1)
     min_balance_to_keep_in_native_currency: xDai | None = xdai_type(0.1)
+    # If bigger than 1, markets are verified and answered concurrently in `process_markets`, see `process_markets_concurrently`.
+    max_concurrent_markets: int = 1
 
     def __init__(
         self,
@@ -291,6 +298,12 @@ class DeployableTraderAgent(DeployableAgent):
     ) -> None:
         super().__init__(enable_langfuse=enable_langfuse)
         self.place_bet = place_bet
+        # Built in `before_process_markets`, so that `verify_market` doesn't need to fetch bets for every market.
+        self.recent_bets_index: RecentBetsIndex | None = None
+        # Trading on markets is serialized, even if they are processed concurrently.
+        self._trading_lock = threading.Lock()
+        # Set only while markets are processed concurrently, `None` means no limit.
+        self._markets_left_to_trade: int | None = None
 
     def get_betting_strategy(self, market: AgentMarket) -> BettingStrategy:
         user_id = market.get_user_id(api_keys=APIKeys())
@@ -373,6 +386,8 @@ class DeployableTraderAgent(DeployableAgent):
             )
 
     def have_bet_on_market_since(self, market: AgentMarket, since: timedelta) -> bool:
+        if self.recent_bets_index is not None and self.recent_bets_index.covers(since):
+            return self.recent_bets_index.have_bet_on_market_since(market, since)
         return have_bet_on_market_since(keys=APIKeys(), market=market, since=since)
 
     def verify_market(self, market_type: MarketType, market: AgentMarket) -> bool:
@@ -380,7 +395,7 @@ class DeployableTraderAgent(DeployableAgent):
         Subclasses can implement their own logic instead of this one, or on top of this one.
         By default, it allows only markets where user didn't bet recently and it's a reasonable question.
         """
-        if self.have_bet_on_market_since(market, since=timedelta(hours=24)):
+        if self.have_bet_on_market_since(market, since=RECENT_BETS_WINDOW):
             return False
 
         # Manifold allows to bet only on markets with probability between 1 and 99.
@@ -451,6 +466,31 @@ class DeployableTraderAgent(DeployableAgent):
             self.update_langfuse_trace_by_processed_market(market_type, None)
             return None
 
+        # Markets can be processed concurrently (see `process_markets_concurrently`), but trading on them is serialized,
+        # so that position and balances are read after the previous market's trades and transactions don't race for nonces.
+        with self._trading_lock:
+            if self._markets_left_to_trade is not None:
+                if self._markets_left_to_trade <= 0:
+                    logger.info(
+                        f"Enough markets processed in this run, skipping market '{market.question}'."
+                    )
+                    self.update_langfuse_trace_by_processed_market(market_type, None)
+                    return None
+                self._markets_left_to_trade -= 1
+
+            placed_trades = self.trade_on_market(market, answer)
+
+        self.after_process_market(market_type, market)
+
+        processed_market = ProcessedMarket(answer=answer, trades=placed_trades)
+        self.update_langfuse_trace_by_processed_market(market_type, processed_market)
+
+        logger.info(f"Processed market {market.question=} from {market.url=}.")
+        return processed_market
+
+    def trade_on_market(
+        self, market: AgentMarket, answer: ProbabilisticAnswer
+    ) -> list[PlacedTrade]:
         existing_position = market.get_position(user_id=APIKeys().bet_from_address)
         trades = self.build_trades(
             market=market,
@@ -476,13 +516,13 @@ class DeployableTraderAgent(DeployableAgent):
                         raise ValueError(f"Unexpected trade type {trade.trade_type}.")
                 placed_trades.append(PlacedTrade.from_trade(trade, id))
 
-        self.after_process_market(market_type, market)
-
-        processed_market = ProcessedMarket(answer=answer, trades=placed_trades)
-        self.update_langfuse_trace_by_processed_market(market_type, processed_market)
+                if (
+                    trade.trade_type == TradeType.BUY
+                    and self.recent_bets_index is not None
+                ):
+                    self.recent_bets_index.add_bet(market)
 
-        logger.info(f"Processed market {market.question=} from {market.url=}.")
-        return processed_market
+        return placed_trades
 
     def after_process_market(
         self, market_type: MarketType, market: AgentMarket
@@ -494,6 +534,10 @@ class DeployableTraderAgent(DeployableAgent):
         Executes actions that occur before bets are placed.
         """
         api_keys = APIKeys()
+        if market_type in (MarketType.OMEN, MarketType.MANIFOLD):
+            self.recent_bets_index = RecentBetsIndex.build(
+                api_keys, market_type, since=RECENT_BETS_WINDOW
+            )
         if market_type == MarketType.OMEN:
             # First, check if we have enough xDai to pay for gas, there is no way of doing anything without it.
             self.check_min_required_balance_to_operate(
@@ -520,6 +564,12 @@ class DeployableTraderAgent(DeployableAgent):
         logger.info(
             f"Fetched {len(available_markets)=} markets to process, going to process {self.bet_on_n_markets_per_run=}."
         )
+
+        if self.max_concurrent_markets > 1:
+            self.process_markets_concurrently(market_type, available_markets)
+            logger.info("All markets processed.")
+            return
+
         processed = 0
 
         for market in available_markets:
@@ -536,6 +586,40 @@ class DeployableTraderAgent(DeployableAgent):
 
         logger.info("All markets processed.")
 
+    def process_markets_concurrently(
+        self, market_type: MarketType, markets: t.Sequence[AgentMarket]
+    ) -> None:
+        """
+        Verifies and answers up to `max_concurrent_markets` markets at once, while trades are still placed one market at a time.
+        Stops as soon as `bet_on_n_markets_per_run` markets were processed, markets that are still queued are cancelled.
+        """
+        self._markets_left_to_trade = self.bet_on_n_markets_per_run
+
+        def process(market: AgentMarket) -> ProcessedMarket | None:
+            if (
+                self._markets_left_to_trade is not None
+                and self._markets_left_to_trade <= 0
+            ):
+                return None
+            # We need to check it again before each market bet, as the balance might have changed.
+            self.check_min_required_balance_to_operate(market_type)
+            return self.process_market(market_type, market)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrent_markets)
+        try:
+            futures: list[Future[ProcessedMarket | None]] = [
+                executor.submit(process, market) for market in markets
+            ]
+            processed = 0
+            for future in as_completed(futures):
+                if future.result() is not None:
+                    processed += 1
+                if processed == self.bet_on_n_markets_per_run:
+                    break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+            self._markets_left_to_trade = None
+
     def after_process_markets(self, market_type: MarketType) -> None:
         pass
 
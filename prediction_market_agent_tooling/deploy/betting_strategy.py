@@ -1,5 +1,9 @@
+import typing as t
 from abc import ABC, abstractmethod
 
+import numpy as np
+import numpy.typing as npt
+
 from prediction_market_agent_tooling.markets.agent_market import AgentMarket
 from prediction_market_agent_tooling.markets.data_models import (
     Currency,
@@ -13,6 +17,8 @@ from prediction_market_agent_tooling.markets.omen.data_models import get_boolean
 from prediction_market_agent_tooling.tools.betting_strategies.kelly_criterion import (
     get_kelly_bet_full,
     get_kelly_bet_simplified,
+    get_kelly_bets_full,
+    get_kelly_bets_simplified,
 )
 from prediction_market_agent_tooling.tools.utils import check_not_none
 
@@ -27,6 +33,24 @@ class BettingStrategy(ABC):
     ) -> list[Trade]:
         pass
 
+    def calculate_trades_many(
+        self,
+        existing_positions: t.Sequence[Position | None],
+        answers: t.Sequence[ProbabilisticAnswer],
+        markets: t.Sequence[AgentMarket],
+    ) -> list[list[Trade]]:
+        """
+        Same as `calculate_trades`, but for many markets at once, e.g. when simulating strategies on past bets.
+        Strategies that can compute their bets vectorized override this, by default it's just a loop.
+        """
+        check_same_lengths(existing_positions, answers, markets)
+        return [
+            self.calculate_trades(existing_position, answer, market)
+            for existing_position, answer, market in zip(
+                existing_positions, answers, markets
+            )
+        ]
+
     def build_zero_token_amount(self, currency: Currency) -> TokenAmount:
         return TokenAmount(amount=0, currency=currency)
 
@@ -40,6 +64,39 @@ class BettingStrategy(ABC):
                 "Cannot handle trades with currencies that deviate from market's currency"
             )
 
+    def _build_rebalance_trades_from_bet(
+        self,
+        existing_position: Position | None,
+        market: AgentMarket,
+        direction: bool,
+        size: float,
+    ) -> list[Trade]:
+        amounts = {
+            market.get_outcome_str_from_bool(direction): TokenAmount(
+                amount=size, currency=market.currency
+            ),
+        }
+        target_position = Position(market_id=market.id, amounts=amounts)
+        return self._build_rebalance_trades_from_positions(
+            existing_position, target_position, market=market
+        )
+
+    def _build_rebalance_trades_from_bets(
+        self,
+        existing_positions: t.Sequence[Position | None],
+        markets: t.Sequence[AgentMarket],
+        directions: npt.NDArray[np.bool_],
+        sizes: npt.NDArray[np.float64],
+    ) -> list[list[Trade]]:
+        return [
+            self._build_rebalance_trades_from_bet(
+                existing_position, market, bool(direction), float(size)
+            )
+            for existing_position, market, direction, size in zip(
+                existing_positions, markets, directions, sizes
+            )
+        ]
+
     def _build_rebalance_trades_from_positions(
         self,
         existing_position: Position | None,
@@ -165,16 +222,26 @@ class KellyBettingStrategy(BettingStrategy):
             )
         )
 
-        amounts = {
-            market.get_outcome_str_from_bool(kelly_bet.direction): TokenAmount(
-                amount=kelly_bet.size, currency=market.currency
-            ),
-        }
-        target_position = Position(market_id=market.id, amounts=amounts)
-        trades = self._build_rebalance_trades_from_positions(
-            existing_position, target_position, market=market
+        return self._build_rebalance_trades_from_bet(
+            existing_position, market, kelly_bet.direction, kelly_bet.size
+        )
+
+    def calculate_trades_many(
+        self,
+        existing_positions: t.Sequence[Position | None],
+        answers: t.Sequence[ProbabilisticAnswer],
+        markets: t.Sequence[AgentMarket],
+    ) -> list[list[Trade]]:
+        check_same_lengths(existing_positions, answers, markets)
+        sizes, directions = get_kelly_bets_for_markets(
+            markets,
+            estimated_p_yes=np.array([a.p_yes for a in answers], dtype=float),
+            confidence=np.array([a.confidence for a in answers], dtype=float),
+            max_bet=np.full(len(markets), self.max_bet_amount, dtype=float),
+        )
+        return self._build_rebalance_trades_from_bets(
+            existing_positions, markets, directions, sizes
         )
-        return trades
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(max_bet_amount={self.max_bet_amount})"
@@ -226,16 +293,91 @@ class MaxAccuracyWithKellyScaledBetsStrategy(BettingStrategy):
             )
         )
 
-        amounts = {
-            market.get_outcome_str_from_bool(kelly_bet.direction): TokenAmount(
-                amount=kelly_bet.size, currency=market.currency
+        return self._build_rebalance_trades_from_bet(
+            existing_position, market, kelly_bet.direction, kelly_bet.size
+        )
+
+    def calculate_trades_many(
+        self,
+        existing_positions: t.Sequence[Position | None],
+        answers: t.Sequence[ProbabilisticAnswer],
+        markets: t.Sequence[AgentMarket],
+    ) -> list[list[Trade]]:
+        check_same_lengths(existing_positions, answers, markets)
+        # Fixed direction of bet, only use Kelly to adjust the bet size based on market's outcome pool size.
+        sizes, directions = get_kelly_bets_for_markets(
+            markets,
+            estimated_p_yes=np.array([a.p_yes > 0.5 for a in answers], dtype=float),
+            confidence=np.ones(len(markets)),
+            max_bet=np.array(
+                [
+                    self.adjust_bet_amount(existing_position, market)
+                    for existing_position, market in zip(existing_positions, markets)
+                ],
+                dtype=float,
             ),
-        }
-        target_position = Position(market_id=market.id, amounts=amounts)
-        trades = self._build_rebalance_trades_from_positions(
-            existing_position, target_position, market=market
         )
-        return trades
+        return self._build_rebalance_trades_from_bets(
+            existing_positions, markets, directions, sizes
+        )
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(max_bet_amount={self.max_bet_amount})"
+
+
+def get_kelly_bets_for_markets(
+    markets: t.Sequence[AgentMarket],
+    estimated_p_yes: npt.NDArray[np.float64],
+    confidence: npt.NDArray[np.float64],
+    max_bet: npt.NDArray[np.float64],
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+    """
+    Kelly bets for all the markets at once, using the full formula for markets with a token pool
+    and the simplified one for the others, same as `KellyBettingStrategy.calculate_trades` does for a single market.
+    """
+    has_token_pool = np.array([m.has_token_pool() for m in markets], dtype=bool)
+    sizes = np.zeros(len(markets), dtype=float)
+    directions = np.zeros(len(markets), dtype=bool)
+
+    if has_token_pool.any():
+        pool_markets = [m for m, has in zip(markets, has_token_pool) if has]
+        outcome_token_pools = [
+            check_not_none(m.outcome_token_pool) for m in pool_markets
+        ]
+        sizes[has_token_pool], directions[has_token_pool] = get_kelly_bets_full(
+            yes_outcome_pool_size=np.array(
+                [
+                    pool[m.get_outcome_str_from_bool(True)]
+                    for m, pool in zip(pool_markets, outcome_token_pools)
+                ],
+                dtype=float,
+            ),
+            no_outcome_pool_size=np.array(
+                [
+                    pool[m.get_outcome_str_from_bool(False)]
+                    for m, pool in zip(pool_markets, outcome_token_pools)
+                ],
+                dtype=float,
+            ),
+            estimated_p_yes=estimated_p_yes[has_token_pool],
+            confidence=confidence[has_token_pool],
+            max_bet=max_bet[has_token_pool],
+        )
+
+    if (~has_token_pool).any():
+        sizes[~has_token_pool], directions[~has_token_pool] = get_kelly_bets_simplified(
+            max_bet=max_bet[~has_token_pool],
+            market_p_yes=np.array(
+                [m.current_p_yes for m, has in zip(markets, has_token_pool) if not has],
+                dtype=float,
+            ),
+            estimated_p_yes=estimated_p_yes[~has_token_pool],
+            confidence=confidence[~has_token_pool],
+        )
+
+    return sizes, directions
+
+
+def check_same_lengths(*sequences: t.Sized) -> None:
+    if len({len(s) for s in sequences}) > 1:
+        raise ValueError("All the sequences must have the same length.")
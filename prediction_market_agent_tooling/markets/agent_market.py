@@ -129,6 +129,13 @@ class AgentMarket(BaseModel):
         """
         raise NotImplementedError("Subclasses must implement this method")
 
+    @classmethod
+    def prefetch_p_yes_histories(cls, markets: t.Sequence["AgentMarket"]) -> None:
+        """
+        Prefetches data needed by `get_last_trade_p_yes` for many markets at once, if the platform supports it.
+        By default does nothing and the data are fetched market by market.
+        """
+
     def get_last_trade_p_no(self) -> Probability | None:
         """
         Get the last trade price for the NO outcome. This can be different from the current p_yes, for example if market is closed and it's probabilities are fixed to 0 and 1.
@@ -1,8 +1,13 @@
+import asyncio
+import threading
+import time
 import typing as t
-from datetime import datetime
+from collections import OrderedDict
+from datetime import datetime, timedelta
 
 import requests
 import tenacity
+from pydantic import ValidationError
 
 from prediction_market_agent_tooling.gtypes import Mana, SecretStr
 from prediction_market_agent_tooling.loggers import logger
@@ -18,7 +23,10 @@ from prediction_market_agent_tooling.markets.manifold.data_models import (
     ManifoldMarket,
     ManifoldUser,
 )
-from prediction_market_agent_tooling.tools.parallelism import par_map
+from prediction_market_agent_tooling.tools.async_http import (
+    AsyncHTTPClient,
+    run_with_async_client,
+)
 from prediction_market_agent_tooling.tools.utils import (
     response_list_to_model,
     response_to_model,
@@ -34,6 +42,21 @@ Note: There is an existing wrapper here: https://github.com/vluzko/manifoldpy. C
 
 MANIFOLD_API_BASE_URL = "https://api.manifold.markets"
 MARKETS_LIMIT = 1000  # Manifold will only return up to 1000 markets
+MARKET_DETAILS_CACHE_TTL = timedelta(minutes=5)
+MARKET_DETAILS_CACHE_MAX_SIZE = 10_000
+# Fields of `FullManifoldMarket` that aren't part of `ManifoldMarket`, but required.
+FULL_MARKET_REQUIRED_FIELDS = {"description", "textDescription"}
+# Fields of `FullManifoldMarket` that aren't part of the search results and don't change with trading, so they can be cached.
+# The others (probability, pool, volume, ...) are always taken from the fresh search results.
+MARKET_DETAIL_FIELDS = FULL_MARKET_REQUIRED_FIELDS | {
+    "coverImageUrl",
+    "groupSlugs",
+    "shouldAnswersSumToOne",
+    "addAnswersMode",
+}
+
+_market_details_cache: OrderedDict[str, tuple[float, dict[str, t.Any]]] = OrderedDict()
+_market_details_cache_lock = threading.Lock()
 
 
 def get_manifold_binary_markets(
@@ -50,7 +73,144 @@ def get_manifold_binary_markets(
     created_after: t.Optional[datetime] = None,
     excluded_questions: set[str] | None = None,
 ) -> list[ManifoldMarket]:
-    all_markets: list[ManifoldMarket] = []
+    return run_with_async_client(
+        lambda client: get_manifold_binary_markets_async(
+            client,
+            limit=limit,
+            term=term,
+            topic_slug=topic_slug,
+            sort=sort,
+            filter_=filter_,
+            created_after=created_after,
+            excluded_questions=excluded_questions,
+        )
+    )
+
+
+async def get_manifold_binary_markets_async(
+    client: AsyncHTTPClient,
+    limit: int,
+    term: str = "",
+    topic_slug: t.Optional[str] = None,
+    sort: t.Literal["liquidity", "score", "newest", "close-date"] | None = "liquidity",
+    filter_: (
+        t.Literal[
+            "open", "closed", "resolved", "closing-this-month", "closing-next-month"
+        ]
+        | None
+    ) = "open",
+    created_after: t.Optional[datetime] = None,
+    excluded_questions: set[str] | None = None,
+) -> list[ManifoldMarket]:
+    return [
+        market
+        for market, _ in await _search_manifold_binary_markets_async(
+            client,
+            limit=limit,
+            term=term,
+            topic_slug=topic_slug,
+            sort=sort,
+            filter_=filter_,
+            created_after=created_after,
+            excluded_questions=excluded_questions,
+        )
+    ]
+
+
+def get_full_manifold_binary_markets(
+    limit: int,
+    term: str = "",
+    topic_slug: t.Optional[str] = None,
+    sort: t.Literal["liquidity", "score", "newest", "close-date"] | None = "liquidity",
+    filter_: (
+        t.Literal[
+            "open", "closed", "resolved", "closing-this-month", "closing-next-month"
+        ]
+        | None
+    ) = "open",
+    created_after: t.Optional[datetime] = None,
+    excluded_questions: set[str] | None = None,
+) -> list[FullManifoldMarket]:
+    return run_with_async_client(
+        lambda client: get_full_manifold_binary_markets_async(
+            client,
+            limit=limit,
+            term=term,
+            topic_slug=topic_slug,
+            sort=sort,
+            filter_=filter_,
+            created_after=created_after,
+            excluded_questions=excluded_questions,
+        )
+    )
+
+
+async def get_full_manifold_binary_markets_async(
+    client: AsyncHTTPClient,
+    limit: int,
+    term: str = "",
+    topic_slug: t.Optional[str] = None,
+    sort: t.Literal["liquidity", "score", "newest", "close-date"] | None = "liquidity",
+    filter_: (
+        t.Literal[
+            "open", "closed", "resolved", "closing-this-month", "closing-next-month"
+        ]
+        | None
+    ) = "open",
+    created_after: t.Optional[datetime] = None,
+    excluded_questions: set[str] | None = None,
+) -> list[FullManifoldMarket]:
+    """
+    Same as `get_manifold_binary_markets_async`, but with the full markets.
+    Markets whose search result already contains all the fields are used as they are,
+    otherwise details fetched in the last `MARKET_DETAILS_CACHE_TTL` are merged over the search result,
+    and details of the rest are fetched concurrently (see `get_manifold_markets_async`).
+    """
+    found = await _search_manifold_binary_markets_async(
+        client,
+        limit=limit,
+        term=term,
+        topic_slug=topic_slug,
+        sort=sort,
+        filter_=filter_,
+        created_after=created_after,
+        excluded_questions=excluded_questions,
+    )
+    full_markets: dict[str, FullManifoldMarket] = {}
+    for market, item in found:
+        if FULL_MARKET_REQUIRED_FIELDS.issubset(item):
+            full_markets[market.id] = FullManifoldMarket.model_validate(item)
+            _cache_market_details(full_markets[market.id])
+        elif (details := _get_cached_market_details(market.id)) is not None:
+            full_markets[market.id] = FullManifoldMarket.model_validate(
+                {**item, **details}
+            )
+    missing_ids = [market.id for market, _ in found if market.id not in full_markets]
+    full_markets.update(
+        zip(missing_ids, await get_manifold_markets_async(client, missing_ids))
+    )
+    return [full_markets[market.id] for market, _ in found]
+
+
+async def _search_manifold_binary_markets_async(
+    client: AsyncHTTPClient,
+    limit: int,
+    term: str,
+    topic_slug: t.Optional[str],
+    sort: t.Literal["liquidity", "score", "newest", "close-date"] | None,
+    filter_: (
+        t.Literal[
+            "open", "closed", "resolved", "closing-this-month", "closing-next-month"
+        ]
+        | None
+    ),
+    created_after: t.Optional[datetime],
+    excluded_questions: set[str] | None,
+) -> list[tuple[ManifoldMarket, dict[str, t.Any]]]:
+    """
+    Returns the found markets together with their raw data from the search.
+    """
+    all_markets: list[tuple[ManifoldMarket, dict[str, t.Any]]] = []
 
     url = f"{MANIFOLD_API_BASE_URL}/v0/search-markets"
     params: dict[str, t.Union[str, int, float]] = {
@@ -68,14 +228,17 @@ def get_manifold_binary_markets(
     offset = 0
     while True:
         params["offset"] = offset
-        response = requests.get(url, params=params)
-        markets = response_list_to_model(response, ManifoldMarket)
+        items = await _get_search_markets_page_async(client, url, params)
+        try:
+            markets = [ManifoldMarket.model_validate(item) for item in items]
+        except ValidationError as e:
+            raise ValueError(f"Unable to validate: `{items}`") from e
 
         if not markets:
             break
 
         found_all_new_markets = False
-        for market in markets:
+        for market, item in zip(markets, items):
             if created_after and market.createdTime < created_after:
                 if sort == "newest":
                     found_all_new_markets = True
@@ -86,7 +249,7 @@ def get_manifold_binary_markets(
             if excluded_questions and market.question in excluded_questions:
                 continue
 
-            all_markets.append(market)
+            all_markets.append((market, item))
 
         if found_all_new_markets:
             break
@@ -99,6 +262,21 @@ def get_manifold_binary_markets(
     return all_markets[:limit]
 
 
+@tenacity.retry(
+    stop=tenacity.stop_after_attempt(3),
+    wait=tenacity.wait_fixed(1),
+    after=lambda x: logger.debug(
+        f"_get_search_markets_page_async failed, {x.attempt_number=}."
+    ),
+)
+async def _get_search_markets_page_async(
+    client: AsyncHTTPClient, url: str, params: t.Mapping[str, t.Any]
+) -> list[dict[str, t.Any]]:
+    response = await client.get(url, params=params)
+    items: list[dict[str, t.Any]] = response.json()
+    return items
+
+
 def get_one_manifold_binary_market() -> ManifoldMarket:
     return get_manifold_binary_markets(1)[0]
 
@@ -160,6 +338,68 @@ def get_manifold_market(market_id: str) -> FullManifoldMarket:
     return response_to_model(requests.get(url), FullManifoldMarket)
 
 
+@tenacity.retry(
+    stop=tenacity.stop_after_attempt(3),
+    wait=tenacity.wait_fixed(1),
+    after=lambda x: logger.debug(
+        f"get_manifold_market_async failed, {x.attempt_number=}."
+    ),
+)
+async def get_manifold_market_async(
+    client: AsyncHTTPClient, market_id: str
+) -> FullManifoldMarket:
+    url = f"{MANIFOLD_API_BASE_URL}/v0/market/{market_id}"
+    return response_to_model(await client.get(url), FullManifoldMarket)
+
+
+def get_manifold_markets(market_ids: t.Sequence[str]) -> list[FullManifoldMarket]:
+    return run_with_async_client(
+        lambda client: get_manifold_markets_async(client, market_ids)
+    )
+
+
+async def get_manifold_markets_async(
+    client: AsyncHTTPClient, market_ids: t.Sequence[str]
+) -> list[FullManifoldMarket]:
+    """
+    Fetches the markets concurrently, each of them only once, returned in the order of `market_ids`.
+    Their details are cached for `get_full_manifold_binary_markets_async`.
+    """
+    unique_ids = list(dict.fromkeys(market_ids))
+    fetched = await asyncio.gather(
+        *(get_manifold_market_async(client, market_id) for market_id in unique_ids)
+    )
+    markets: dict[str, FullManifoldMarket] = {}
+    for market_id, market in zip(unique_ids, fetched):
+        _cache_market_details(market)
+        markets[market_id] = market
+
+    return [markets[market_id] for market_id in market_ids]
+
+
+def _get_cached_market_details(market_id: str) -> dict[str, t.Any] | None:
+    with _market_details_cache_lock:
+        cached = _market_details_cache.get(market_id)
+        if cached is None:
+            return None
+        expires_at, details = cached
+        if expires_at <= time.monotonic():
+            del _market_details_cache[market_id]
+            return None
+        return details
+
+
+def _cache_market_details(market: FullManifoldMarket) -> None:
+    with _market_details_cache_lock:
+        _market_details_cache[market.id] = (
+            time.monotonic() + MARKET_DETAILS_CACHE_TTL.total_seconds(),
+            market.model_dump(include=MARKET_DETAIL_FIELDS),
+        )
+        _market_details_cache.move_to_end(market.id)
+        while len(_market_details_cache) > MARKET_DETAILS_CACHE_MAX_SIZE:
+            _market_details_cache.popitem(last=False)
+
+
 @tenacity.retry(
     stop=tenacity.stop_after_attempt(3),
     wait=tenacity.wait_fixed(1),
@@ -186,11 +426,9 @@ def get_resolved_manifold_bets(
     end_time: t.Optional[datetime],
 ) -> tuple[list[ManifoldBet], list[ManifoldMarket]]:
     bets = get_manifold_bets(user_id, start_time, end_time)
-    markets: list[ManifoldMarket] = par_map(
-        items=bets,
-        func=lambda bet: get_manifold_market(bet.contractId),
-    )
-    resolved_markets, resolved_bets = [], []
+    markets = get_manifold_markets([bet.contractId for bet in bets])
+    resolved_markets: list[ManifoldMarket] = []
+    resolved_bets: list[ManifoldBet] = []
     for bet, market in zip(bets, markets):
         if market.is_resolved_non_cancelled():
             resolved_markets.append(market)
@@ -12,8 +12,7 @@ from prediction_market_agent_tooling.markets.agent_market import (
 from prediction_market_agent_tooling.markets.data_models import BetAmount, Currency
 from prediction_market_agent_tooling.markets.manifold.api import (
     get_authenticated_user,
-    get_manifold_binary_markets,
-    get_manifold_market,
+    get_full_manifold_binary_markets,
     place_bet,
 )
 from prediction_market_agent_tooling.markets.manifold.data_models import (
@@ -107,8 +106,8 @@ class ManifoldAgentMarket(AgentMarket):
             raise ValueError(f"Unknown filter_by: {filter_by}")
 
         return [
-            ManifoldAgentMarket.from_data_model(get_manifold_market(m.id))
-            for m in get_manifold_binary_markets(
+            ManifoldAgentMarket.from_data_model(m)
+            for m in get_full_manifold_binary_markets(
                 limit=limit,
                 sort=sort,
                 created_after=created_after,
@@ -2,6 +2,8 @@ import typing as t
 from datetime import datetime, timedelta
 from enum import Enum
 
+from pydantic import BaseModel
+
 from prediction_market_agent_tooling.config import APIKeys
 from prediction_market_agent_tooling.markets.agent_market import (
     AgentMarket,
@@ -70,32 +72,97 @@ def get_binary_markets(
     return markets
 
 
-def have_bet_on_market_since(
-    keys: APIKeys, market: AgentMarket, since: timedelta
-) -> bool:
-    start_time = utcnow() - since
-    recently_betted_questions = (
-        set(
-            get_manifold_market(b.contractId).question
-            for b in get_manifold_bets(
+def get_latest_bet_times_by_question(
+    keys: APIKeys, market_type: MarketType, start_time: datetime
+) -> dict[str, datetime]:
+    """
+    Returns the time of the latest bet placed since `start_time`, for every question the user has bet on.
+    """
+    bet_questions_and_times: list[tuple[str, datetime]]
+    match market_type:
+        case MarketType.MANIFOLD:
+            bets = get_manifold_bets(
                 user_id=get_authenticated_user(
                     keys.manifold_api_key.get_secret_value()
                 ).id,
                 start_time=start_time,
                 end_time=None,
             )
-        )
-        if isinstance(market, ManifoldAgentMarket)
-        else (
-            set(
-                b.title
+            # Usually there are multiple bets on the same market, fetch each market only once.
+            questions = {
+                contract_id: get_manifold_market(contract_id).question
+                for contract_id in set(b.contractId for b in bets)
+            }
+            bet_questions_and_times = [
+                (questions[b.contractId], b.createdTime) for b in bets
+            ]
+        case MarketType.OMEN:
+            bet_questions_and_times = [
+                (b.title, b.creation_datetime)
                 for b in OmenSubgraphHandler().get_bets(
                     better_address=keys.bet_from_address,
                     start_time=start_time,
                 )
-            )
+            ]
+        case _:
+            should_not_happen(f"Unknown market type: {market_type}")
+
+    latest_bet_times: dict[str, datetime] = {}
+    for question, bet_time in bet_questions_and_times:
+        latest_bet_times[question] = max(
+            latest_bet_times.get(question, bet_time), bet_time
+        )
+    return latest_bet_times
+
+
+def have_bet_on_market_since(
+    keys: APIKeys, market: AgentMarket, since: timedelta
+) -> bool:
+    market_type = (
+        MarketType.MANIFOLD
+        if isinstance(market, ManifoldAgentMarket)
+        else (
+            MarketType.OMEN
             if isinstance(market, OmenAgentMarket)
             else should_not_happen(f"Uknown market: {market}")
         )
     )
-    return market.question in recently_betted_questions
+    return market.question in get_latest_bet_times_by_question(
+        keys, market_type, start_time=utcnow() - since
+    )
+
+
+class RecentBetsIndex(BaseModel):
+    """
+    Questions the user has bet on recently, fetched once and then updated locally as new bets are placed.
+    Useful for checking many markets in a single run, without fetching the bet history for each of them.
+    """
+
+    start_time: datetime
+    latest_bet_times: dict[str, datetime]
+
+    @staticmethod
+    def build(
+        keys: APIKeys, market_type: MarketType, since: timedelta
+    ) -> "RecentBetsIndex":
+        start_time = utcnow() - since
+        return RecentBetsIndex(
+            start_time=start_time,
+            latest_bet_times=get_latest_bet_times_by_question(
+                keys, market_type, start_time=start_time
+            ),
+        )
+
+    def covers(self, since: timedelta) -> bool:
+        return utcnow() - since >= self.start_time
+
+    def have_bet_on_market_since(self, market: AgentMarket, since: timedelta) -> bool:
+        if not self.covers(since):
+            raise ValueError(
+                f"Index contains only bets since {self.start_time}, can not be asked for {since=}."
+            )
+        latest_bet_time = self.latest_bet_times.get(market.question)
+        return latest_bet_time is not None and latest_bet_time >= utcnow() - since
+
+    def add_bet(self, market: AgentMarket) -> None:
+        self.latest_bet_times[market.question] = utcnow()
@@ -9,6 +9,10 @@ from prediction_market_agent_tooling.markets.metaculus.data_models import (
     MetaculusQuestion,
     MetaculusQuestions,
 )
+from prediction_market_agent_tooling.tools.async_http import (
+    AsyncHTTPClient,
+    run_with_async_client,
+)
 from prediction_market_agent_tooling.tools.utils import response_to_model
 
 METACULUS_API_BASE_URL = "https://www.metaculus.com/api2"
@@ -67,6 +71,31 @@ def get_questions(
     tournament_id: int | None = None,
     created_after: datetime | None = None,
     status: str | None = None,
+) -> list[MetaculusQuestion]:
+    """
+    List detailed metaculus questions (i.e. markets)
+    """
+    return run_with_async_client(
+        lambda client: get_questions_async(
+            client,
+            limit=limit,
+            order_by=order_by,
+            offset=offset,
+            tournament_id=tournament_id,
+            created_after=created_after,
+            status=status,
+        )
+    )
+
+
+async def get_questions_async(
+    client: AsyncHTTPClient,
+    limit: int,
+    order_by: str | None = None,
+    offset: int = 0,
+    tournament_id: int | None = None,
+    created_after: datetime | None = None,
+    status: str | None = None,
 ) -> list[MetaculusQuestion]:
     """
     List detailed metaculus questions (i.e. markets)
@@ -90,6 +119,6 @@ def get_questions(
 
     url = f"{METACULUS_API_BASE_URL}/questions/"
     return response_to_model(
-        response=requests.get(url, headers=get_auth_headers(), params=url_params),
+        response=await client.get(url, headers=get_auth_headers(), params=url_params),
         model=MetaculusQuestions,
     ).results
@@ -41,6 +41,9 @@ OMEN_BASE_URL = "https://aiomen.eth.limo"
 PRESAGIO_BASE_URL = "https://presagio.pages.dev"
 TEST_CATEGORY = "test"  # This category is hidden on Presagio for testing purposes.
 
+# Projections of the markets fetched from the subgraph, see `OmenMarketListing`, `OmenMarketTrading` and `OmenMarket`.
+MarketFields = t.Literal["listing", "trading", "full"]
+
 
 def get_boolean_outcome(outcome_str: str) -> bool:
     if outcome_str == OMEN_TRUE_OUTCOME:
@@ -63,14 +66,21 @@ class Condition(BaseModel):
         return [i + 1 for i in range(self.outcomeSlotCount)]
 
 
-class Question(BaseModel):
+class QuestionOpening(BaseModel):
+    """
+    Projection of `Question` used by `OmenMarketListing`.
+    """
+
+    openingTimestamp: int
+
+
+class Question(QuestionOpening):
     id: HexBytes
     title: str
     data: str
     templateId: int
     outcomes: list[str]
     isPendingArbitration: bool
-    openingTimestamp: int
     answerFinalizedTimestamp: t.Optional[datetime] = None
     currentAnswer: t.Optional[str] = None
 
@@ -172,44 +182,24 @@ class OmenUserPosition(BaseModel):
         return self.totalBalance > 0
 
 
-class OmenMarket(BaseModel):
+class OmenMarketListing(BaseModel):
     """
-    https://presagio.pages.dev
-
-    An Omen market goes through the following stages:
-
-    1. creation - can add liquidty immediately, and trade immediately if there is liquidity
-    2. closing - market is closed, and a question is simultaneously opened for answers on Reality
-    3. finalizing - the question is finalized on reality (including any disputes)
-    4. resolving - a manual step required by calling the Omen oracle contract
-    5. redeeming - a user withdraws collateral tokens from the market
+    Projection of `OmenMarket` with just enough data to list and pre-filter markets (`fields="listing"` in `OmenSubgraphHandler`).
+    Use `OmenSubgraphHandler.get_full_markets` to upgrade the selected ones to `OmenMarket`.
     """
 
-    BET_AMOUNT_CURRENCY: t.ClassVar[Currency] = Currency.xDai
-
     id: HexAddress
     title: str
-    creator: HexAddress
-    category: str
-    collateralVolume: Wei
     # Note: there are two similar parameters relating to liquidity:
     # liquidityParameter and liquidityMeasure. The former appears to match most
     # closely with the liquidity returned when calling the contract directly
     # (see OmenAgentMarket.get_liquidity). So we can use it e.g. for filtering
     # markets, but until better understood, please call the contract directly.
     liquidityParameter: Wei
-    usdVolume: USD
-    collateralToken: HexAddress
     outcomes: list[str]
     outcomeTokenAmounts: list[OmenOutcomeToken]
-    outcomeTokenMarginalPrices: t.Optional[list[xDai]]
-    fee: t.Optional[Wei]
-    resolutionTimestamp: t.Optional[int] = None
-    answerFinalizedTimestamp: t.Optional[int] = None
-    currentAnswer: t.Optional[HexBytes] = None
     creationTimestamp: int
-    condition: Condition
-    question: Question
+    question: QuestionOpening
 
     @property
     def openingTimestamp(self) -> int:
@@ -227,6 +217,52 @@ class OmenMarket(BaseModel):
         # however, market is usually "closed" even sooner by removing all the liquidity.
         return self.opening_datetime
 
+    @property
+    def question_title(self) -> str:
+        return self.title
+
+    @property
+    def creation_datetime(self) -> datetime:
+        return datetime.fromtimestamp(self.creationTimestamp)
+
+    @property
+    def market_maker_contract_address(self) -> HexAddress:
+        return self.id
+
+    @property
+    def market_maker_contract_address_checksummed(self) -> ChecksumAddress:
+        return Web3.to_checksum_address(self.market_maker_contract_address)
+
+    @property
+    def yes_index(self) -> int:
+        return self.outcomes.index(OMEN_TRUE_OUTCOME)
+
+    @property
+    def no_index(self) -> int:
+        return self.outcomes.index(OMEN_FALSE_OUTCOME)
+
+    @property
+    def is_binary(self) -> bool:
+        return len(self.outcomes) == 2
+
+    @property
+    def url(self) -> str:
+        return f"{PRESAGIO_BASE_URL}/markets?id={self.id}"
+
+
+class OmenMarketTrading(OmenMarketListing):
+    """
+    Projection of `OmenMarket` with the data needed to price, bet on and resolve the market (`fields="trading"` in `OmenSubgraphHandler`).
+    """
+
+    collateralToken: HexAddress
+    outcomeTokenMarginalPrices: t.Optional[list[xDai]]
+    fee: t.Optional[Wei]
+    resolutionTimestamp: t.Optional[int] = None
+    answerFinalizedTimestamp: t.Optional[int] = None
+    currentAnswer: t.Optional[HexBytes] = None
+    condition: Condition
+
     @property
     def answer_index(self) -> t.Optional[int]:
         return self.currentAnswer.as_int() if self.currentAnswer else None
@@ -252,14 +288,6 @@ class OmenMarket(BaseModel):
     def is_resolved_with_valid_answer(self) -> bool:
         return self.is_resolved and self.has_valid_answer
 
-    @property
-    def question_title(self) -> str:
-        return self.title
-
-    @property
-    def creation_datetime(self) -> datetime:
-        return datetime.fromtimestamp(self.creationTimestamp)
-
     @property
     def finalized_datetime(self) -> datetime | None:
         return (
@@ -272,14 +300,6 @@ class OmenMarket(BaseModel):
     def has_bonded_outcome(self) -> bool:
         return self.finalized_datetime is not None
 
-    @property
-    def market_maker_contract_address(self) -> HexAddress:
-        return self.id
-
-    @property
-    def market_maker_contract_address_checksummed(self) -> ChecksumAddress:
-        return Web3.to_checksum_address(self.market_maker_contract_address)
-
     @property
     def collateral_token_contract_address(self) -> HexAddress:
         return self.collateralToken
@@ -296,14 +316,6 @@ class OmenMarket(BaseModel):
             else None
         )
 
-    @property
-    def yes_index(self) -> int:
-        return self.outcomes.index(OMEN_TRUE_OUTCOME)
-
-    @property
-    def no_index(self) -> int:
-        return self.outcomes.index(OMEN_FALSE_OUTCOME)
-
     @property
     def current_p_no(self) -> Probability:
         return Probability(1 - self.current_p_yes)
@@ -346,13 +358,6 @@ class OmenMarket(BaseModel):
             1 - self.outcomeTokenAmounts[self.yes_index] / sum(self.outcomeTokenAmounts)
         )
 
-    def __repr__(self) -> str:
-        return f"Omen's market: {self.title}"
-
-    @property
-    def is_binary(self) -> bool:
-        return len(self.outcomes) == 2
-
     @property
     def boolean_outcome(self) -> bool:
         if not self.is_binary:
@@ -373,9 +378,30 @@ class OmenMarket(BaseModel):
         else:
             return Resolution.NO
 
-    @property
-    def url(self) -> str:
-        return f"{PRESAGIO_BASE_URL}/markets?id={self.id}"
+
+class OmenMarket(OmenMarketTrading):
+    """
+    https://presagio.pages.dev
+
+    An Omen market goes through the following stages:
+
+    1. creation - can add liquidty immediately, and trade immediately if there is liquidity
+    2. closing - market is closed, and a question is simultaneously opened for answers on Reality
+    3. finalizing - the question is finalized on reality (including any disputes)
+    4. resolving - a manual step required by calling the Omen oracle contract
+    5. redeeming - a user withdraws collateral tokens from the market
+    """
+
+    BET_AMOUNT_CURRENCY: t.ClassVar[Currency] = Currency.xDai
+
+    creator: HexAddress
+    category: str
+    collateralVolume: Wei
+    usdVolume: USD
+    question: Question
+
+    def __repr__(self) -> str:
+        return f"Omen's market: {self.title}"
 
     @staticmethod
     def from_created_market(model: "CreatedMarket") -> "OmenMarket":
@@ -63,6 +63,7 @@ from prediction_market_agent_tooling.tools.balances import get_balances
 from prediction_market_agent_tooling.tools.contract import (
     ContractDepositableWrapperERC20BaseClass,
     ContractERC4626BaseClass,
+    TransactionsPipeline,
     auto_deposit_collateral_token,
     init_collateral_token_contract,
     to_gnosis_chain_contract,
@@ -114,6 +115,30 @@ class OmenAgentMarket(AgentMarket):
     def no_index(self) -> int:
         return self.outcomes.index(OMEN_FALSE_OUTCOME)
 
+    @classmethod
+    def prefetch_p_yes_histories(cls, markets: t.Sequence["AgentMarket"]) -> None:
+        """
+        Fills the p_yes history cache of all the given markets, using only a few subgraph queries.
+        """
+        omen_markets = [
+            m
+            for m in markets
+            if isinstance(m, OmenAgentMarket) and m._binary_market_p_yes_history is None
+        ]
+        trades_by_market = OmenSubgraphHandler().get_trades_for_markets(
+            [HexAddress(HexStr(m.id)) for m in omen_markets]
+        )
+        for market in omen_markets:
+            market._binary_market_p_yes_history = p_yes_history_from_trades(
+                market,
+                [
+                    trade
+                    for trade in trades_by_market[HexAddress(HexStr(market.id.lower()))]
+                    # Same as `end_time` in `get_binary_market_p_yes_history`.
+                    if trade.creation_datetime <= market.close_time
+                ],
+            )
+
     def get_p_yes_history_cached(self) -> list[Probability]:
         if self._binary_market_p_yes_history is None:
             self._binary_market_p_yes_history = get_binary_market_p_yes_history(self)
@@ -696,20 +721,21 @@ def omen_buy_outcome_tx(
     )
     # Allow 1% slippage.
     expected_shares = remove_fraction(expected_shares, 0.01)
-    # Approve the market maker to withdraw our collateral token.
-    collateral_token_contract.approve(
-        api_keys=api_keys,
-        for_address=market_contract.address,
-        amount_wei=amount_wei_to_buy,
-        web3=web3,
-    )
-
-    if auto_deposit:
-        # In auto-depositing, we need to deposit the original `amount_wei`, e.g. we can deposit 2 xDai, but receive 1.8 sDai, so for the bet we will use `amount_wei_to_buy`.
-        auto_deposit_collateral_token(
-            collateral_token_contract, amount_wei, api_keys, web3
+    # Approval doesn't depend on the deposit, so don't wait for it to be mined before depositing.
+    with TransactionsPipeline(api_keys, web3 or market_contract.get_web3()) as pipeline:
+        # Approve the market maker to withdraw our collateral token.
+        pipeline.send(
+            collateral_token_contract,
+            "approve",
+            [market_contract.address, amount_wei_to_buy],
         )
 
+        if auto_deposit:
+            # In auto-depositing, we need to deposit the original `amount_wei`, e.g. we can deposit 2 xDai, but receive 1.8 sDai, so for the bet we will use `amount_wei_to_buy`.
+            auto_deposit_collateral_token(
+                collateral_token_contract, amount_wei, api_keys, web3
+            )
+
     # Buy shares using the deposited xDai in the collateral token.
     tx_receipt = market_contract.buy(
         api_keys=api_keys,
@@ -1142,44 +1168,67 @@ def redeem_from_all_user_positions(
         total_balance_bigger_than=wei_type(0),
     )
 
-    for index, user_position in enumerate(user_positions):
-        condition_id = user_position.position.condition_id
+    # Check the resolution of all the conditions at once, instead of one call per position.
+    conditions_resolved = conditional_token_contract.are_conditions_resolved(
+        [user_position.position.condition_id for user_position in user_positions],
+        web3=web3,
+    )
 
-        if not conditional_token_contract.is_condition_resolved(condition_id):
+    positions_to_redeem = []
+    for index, (user_position, condition_resolved) in enumerate(
+        zip(user_positions, conditions_resolved)
+    ):
+        if not condition_resolved:
             logger.info(
                 f"[{index+1} / {len(user_positions)}] Skipping redeem, {user_position.id=} isn't resolved yet."
             )
             continue
 
         logger.info(
-            f"[{index+1} / {len(user_positions)}] Processing redeem from {user_position.id=}."
+            f"[{index+1} / {len(user_positions)}] Going to redeem from {user_position.id=}."
         )
+        positions_to_redeem.append(user_position)
 
-        original_balances = get_balances(public_key, web3)
-        conditional_token_contract.redeemPositions(
-            api_keys=api_keys,
-            collateral_token_address=user_position.position.collateral_token_contract_address_checksummed,
-            condition_id=condition_id,
-            index_sets=user_position.position.indexSets,
-            web3=web3,
-        )
-        new_balances = get_balances(public_key, web3)
+    if not positions_to_redeem:
+        return
 
-        logger.info(
-            f"Redeemed {new_balances.wxdai - original_balances.wxdai} wxDai from position {user_position.id=}."
-        )
+    original_balances = get_balances(public_key, web3)
+    # Redeem all at once, in MultiSend transactions if Safe is used, otherwise as transactions sent back-to-back.
+    conditional_token_contract.redeem_many_positions(
+        api_keys=api_keys,
+        positions=[
+            (
+                user_position.position.collateral_token_contract_address_checksummed,
+                user_position.position.condition_id,
+                user_position.position.indexSets,
+            )
+            for user_position in positions_to_redeem
+        ],
+        web3=web3,
+    )
+    new_balances = get_balances(public_key, web3)
+
+    logger.info(
+        f"Redeemed {new_balances.wxdai - original_balances.wxdai} wxDai from {len(positions_to_redeem)} positions."
+    )
 
 
 def get_binary_market_p_yes_history(market: OmenAgentMarket) -> list[Probability]:
-    history: list[Probability] = []
-    trades = sorted(
+    return p_yes_history_from_trades(
+        market,
         OmenSubgraphHandler().get_trades(  # We need to look at price both after buying or selling, so get trades, not bets.
             market_id=market.market_maker_contract_address_checksummed,
             end_time=market.close_time,  # Even after market is closed, there can be many `Sell` trades which will converge the probability to the true one.
         ),
-        key=lambda x: x.creation_datetime,
     )
 
+
+def p_yes_history_from_trades(
+    market: OmenAgentMarket, trades: list[OmenBet]
+) -> list[Probability]:
+    history: list[Probability] = []
+    trades = sorted(trades, key=lambda x: x.creation_datetime)
+
     for index, trade in enumerate(trades):
         # We need to append the old probability to have also the initial state of the market (before any bet placement).
         history.append(
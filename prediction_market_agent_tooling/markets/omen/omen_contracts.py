@@ -78,15 +78,32 @@ class OmenOracleContract(ContractOnGnosisChain):
         return self.send(
             api_keys=api_keys,
             function_name="resolve",
-            function_params=dict(
-                questionId=question_id,
-                templateId=template_id,
-                question=question_raw,
-                numOutcomes=n_outcomes,
+            function_params=self.resolve_params(
+                question_id=question_id,
+                template_id=template_id,
+                question_raw=question_raw,
+                n_outcomes=n_outcomes,
             ),
             web3=web3,
         )
 
+    @staticmethod
+    def resolve_params(
+        question_id: HexBytes,
+        template_id: int,
+        question_raw: str,
+        n_outcomes: int,
+    ) -> dict[str, t.Any]:
+        """
+        Function parameters for `resolve`, also usable with `try_send_many`.
+        """
+        return dict(
+            questionId=question_id,
+            templateId=template_id,
+            question=question_raw,
+            numOutcomes=n_outcomes,
+        )
+
 
 def build_parent_collection_id() -> HexStr:
     return HASH_ZERO  # Taken from Olas
@@ -201,6 +218,33 @@ class OmenConditionalTokenContract(ContractOnGnosisChain):
             web3=web3,
         )
 
+    def redeem_many_positions(
+        self,
+        api_keys: APIKeys,
+        positions: list[tuple[HexAddress, HexBytes, t.List[int]]],
+        parent_collection_id: HexStr = build_parent_collection_id(),
+        web3: Web3 | None = None,
+    ) -> list[TxReceipt]:
+        """
+        Same as `redeemPositions`, but for many (collateral token address, condition id, index sets) positions at once.
+        """
+        return self.send_many(
+            api_keys=api_keys,
+            calls=[
+                (
+                    "redeemPositions",
+                    [
+                        collateral_token_address,
+                        parent_collection_id,
+                        condition_id,
+                        index_sets,
+                    ],
+                )
+                for collateral_token_address, condition_id, index_sets in positions
+            ],
+            web3=web3,
+        )
+
     def getOutcomeSlotCount(
         self, condition_id: HexBytes, web3: Web3 | None = None
     ) -> int:
@@ -220,6 +264,19 @@ class OmenConditionalTokenContract(ContractOnGnosisChain):
         payout_for_condition = self.payoutDenominator(condition_id, web3=web3)
         return payout_for_condition > 0
 
+    def are_conditions_resolved(
+        self, condition_ids: list[HexBytes], web3: Web3 | None = None
+    ) -> list[bool]:
+        """
+        Same as `is_condition_resolved`, but for many conditions at once, using a single batch of calls.
+        """
+        with self.batch(web3=web3) as batch:
+            payouts = [
+                self.call_batched(batch, "payoutDenominator", [condition_id])
+                for condition_id in condition_ids
+            ]
+        return [payout.result() > 0 for payout in payouts]
+
     def payoutDenominator(
         self, condition_id: HexBytes, web3: Web3 | None = None
     ) -> int:
@@ -611,15 +668,10 @@ class OmenRealitioContract(ContractOnGnosisChain):
         max_previous: Wei | None = None,
         web3: Web3 | None = None,
     ) -> TxReceipt:
-        if max_previous is None:
-            # If not provided, defaults to 0, which means no checking,
-            # same as on Omen website: https://github.com/protofire/omen-exchange/blob/763d9c9d05ebf9edacbc1dbaa561aa5d08813c0f/app/src/services/realitio.ts#L363.
-            max_previous = Wei(0)
-
         return self.send_with_value(
             api_keys=api_keys,
             function_name="submitAnswer",
-            function_params=dict(
+            function_params=self.submit_answer_params(
                 question_id=question_id,
                 answer=answer,
                 max_previous=max_previous,
@@ -628,6 +680,26 @@ class OmenRealitioContract(ContractOnGnosisChain):
             web3=web3,
         )
 
+    @staticmethod
+    def submit_answer_params(
+        question_id: HexBytes,
+        answer: HexBytes,
+        max_previous: Wei | None = None,
+    ) -> dict[str, t.Any]:
+        """
+        Function parameters for `submitAnswer`, also usable with `try_send_many` (the bond is sent as the value).
+        """
+        if max_previous is None:
+            # If not provided, defaults to 0, which means no checking,
+            # same as on Omen website: https://github.com/protofire/omen-exchange/blob/763d9c9d05ebf9edacbc1dbaa561aa5d08813c0f/app/src/services/realitio.ts#L363.
+            max_previous = Wei(0)
+
+        return dict(
+            question_id=question_id,
+            answer=answer,
+            max_previous=max_previous,
+        )
+
     def submit_answer(
         self,
         api_keys: APIKeys,
@@ -638,21 +710,23 @@ class OmenRealitioContract(ContractOnGnosisChain):
         max_previous: Wei | None = None,
         web3: Web3 | None = None,
     ) -> TxReceipt:
-        # Normalise the answer to lowercase, to match Enum values as [YES, NO] against outcomes as ["Yes", "No"].
-        answer = answer.lower()
-        outcomes = [o.lower() for o in outcomes]
-
         return self.submitAnswer(
             api_keys=api_keys,
             question_id=question_id,
-            answer=int_to_hexbytes(
-                outcomes.index(answer)
-            ),  # Contract's method expects answer index in bytes.
+            answer=self.encode_answer(answer, outcomes),
             bond=bond,
             max_previous=max_previous,
             web3=web3,
         )
 
+    @staticmethod
+    def encode_answer(answer: str, outcomes: list[str]) -> HexBytes:
+        # Normalise the answer to lowercase, to match Enum values as [YES, NO] against outcomes as ["Yes", "No"].
+        answer = answer.lower()
+        outcomes = [o.lower() for o in outcomes]
+        # Contract's method expects answer index in bytes.
+        return int_to_hexbytes(outcomes.index(answer))
+
     def submit_answer_invalid(
         self,
         api_keys: APIKeys,
@@ -684,10 +758,10 @@ class OmenRealitioContract(ContractOnGnosisChain):
         return self.send(
             api_keys=api_keys,
             function_name="claimWinnings",
-            function_params=dict(
+            function_params=self.claim_winnings_params(
                 question_id=question_id,
                 history_hashes=history_hashes,
-                addrs=addresses,
+                addresses=addresses,
                 bonds=bonds,
                 answers=answers,
             ),
@@ -695,6 +769,25 @@ class OmenRealitioContract(ContractOnGnosisChain):
             web3=web3,
         )
 
+    @staticmethod
+    def claim_winnings_params(
+        question_id: HexBytes,
+        history_hashes: list[HexBytes],
+        addresses: list[ChecksumAddress],
+        bonds: list[Wei],
+        answers: list[HexBytes],
+    ) -> dict[str, t.Any]:
+        """
+        Function parameters for `claimWinnings`, also usable with `try_send_many`.
+        """
+        return dict(
+            question_id=question_id,
+            history_hashes=history_hashes,
+            addrs=addresses,
+            bonds=bonds,
+            answers=answers,
+        )
+
     def balanceOf(
         self,
         from_address: ChecksumAddress,
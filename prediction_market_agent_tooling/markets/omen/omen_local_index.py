@@ -0,0 +1,659 @@
+import threading
+import typing as t
+from datetime import datetime, timedelta
+from itertools import islice
+
+from sqlalchemy import Column
+from sqlmodel import JSON, Field, Session, SQLModel, col, create_engine, select
+
+from prediction_market_agent_tooling.gtypes import (
+    ChecksumAddress,
+    HexAddress,
+    HexBytes,
+    Wei,
+)
+from prediction_market_agent_tooling.loggers import logger
+from prediction_market_agent_tooling.markets.agent_market import SortBy
+from prediction_market_agent_tooling.markets.omen.data_models import (
+    INVALID_ANSWER,
+    OMEN_BINARY_MARKET_OUTCOMES,
+    OmenBet,
+    OmenMarket,
+    RealityQuestion,
+)
+from prediction_market_agent_tooling.tools.utils import (
+    convert_to_utc_datetime,
+    to_int_timestamp,
+    utcnow,
+)
+from prediction_market_agent_tooling.tools.validation import validate_models
+from prediction_market_agent_tooling.tools.web3_utils import ZERO_BYTES
+
+REFRESH_CHUNK_SIZE = 1000
+# Sync states of the refreshes of the markets, each continues from the last change of its kind.
+MARKETS_RESOLUTION_SYNC_ENTITY = "omen_index_market_resolution"
+MARKETS_LIQUIDITY_SYNC_ENTITY = "omen_index_market_liquidity"
+MARKETS_ANSWERS_SYNC_ENTITY = "omen_index_market_answers"
+# Trades are stored in chunks as they are fetched, so the whole history isn't kept in memory during the first sync.
+TRADES_SYNC_CHUNK_SIZE = 1000
+
+
+def is_indexable_market_item(item: dict[str, t.Any]) -> bool:
+    # Same as the `title_not` and `question_not` filters used when the markets are synced.
+    return item.get("title") is not None and item.get("question") is not None
+
+
+class OmenIndexedMarket(SQLModel, table=True):
+    __tablename__ = "omen_index_market"
+    __table_args__ = {"extend_existing": True}
+    id: str = Field(primary_key=True)
+    creator: str = Field(index=True)
+    condition_id: str = Field(index=True)
+    creation_timestamp: int = Field(index=True)
+    opening_timestamp: int = Field(index=True)
+    resolution_timestamp: int | None = Field(None, index=True)
+    # Raw item as returned from the subgraph, validated into `OmenMarket` when read.
+    payload: dict[str, t.Any] = Field(sa_column=Column(JSON, nullable=False))
+
+    @staticmethod
+    def from_subgraph_item(item: dict[str, t.Any]) -> "OmenIndexedMarket":
+        return OmenIndexedMarket(
+            id=item["id"],
+            creator=item["creator"],
+            condition_id=item["condition"]["id"],
+            creation_timestamp=int(item["creationTimestamp"]),
+            opening_timestamp=int(item["question"]["openingTimestamp"]),
+            resolution_timestamp=(
+                int(item["resolutionTimestamp"])
+                if item["resolutionTimestamp"] is not None
+                else None
+            ),
+            payload=item,
+        )
+
+
+class OmenIndexedTrade(SQLModel, table=True):
+    __tablename__ = "omen_index_trade"
+    __table_args__ = {"extend_existing": True}
+    id: str = Field(primary_key=True)
+    creator: str = Field(index=True)
+    market_id: str = Field(index=True)
+    creation_timestamp: int = Field(index=True)
+    type: str
+    # Raw item as returned from the subgraph, without the market, which is joined from the markets table when read.
+    payload: dict[str, t.Any] = Field(sa_column=Column(JSON, nullable=False))
+
+    @staticmethod
+    def from_subgraph_item(item: dict[str, t.Any]) -> "OmenIndexedTrade":
+        return OmenIndexedTrade(
+            id=item["id"],
+            creator=item["creator"]["id"],
+            market_id=item["fpmm"]["id"],
+            creation_timestamp=int(item["creationTimestamp"]),
+            type=item["type"],
+            payload={k: v for k, v in item.items() if k != "fpmm"},
+        )
+
+
+class OmenIndexedRealityQuestion(SQLModel, table=True):
+    __tablename__ = "omen_index_reality_question"
+    __table_args__ = {"extend_existing": True}
+    id: str = Field(primary_key=True)
+    question_id: str = Field(index=True)
+    user: str = Field(index=True)
+    updated_timestamp: int = Field(index=True)
+    answer_finalized_timestamp: int | None = Field(None, index=True)
+    history_hash: str | None
+    payload: dict[str, t.Any] = Field(sa_column=Column(JSON, nullable=False))
+
+    @staticmethod
+    def from_subgraph_item(item: dict[str, t.Any]) -> "OmenIndexedRealityQuestion":
+        return OmenIndexedRealityQuestion(
+            id=item["id"],
+            question_id=item["questionId"],
+            user=item["user"],
+            updated_timestamp=int(item["updatedTimestamp"]),
+            answer_finalized_timestamp=(
+                int(item["answerFinalizedTimestamp"])
+                if item["answerFinalizedTimestamp"] is not None
+                else None
+            ),
+            history_hash=item["historyHash"],
+            payload=item,
+        )
+
+
+class OmenIndexSyncState(SQLModel, table=True):
+    __tablename__ = "omen_index_sync_state"
+    __table_args__ = {"extend_existing": True}
+    entity: str = Field(primary_key=True)
+    # Highest creation (or update) timestamp seen so far, next sync continues from it.
+    last_timestamp: int
+    synced_at: datetime
+
+
+class OmenIndexSource(t.Protocol):
+    """
+    Where the raw subgraph items come from, implemented by `OmenSubgraphHandler`.
+    """
+
+    def iter_raw_markets_created_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        ...
+
+    def iter_raw_markets_by_id(self, ids: list[str]) -> t.Iterator[dict[str, t.Any]]:
+        ...
+
+    def iter_raw_trades_created_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        ...
+
+    def iter_raw_reality_questions_updated_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        ...
+
+    def iter_raw_markets_resolved_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        ...
+
+    def iter_raw_markets_by_question_id(
+        self, question_ids: list[str]
+    ) -> t.Iterator[dict[str, t.Any]]:
+        ...
+
+    def iter_raw_liquidity_changes_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        ...
+
+
+class OmenLocalIndex:
+    """
+    Local mirror of Omen markets, trades and Reality questions, synced incrementally from the subgraphs.
+
+    Mutable state of markets is refreshed on every sync only for the markets that could have changed since the last sync:
+    markets that had a trade, whose liquidity was added or removed, whose Reality question was updated (e.g. answered), or that were resolved.
+    """
+
+    def __init__(
+        self,
+        sqlalchemy_db_url: str = "sqlite:///omen_local_index.db",
+        max_staleness: timedelta = timedelta(minutes=1),
+    ) -> None:
+        self.max_staleness = max_staleness
+        self.engine = create_engine(
+            sqlalchemy_db_url, connect_args={"check_same_thread": False}
+        )
+        self._sync_lock = threading.Lock()
+        self._initialize_db()
+
+    def _initialize_db(self) -> None:
+        """
+        Creates the tables if they don't exist
+        """
+        logger.debug(
+            f"tables being added {OmenIndexedMarket}, {OmenIndexedTrade}, {OmenIndexedRealityQuestion}, {OmenIndexSyncState}"
+        )
+        SQLModel.metadata.create_all(self.engine)
+
+    def last_synced_at(self) -> datetime | None:
+        with Session(self.engine) as session:
+            states = session.exec(select(OmenIndexSyncState)).all()
+        return min((s.synced_at for s in states), default=None)
+
+    def is_stale(self) -> bool:
+        last_synced_at = self.last_synced_at()
+        return (
+            last_synced_at is None
+            # SQLite doesn't keep the timezone, but it's always stored in UTC.
+            or utcnow() - convert_to_utc_datetime(last_synced_at) > self.max_staleness
+        )
+
+    def sync_if_stale(self, source: OmenIndexSource) -> bool:
+        """
+        Syncs the index if it's older than `max_staleness`, returns whether the index can be used.
+
+        The first sync goes through the whole history, which takes long, so it isn't done here (e.g. in the middle of some query),
+        it needs to be run explicitly with `sync`, e.g. `OmenLocalIndex(db_url).sync(OmenSubgraphHandler())`.
+        """
+        if self.last_synced_at() is None:
+            return False
+        if self.is_stale():
+            with self._sync_lock:
+                # Concurrent callers wait for the first one's sync, instead of running their own right after it.
+                if self.is_stale():
+                    self._sync(source)
+        return True
+
+    def sync(self, source: OmenIndexSource) -> None:
+        with self._sync_lock:
+            self._sync(source)
+
+    def _sync(self, source: OmenIndexSource) -> None:
+        self._sync_markets(source)
+        self._sync_trades(source)
+        self._sync_reality_questions(source)
+
+    def _sync_markets(self, source: OmenIndexSource) -> None:
+        last_timestamp = self._get_last_timestamp(OmenIndexedMarket.__tablename__)
+        n_new = self._upsert(
+            OmenIndexedMarket,
+            source.iter_raw_markets_created_since(last_timestamp),
+            OmenIndexedMarket.__tablename__,
+            lambda m: m.creation_timestamp,
+        )
+
+        n_resolved = self._upsert(
+            OmenIndexedMarket,
+            source.iter_raw_markets_resolved_since(
+                self._get_refresh_timestamp(MARKETS_RESOLUTION_SYNC_ENTITY)
+            ),
+            MARKETS_RESOLUTION_SYNC_ENTITY,
+            lambda m: m.resolution_timestamp or 0,
+        )
+
+        liquidity_changes = list(
+            source.iter_raw_liquidity_changes_since(
+                self._get_refresh_timestamp(MARKETS_LIQUIDITY_SYNC_ENTITY)
+            )
+        )
+        with Session(self.engine) as session:
+            # Markets that aren't indexed (e.g. without question) can't be stored.
+            ids_to_refresh = session.exec(
+                select(OmenIndexedMarket.id).where(
+                    col(OmenIndexedMarket.id).in_(
+                        {change["fpmm"]["id"] for change in liquidity_changes}
+                    )
+                )
+            ).all()
+        for i in range(0, len(ids_to_refresh), REFRESH_CHUNK_SIZE):
+            self._upsert(
+                OmenIndexedMarket,
+                source.iter_raw_markets_by_id(
+                    list(ids_to_refresh[i : i + REFRESH_CHUNK_SIZE])
+                ),
+            )
+        with Session(self.engine) as session:
+            self._save_sync_state(
+                session,
+                MARKETS_LIQUIDITY_SYNC_ENTITY,
+                max(
+                    (int(change["creationTimestamp"]) for change in liquidity_changes),
+                    default=None,
+                ),
+            )
+            session.commit()
+
+        logger.info(
+            f"Synced {n_new} new, {n_resolved} resolved and {len(ids_to_refresh)} Omen markets with changed liquidity."
+        )
+
+    def _sync_trades(self, source: OmenIndexSource) -> None:
+        entity = OmenIndexedTrade.__tablename__
+        trades = source.iter_raw_trades_created_since(self._get_last_timestamp(entity))
+        n_new = 0
+        last_timestamp: int | None = None
+        while chunk := list(islice(trades, TRADES_SYNC_CHUNK_SIZE)):
+            last_timestamp = max(
+                [last_timestamp or 0]
+                + [int(trade["creationTimestamp"]) for trade in chunk]
+            )
+            # Skip the same markets as `iter_raw_markets_created_since` does, they can't be stored nor validated.
+            chunk = [
+                trade for trade in chunk if is_indexable_market_item(trade["fpmm"])
+            ]
+            # Trades come with the current state of their market, so use it to keep the markets up to date as well.
+            self._upsert(
+                OmenIndexedMarket,
+                {trade["fpmm"]["id"]: trade["fpmm"] for trade in chunk}.values(),
+            )
+            n_new += self._upsert(OmenIndexedTrade, chunk)
+        # Trades aren't ordered by time, so the progress is saved only once all of them are stored.
+        with Session(self.engine) as session:
+            self._save_sync_state(session, entity, last_timestamp)
+            session.commit()
+        logger.info(f"Synced {n_new} Omen trades.")
+
+    def _sync_reality_questions(self, source: OmenIndexSource) -> None:
+        last_timestamp = self._get_last_timestamp(
+            OmenIndexedRealityQuestion.__tablename__
+        )
+        n_new = self._upsert(
+            OmenIndexedRealityQuestion,
+            source.iter_raw_reality_questions_updated_since(last_timestamp),
+            OmenIndexedRealityQuestion.__tablename__,
+            lambda q: q.updated_timestamp,
+        )
+
+        # Markets keep a copy of their question's answer, so refresh the ones whose question was updated.
+        # It's done from the stored questions, so nothing is missed if the sync is interrupted in between.
+        refresh_since = self._get_refresh_timestamp(MARKETS_ANSWERS_SYNC_ENTITY)
+        with Session(self.engine) as session:
+            updated_questions = session.exec(
+                select(
+                    OmenIndexedRealityQuestion.question_id,
+                    OmenIndexedRealityQuestion.updated_timestamp,
+                ).where(OmenIndexedRealityQuestion.updated_timestamp >= refresh_since)
+            ).all()
+        question_ids = list({question_id for question_id, _ in updated_questions})
+        for i in range(0, len(question_ids), REFRESH_CHUNK_SIZE):
+            self._upsert(
+                OmenIndexedMarket,
+                source.iter_raw_markets_by_question_id(
+                    question_ids[i : i + REFRESH_CHUNK_SIZE]
+                ),
+            )
+        with Session(self.engine) as session:
+            self._save_sync_state(
+                session,
+                MARKETS_ANSWERS_SYNC_ENTITY,
+                max((timestamp for _, timestamp in updated_questions), default=None),
+            )
+            session.commit()
+
+        logger.info(
+            f"Synced {n_new} Reality questions, refreshed markets of {len(question_ids)} of them."
+        )
+
+    _IndexedT = t.TypeVar(
+        "_IndexedT", OmenIndexedMarket, OmenIndexedTrade, OmenIndexedRealityQuestion
+    )
+
+    def _upsert(
+        self,
+        model: t.Type[_IndexedT],
+        items: t.Iterable[dict[str, t.Any]],
+        sync_state_entity: str | None = None,
+        get_timestamp: t.Callable[[_IndexedT], int] | None = None,
+    ) -> int:
+        n_items = 0
+        last_timestamp: int | None = None
+        with Session(self.engine) as session:
+            for item in items:
+                row = model.from_subgraph_item(item)
+                session.merge(row)
+                n_items += 1
+                if get_timestamp is not None:
+                    last_timestamp = max(last_timestamp or 0, get_timestamp(row))
+            if sync_state_entity is not None:
+                self._save_sync_state(session, sync_state_entity, last_timestamp)
+            session.commit()
+        return n_items
+
+    def _save_sync_state(
+        self, session: Session, entity: str, last_timestamp: int | None
+    ) -> None:
+        state = session.get(OmenIndexSyncState, entity)
+        session.merge(
+            OmenIndexSyncState(
+                entity=entity,
+                # Keep the same timestamp if nothing new came, next sync is inclusive, so nothing created in the same second is missed.
+                last_timestamp=(
+                    last_timestamp
+                    if last_timestamp is not None
+                    else (state.last_timestamp if state else 0)
+                ),
+                synced_at=utcnow(),
+            )
+        )
+
+    def _get_last_timestamp(self, entity: str) -> int:
+        with Session(self.engine) as session:
+            state = session.get(OmenIndexSyncState, entity)
+        return state.last_timestamp if state else 0
+
+    def _get_refresh_timestamp(self, entity: str) -> int:
+        """
+        Where the refresh of the markets continues from.
+        On the first sync, all the markets were just fetched with their current state, so only changes since the newest of them are needed.
+        """
+        with Session(self.engine) as session:
+            state = session.get(OmenIndexSyncState, entity)
+        return (
+            state.last_timestamp
+            if state
+            else self._get_last_timestamp(OmenIndexedMarket.__tablename__)
+        )
+
+    def get_markets(
+        self,
+        limit: t.Optional[int],
+        created_after: t.Optional[datetime] = None,
+        opened_before: t.Optional[datetime] = None,
+        opened_after: t.Optional[datetime] = None,
+        finalized_before: t.Optional[datetime] = None,
+        finalized_after: t.Optional[datetime] = None,
+        finalized: bool | None = None,
+        resolved: bool | None = None,
+        creator: t.Optional[HexAddress] = None,
+        creator_in: t.Optional[t.Sequence[HexAddress]] = None,
+        liquidity_bigger_than: Wei | None = None,
+        condition_id_in: list[HexBytes] | None = None,
+        id_in: list[str] | None = None,
+        excluded_questions: set[str] | None = None,
+        sort_by: SortBy = SortBy.NONE,
+        outcomes: list[str] = OMEN_BINARY_MARKET_OUTCOMES,
+        collateral_token_address_in: tuple[ChecksumAddress, ...] | None = None,
+        category: str | None = None,
+    ) -> list[OmenMarket]:
+        """
+        Same filters as `OmenSubgraphHandler.get_omen_binary_markets`, indexed columns are filtered in the database, rest in Python.
+        """
+        query = select(OmenIndexedMarket)
+        if creator is not None:
+            query = query.where(OmenIndexedMarket.creator == creator.lower())
+        if creator_in is not None:
+            query = query.where(
+                col(OmenIndexedMarket.creator).in_([x.lower() for x in creator_in])
+            )
+        if id_in is not None:
+            query = query.where(col(OmenIndexedMarket.id).in_(id_in))
+        if condition_id_in is not None:
+            query = query.where(
+                col(OmenIndexedMarket.condition_id).in_(
+                    [x.hex() for x in condition_id_in]
+                )
+            )
+        if created_after is not None:
+            query = query.where(
+                OmenIndexedMarket.creation_timestamp > to_int_timestamp(created_after)
+            )
+        if opened_before is not None:
+            query = query.where(
+                OmenIndexedMarket.opening_timestamp < to_int_timestamp(opened_before)
+            )
+        if opened_after is not None:
+            query = query.where(
+                OmenIndexedMarket.opening_timestamp > to_int_timestamp(opened_after)
+            )
+        if resolved is not None:
+            query = query.where(
+                col(OmenIndexedMarket.resolution_timestamp).is_not(None)
+                if resolved
+                else col(OmenIndexedMarket.resolution_timestamp).is_(None)
+            )
+        match sort_by:
+            case SortBy.NEWEST:
+                query = query.order_by(col(OmenIndexedMarket.creation_timestamp).desc())
+            case SortBy.CLOSING_SOONEST:
+                query = query.order_by(col(OmenIndexedMarket.opening_timestamp).asc())
+            case SortBy.NONE:
+                pass
+            case _:
+                raise ValueError(f"Unknown sort_by: {sort_by}")
+
+        with Session(self.engine) as session:
+            rows = session.exec(query).all()
+
+        markets = []
+        for row in rows:
+            # Non-binary markets are stored as well, skip them before they are validated.
+            if row.payload["outcomes"] != outcomes:
+                continue
+            market = OmenMarket.model_validate(row.payload)
+            if (
+                market.question.isPendingArbitration
+                or (
+                    collateral_token_address_in is not None
+                    and market.collateralToken
+                    not in [x.lower() for x in collateral_token_address_in]
+                )
+                or (resolved and market.answer_index == INVALID_ANSWER)
+                or (
+                    finalized is not None
+                    and finalized != (market.answerFinalizedTimestamp is not None)
+                )
+                or (
+                    finalized_before is not None
+                    and (
+                        market.answerFinalizedTimestamp is None
+                        or market.answerFinalizedTimestamp
+                        >= to_int_timestamp(finalized_before)
+                    )
+                )
+                or (
+                    finalized_after is not None
+                    and (
+                        market.answerFinalizedTimestamp is None
+                        or market.answerFinalizedTimestamp
+                        <= to_int_timestamp(finalized_after)
+                    )
+                )
+                or (
+                    liquidity_bigger_than is not None
+                    and market.liquidityParameter <= liquidity_bigger_than
+                )
+                or (category is not None and market.category != category)
+                or (excluded_questions and market.question.title in excluded_questions)
+            ):
+                continue
+            markets.append(market)
+            if limit is not None and len(markets) >= limit:
+                break
+        return markets
+
+    def get_market_by_id(self, market_id: HexAddress) -> OmenMarket | None:
+        with Session(self.engine) as session:
+            row = session.get(OmenIndexedMarket, market_id.lower())
+        return OmenMarket.model_validate(row.payload) if row is not None else None
+
+    def get_trades(
+        self,
+        better_address: ChecksumAddress | None = None,
+        start_time: datetime | None = None,
+        end_time: t.Optional[datetime] = None,
+        market_id: t.Optional[ChecksumAddress] = None,
+        filter_by_answer_finalized_not_null: bool = False,
+        type_: t.Literal["Buy", "Sell"] | None = None,
+        market_opening_after: datetime | None = None,
+        collateral_amount_more_than: Wei | None = None,
+        market_id_in: t.Sequence[HexAddress] | None = None,
+    ) -> list[OmenBet]:
+        """
+        Same filters as `OmenSubgraphHandler.get_trades`, plus `market_id_in` used by `OmenSubgraphHandler.get_trades_for_markets`.
+        """
+        if not end_time:
+            end_time = utcnow()
+
+        query = (
+            select(OmenIndexedTrade, OmenIndexedMarket)
+            .join(
+                OmenIndexedMarket,
+                col(OmenIndexedTrade.market_id) == col(OmenIndexedMarket.id),
+            )
+            .where(OmenIndexedTrade.creation_timestamp <= to_int_timestamp(end_time))
+        )
+        if start_time:
+            query = query.where(
+                OmenIndexedTrade.creation_timestamp >= to_int_timestamp(start_time)
+            )
+        if type_:
+            query = query.where(OmenIndexedTrade.type == type_)
+        if better_address:
+            query = query.where(OmenIndexedTrade.creator == better_address.lower())
+        if market_id:
+            query = query.where(OmenIndexedTrade.market_id == market_id.lower())
+        if market_id_in is not None:
+            query = query.where(
+                col(OmenIndexedTrade.market_id).in_([x.lower() for x in market_id_in])
+            )
+        if market_opening_after is not None:
+            query = query.where(
+                OmenIndexedMarket.opening_timestamp
+                > to_int_timestamp(market_opening_after)
+            )
+
+        with Session(self.engine) as session:
+            rows = session.exec(query).all()
+
+        # Payloads were stored as returned by the subgraph.
+        trades = validate_models(
+            OmenBet,
+            [{**trade.payload, "fpmm": market.payload} for trade, market in rows],
+            trusted=True,
+        )
+        return [
+            trade
+            for trade in trades
+            if (
+                not filter_by_answer_finalized_not_null
+                or trade.fpmm.answerFinalizedTimestamp is not None
+            )
+            and (
+                collateral_amount_more_than is None
+                or trade.collateralAmount > collateral_amount_more_than
+            )
+        ]
+
+    def get_questions(
+        self,
+        limit: int | None,
+        user: HexAddress | None = None,
+        claimed: bool | None = None,
+        finalized_before: datetime | None = None,
+        finalized_after: datetime | None = None,
+        id_in: list[str] | None = None,
+        question_id_in: list[HexBytes] | None = None,
+    ) -> list[RealityQuestion]:
+        """
+        Same filters as `OmenSubgraphHandler.get_questions`, except `current_answer_before`, which isn't indexed.
+        """
+        query = select(OmenIndexedRealityQuestion)
+        if user is not None:
+            query = query.where(OmenIndexedRealityQuestion.user == user.lower())
+        if claimed is not None:
+            query = query.where(
+                OmenIndexedRealityQuestion.history_hash == ZERO_BYTES.hex()
+                if claimed
+                else OmenIndexedRealityQuestion.history_hash != ZERO_BYTES.hex()
+            )
+        if finalized_before is not None:
+            query = query.where(
+                col(OmenIndexedRealityQuestion.answer_finalized_timestamp)
+                < to_int_timestamp(finalized_before)
+            )
+        if finalized_after is not None:
+            query = query.where(
+                col(OmenIndexedRealityQuestion.answer_finalized_timestamp)
+                > to_int_timestamp(finalized_after)
+            )
+        if id_in is not None:
+            query = query.where(col(OmenIndexedRealityQuestion.id).in_(id_in))
+        if question_id_in is not None:
+            query = query.where(
+                col(OmenIndexedRealityQuestion.question_id).in_(
+                    [x.hex() for x in question_id_in]
+                )
+            )
+        if limit is not None:
+            query = query.limit(limit)
+
+        with Session(self.engine) as session:
+            rows = session.exec(query).all()
+        return validate_models(
+            RealityQuestion, [row.payload for row in rows], trusted=True
+        )
@@ -1,4 +1,7 @@
-from datetime import datetime
+import typing as t
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from datetime import timedelta
 
 from web3 import Web3
 
@@ -17,8 +20,10 @@ from prediction_market_agent_tooling.markets.manifold.utils import (
 )
 from prediction_market_agent_tooling.markets.markets import MarketType
 from prediction_market_agent_tooling.markets.omen.data_models import (
+    INVALID_ANSWER_HEX_BYTES,
     OmenMarket,
     RealityQuestion,
+    RealityResponse,
 )
 from prediction_market_agent_tooling.markets.omen.omen import (
     OMEN_DEFAULT_REALITIO_BOND_VALUE,
@@ -33,8 +38,15 @@ from prediction_market_agent_tooling.markets.omen.omen_subgraph_handler import (
 from prediction_market_agent_tooling.markets.polymarket.utils import (
     find_resolution_on_polymarket,
 )
+from prediction_market_agent_tooling.tools.cache import two_tier_cache
+from prediction_market_agent_tooling.tools.utils import convert_to_utc_datetime, utcnow
 from prediction_market_agent_tooling.tools.web3_utils import ZERO_BYTES, xdai_to_wei
 
+RESOLUTION_LOOKUP_MAX_WORKERS = 10
+RESOLUTION_LOOKUP_CACHE_TTL = timedelta(hours=6)
+# Omen isn't here, because we are going to resolve it on Omen, so we can't find the answer there.
+RESOLUTION_LOOKUP_MARKET_TYPES = [MarketType.MANIFOLD, MarketType.POLYMARKET]
+
 
 def claim_bonds_on_realitio_questions(
     api_keys: APIKeys,
@@ -42,17 +54,57 @@ def claim_bonds_on_realitio_questions(
     auto_withdraw: bool,
     web3: Web3 | None = None,
 ) -> list[HexBytes]:
-    claimed_questions: list[HexBytes] = []
+    """
+    Responses of all the questions are fetched in a single query and the claims are sent all at once, see `ContractBaseClass.try_send_many`.
+    Questions that couldn't be claimed are logged and left out of the returned list.
+    """
+    if not questions:
+        return []
 
-    for idx, question in enumerate(questions):
-        logger.info(
-            f"[{idx+1} / {len(questions)}] Claiming bond for {question.questionId=} {question.url=}"
-        )
-        claim_bonds_on_realitio_question(
-            api_keys, question, auto_withdraw=auto_withdraw, web3=web3
-        )
+    realitio_contract = OmenRealitioContract()
+
+    # Get all answers for all the questions.
+    responses_by_question_id: defaultdict[
+        HexBytes, list[RealityResponse]
+    ] = defaultdict(list)
+    for response in OmenSubgraphHandler().get_responses(
+        limit=None, question_id_in=[question.questionId for question in questions]
+    ):
+        responses_by_question_id[response.question.questionId].append(response)
+
+    questions_to_claim: list[RealityQuestion] = []
+    calls: list[tuple[str, list[t.Any] | dict[str, t.Any] | None]] = []
+    for question in questions:
+        try:
+            function_params = build_claim_winnings_params(
+                question.questionId, responses_by_question_id[question.questionId]
+            )
+        except ValueError as e:
+            logger.error(f"Can not claim bond for {question.url=}: {e}")
+            continue
+        questions_to_claim.append(question)
+        calls.append(("claimWinnings", function_params))
+
+    logger.info(f"Claiming bonds for {len(calls)} out of {len(questions)} questions.")
+    claimed_questions: list[HexBytes] = []
+    results = realitio_contract.try_send_many(api_keys, calls, web3=web3)
+    for question, result in zip(questions_to_claim, results):
+        if isinstance(result, Exception):
+            logger.error(
+                f"Claiming bond for {question.questionId=} {question.url=} failed: {result}"
+            )
+            continue
+        logger.info(f"Claimed bond for {question.questionId=} {question.url=}")
         claimed_questions.append(question.questionId)
 
+    if claimed_questions and auto_withdraw:
+        public_key = api_keys.bet_from_address
+        current_balance = realitio_contract.balanceOf(public_key, web3=web3)
+        # Keeping balance on Realitio is not useful, so it's recommended to just withdraw it.
+        if current_balance > 0:
+            logger.info(f"Withdrawing remaining balance {current_balance=}")
+            realitio_contract.withdraw(api_keys, web3=web3)
+
     return claimed_questions
 
 
@@ -62,22 +114,28 @@ def claim_bonds_on_realitio_question(
     auto_withdraw: bool,
     web3: Web3 | None = None,
 ) -> None:
-    public_key = api_keys.bet_from_address
-    realitio_contract = OmenRealitioContract()
+    if not claim_bonds_on_realitio_questions(
+        api_keys, [question], auto_withdraw=auto_withdraw, web3=web3
+    ):
+        raise ValueError(
+            f"Failed to claim bond for {question.questionId.hex()=}, see the logs for the reason."
+        )
 
-    # Get all answers for the question.
-    responses = OmenSubgraphHandler().get_responses(
-        limit=None, question_id=question.questionId
-    )
 
+def build_claim_winnings_params(
+    question_id: HexBytes, responses: list[RealityResponse]
+) -> dict[str, t.Any]:
+    """
+    Function parameters for Realitio's `claimWinnings`, built from all the responses to the question.
+    """
     # They need to be processed in order.
     responses = sorted(responses, key=lambda x: x.timestamp)
 
     if not responses:
-        raise ValueError(f"No answers found for {question.questionId.hex()=}")
+        raise ValueError(f"No answers found for {question_id.hex()=}")
 
     if responses[-1].question.historyHash == ZERO_BYTES:
-        raise ValueError(f"Already claimed {question.questionId.hex()=}.")
+        raise ValueError(f"Already claimed {question_id.hex()=}.")
 
     history_hashes: list[HexBytes] = []
     addresses: list[ChecksumAddress] = []
@@ -102,22 +160,14 @@ def claim_bonds_on_realitio_question(
         # last-to-first, each answer supplied, or commitment ID if the answer was supplied with commit->reveal
         answers.append(response.answer)
 
-    realitio_contract.claimWinnings(
-        api_keys=api_keys,
-        question_id=question.questionId,
+    return OmenRealitioContract.claim_winnings_params(
+        question_id=question_id,
         history_hashes=history_hashes,
         addresses=addresses,
         bonds=bonds,
         answers=answers,
-        web3=web3,
     )
 
-    current_balance = realitio_contract.balanceOf(public_key, web3=web3)
-    # Keeping balance on Realitio is not useful, so it's recommended to just withdraw it.
-    if current_balance > 0 and auto_withdraw:
-        logger.info(f"Withdrawing remaining balance {current_balance=}")
-        realitio_contract.withdraw(api_keys, web3=web3)
-
 
 def finalize_markets(
     api_keys: APIKeys,
@@ -125,25 +175,29 @@ def finalize_markets(
     wait_n_days_before_invalid: int = 30,
     web3: Web3 | None = None,
 ) -> list[HexAddress]:
-    finalized_markets: list[HexAddress] = []
+    """
+    Answers are submitted all at once, see `ContractBaseClass.try_send_many`.
+    Returns markets that were answered with a valid resolution, failed ones are logged and left out.
+    """
+    realitio_contract = OmenRealitioContract()
+    bond = xdai_to_wei(OMEN_DEFAULT_REALITIO_BOND_VALUE)
+    # Market, answer to submit and whether it counts as finalized.
+    to_submit: list[tuple[OmenMarket, HexBytes, bool]] = []
 
     for idx, (market, resolution) in enumerate(markets_with_resolutions):
         logger.info(
             f"[{idx+1} / {len(markets_with_resolutions)}] Looking into {market.url=} {market.question_title=}"
         )
-        closed_before_days = (datetime.now() - market.close_time).days
+        closed_before_days = (
+            utcnow() - convert_to_utc_datetime(market.close_time)
+        ).days
 
         if resolution is None:
             if closed_before_days > wait_n_days_before_invalid:
                 logger.warning(
                     f"Finalizing as invalid, market closed before {closed_before_days} days: {market.url=}"
                 )
-                omen_submit_invalid_answer_market_tx(
-                    api_keys,
-                    market,
-                    OMEN_DEFAULT_REALITIO_BOND_VALUE,
-                    web3=web3,
-                )
+                to_submit.append((market, INVALID_ANSWER_HEX_BYTES, False))
 
             else:
                 logger.warning(
@@ -152,26 +206,44 @@ def finalize_markets(
 
         elif resolution in (Resolution.YES, Resolution.NO):
             logger.info(f"Found resolution {resolution.value=} for {market.url=}")
-            omen_submit_answer_market_tx(
-                api_keys,
-                market,
-                resolution,
-                OMEN_DEFAULT_REALITIO_BOND_VALUE,
-                web3=web3,
+            to_submit.append(
+                (
+                    market,
+                    OmenRealitioContract.encode_answer(
+                        resolution.value, market.question.outcomes
+                    ),
+                    True,
+                )
             )
-            finalized_markets.append(market.id)
-            logger.info(f"Finalized {market.url=}")
 
         else:
             logger.warning(
                 f"Invalid resolution found, {resolution=}, for {market.url=}, finalizing as invalid."
             )
-            omen_submit_invalid_answer_market_tx(
-                api_keys,
-                market,
-                OMEN_DEFAULT_REALITIO_BOND_VALUE,
-                web3=web3,
+            to_submit.append((market, INVALID_ANSWER_HEX_BYTES, False))
+
+    results = realitio_contract.try_send_many(
+        api_keys,
+        [
+            (
+                "submitAnswer",
+                OmenRealitioContract.submit_answer_params(
+                    question_id=market.question.id, answer=answer
+                ),
             )
+            for market, answer, _ in to_submit
+        ],
+        values=[bond] * len(to_submit),
+        web3=web3,
+    )
+
+    finalized_markets: list[HexAddress] = []
+    for (market, _, is_finalized), result in zip(to_submit, results):
+        if isinstance(result, Exception):
+            logger.error(f"Submitting answer for {market.url=} failed: {result}")
+        elif is_finalized:
+            finalized_markets.append(market.id)
+            logger.info(f"Finalized {market.url=}")
 
     return finalized_markets
 
@@ -181,13 +253,36 @@ def resolve_markets(
     markets: list[OmenMarket],
     web3: Web3 | None = None,
 ) -> list[HexAddress]:
-    resolved_markets: list[HexAddress] = []
+    """
+    Markets are resolved all at once, see `ContractBaseClass.try_send_many`.
+    Markets that failed to resolve are logged and left out of the returned list.
+    """
+    logger.info(f"Resolving {len(markets)} markets.")
+    results = OmenOracleContract().try_send_many(
+        api_keys,
+        [
+            (
+                "resolve",
+                OmenOracleContract.resolve_params(
+                    question_id=market.question.id,
+                    template_id=market.question.templateId,
+                    question_raw=market.question.question_raw,
+                    n_outcomes=market.question.n_outcomes,
+                ),
+            )
+            for market in markets
+        ],
+        web3=web3,
+    )
 
-    for idx, market in enumerate(markets):
-        logger.info(
-            f"[{idx+1} / {len(markets)}] Resolving {market.url=} {market.question_title=}"
-        )
-        omen_resolve_market_tx(api_keys, market, web3=web3)
+    resolved_markets: list[HexAddress] = []
+    for market, result in zip(markets, results):
+        if isinstance(result, Exception):
+            logger.error(
+                f"Resolving {market.url=} {market.question_title=} failed: {result}"
+            )
+            continue
+        logger.info(f"Resolved {market.url=} {market.question_title=}")
         resolved_markets.append(market.id)
 
     return resolved_markets
@@ -254,29 +349,84 @@ def omen_resolve_market_tx(
 
 
 def find_resolution_on_other_markets(market: OmenMarket) -> Resolution | None:
-    resolution: Resolution | None = None
+    return find_resolutions_on_other_markets([market])[market.id]
 
-    for market_type in MarketType:
-        match market_type:
-            case MarketType.OMEN:
-                # We are going to resolve it on Omen, so we can't find the answer there.
-                continue
 
-            case MarketType.MANIFOLD:
-                logger.info(f"Looking on Manifold for {market.question_title=}")
-                resolution = find_resolution_on_manifold(market.question_title)
+def find_resolutions_on_other_markets(
+    markets: t.Sequence[OmenMarket],
+    max_workers: int = RESOLUTION_LOOKUP_MAX_WORKERS,
+) -> dict[HexAddress, Resolution | None]:
+    """
+    Looks for the resolutions of the markets on all the other platforms at once.
+    If more platforms give an answer for a market, the first one in `RESOLUTION_LOOKUP_MARKET_TYPES` is used, no matter which finished first,
+    so lookups on the platforms after it that haven't started yet are cancelled.
 
-            case MarketType.POLYMARKET:
-                logger.info(f"Looking on Polymarket for {market.question_title=}")
-                resolution = find_resolution_on_polymarket(market.question_title)
+    A failed lookup isn't the same as not found (which could finalize the market as invalid), so once all the lookups are done,
+    the error is raised if the failed platform could have decided any market's resolution.
+    """
+    found: dict[HexAddress, list[Resolution | None | Exception]] = {
+        market.id: [None] * len(RESOLUTION_LOOKUP_MARKET_TYPES) for market in markets
+    }
+    futures_by_market: dict[HexAddress, list[Future[Resolution | None]]] = defaultdict(
+        list
+    )
 
-            case _:
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        lookup_by_future: dict[Future[Resolution | None], tuple[OmenMarket, int]] = {}
+        for market in markets:
+            for idx, market_type in enumerate(RESOLUTION_LOOKUP_MARKET_TYPES):
+                future = executor.submit(
+                    find_resolution_on_market_type, market_type, market.question_title
+                )
+                lookup_by_future[future] = (market, idx)
+                futures_by_market[market.id].append(future)
+
+        for future in as_completed(lookup_by_future):
+            market, idx = lookup_by_future[future]
+            if future.cancelled():
+                continue
+            try:
+                resolution = future.result()
+            except Exception as e:
                 logger.warning(
-                    f"Unknown market type {market_type} in replication resolving."
+                    f"Looking for resolution of {market.question_title=} failed: {e}"
                 )
+                found[market.id][idx] = e
                 continue
-
-        if resolution is not None:
-            return resolution
-
-    return resolution
+            found[market.id][idx] = resolution
+            if resolution is not None:
+                for other_future in futures_by_market[market.id][idx + 1 :]:
+                    other_future.cancel()
+
+    resolutions: dict[HexAddress, Resolution | None] = {}
+    for market_id, results in found.items():
+        resolutions[market_id] = None
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+            if result is not None:
+                resolutions[market_id] = result
+                break
+    return resolutions
+
+
+@two_tier_cache(ttl=RESOLUTION_LOOKUP_CACHE_TTL)
+def find_resolution_on_market_type(
+    market_type: MarketType, question: str
+) -> Resolution | None:
+    """
+    Results are cached for a while, so markets not resolved (or not found) elsewhere aren't looked up again on every run.
+    """
+    match market_type:
+        case MarketType.MANIFOLD:
+            logger.info(f"Looking on Manifold for {question=}")
+            return find_resolution_on_manifold(question)
+
+        case MarketType.POLYMARKET:
+            logger.info(f"Looking on Polymarket for {question=}")
+            return find_resolution_on_polymarket(question)
+
+        case _:
+            raise ValueError(
+                f"Unsupported market type {market_type} in replication resolving."
+            )
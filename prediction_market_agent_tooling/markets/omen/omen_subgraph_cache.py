@@ -0,0 +1,192 @@
+import hashlib
+import json
+import typing as t
+from datetime import timedelta
+
+from subgrounds import FieldPath, Subgrounds
+from subgrounds.query import Document, InputValue, Selection
+
+from prediction_market_agent_tooling.loggers import logger
+from prediction_market_agent_tooling.tools.cache import (
+    DEFAULT_MAX_DISK_BYTES,
+    CacheStats,
+    TwoTierCache,
+)
+from prediction_market_agent_tooling.tools.utils import to_int_timestamp, utcnow
+
+# Results that can change at any time, e.g. open markets, user's positions or listings.
+OPEN_QUERY_TTL = timedelta(minutes=1)
+# Results that can't change anymore, e.g. finalized markets and questions, or trades on them.
+FINALIZED_QUERY_TTL = timedelta(days=30)
+DEFAULT_MAX_MEMORY_QUERIES = 1024
+# Fields that can change even once the market or question is resolved: liquidity providers can withdraw (which changes also the outcome token amounts),
+# and the history hash of a question is reset when its bonds are claimed.
+VOLATILE_FIELDS = frozenset(
+    [
+        "liquidityParameter",
+        "scaledLiquidityParameter",
+        "outcomeTokenAmounts",
+        "historyHash",
+    ]
+)
+
+QueryJson = t.Callable[..., list[dict[str, t.Any]]]
+
+
+class OmenSubgraphQueryCache:
+    """
+    Cache of the results of `Subgrounds.query_json`, keyed by the normalized query documents (including their variables).
+
+    Results are cached only for `open_ttl`, unless the query looks up specific entities (by ids, condition ids, question ids or market),
+    doesn't select any field that changes even after the resolution (e.g. liquidity, that can be withdrawn at any time),
+    and all the markets or questions in the result are already finalized and resolved, then nothing can change anymore and `finalized_ttl` is used.
+    Listings (e.g. the newest resolved markets) always use `open_ttl`, because new items can appear in them.
+
+    Cached results are shared, so they must not be modified.
+    """
+
+    def __init__(
+        self,
+        open_ttl: timedelta = OPEN_QUERY_TTL,
+        finalized_ttl: timedelta = FINALIZED_QUERY_TTL,
+        max_memory_items: int = DEFAULT_MAX_MEMORY_QUERIES,
+        max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+        cache_dir: str | None = None,
+    ) -> None:
+        self.open_ttl = open_ttl
+        self.finalized_ttl = finalized_ttl
+        self.cache = TwoTierCache(
+            function=f"{__name__}.{self.__class__.__name__}",
+            ttl=open_ttl,
+            max_memory_items=max_memory_items,
+            max_disk_bytes=max_disk_bytes,
+            cache_dir=cache_dir,
+        )
+
+    def wrap(self, sg: Subgrounds, query_json: QueryJson) -> QueryJson:
+        """
+        Returns `query_json` (already bound to `sg`) that goes through the cache.
+        """
+
+        def cached_query_json(
+            fpaths: FieldPath | list[FieldPath], *args: t.Any, **kwargs: t.Any
+        ) -> list[dict[str, t.Any]]:
+            try:
+                documents = sg.mk_request(
+                    fpaths if isinstance(fpaths, list) else [fpaths]
+                ).documents
+            except Exception as e:
+                logger.debug(f"Can not build the query for the cache, skipping: {e}")
+                return query_json(fpaths, *args, **kwargs)
+
+            key = query_cache_key(documents, *args, **kwargs)
+            found, result = self.cache.get(key)
+            if not found:
+                result = query_json(fpaths, *args, **kwargs)
+                self.cache.set(key, result, ttl=self.get_ttl(documents, result))
+            return t.cast(list[dict[str, t.Any]], result)
+
+        return cached_query_json
+
+    def get_ttl(
+        self, documents: list[Document], result: list[dict[str, t.Any]]
+    ) -> timedelta:
+        if all(
+            is_lookup_of_specific_entities(doc) and not selects_volatile_fields(doc)
+            for doc in documents
+        ) and is_finalized(result):
+            return self.finalized_ttl
+        return self.open_ttl
+
+    def stats(self) -> CacheStats:
+        return self.cache.stats()
+
+
+def query_cache_key(documents: list[Document], *args: t.Any, **kwargs: t.Any) -> str:
+    payload = json.dumps(
+        [
+            [(doc.url, doc.graphql, doc.variables) for doc in documents],
+            # E.g. pagination strategy changes how the result looks.
+            [repr(arg) for arg in args],
+            {k: repr(v) for k, v in kwargs.items()},
+        ],
+        sort_keys=True,
+        default=repr,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def is_lookup_of_specific_entities(document: Document) -> bool:
+    """
+    Whether all the queried fields are filtered by the identity of what they query,
+    so that no new items can appear in the result once the found ones are finalized.
+    """
+    for selection in document.query.selection:
+        where = next(
+            (arg.value for arg in selection.arguments if arg.name == "where"), None
+        )
+        if where is None or not any(
+            _is_identity_filter(key) for key in _iter_filter_keys(where)
+        ):
+            return False
+    return True
+
+
+def selects_volatile_fields(document: Document) -> bool:
+    return any(_iter_selects_volatile_fields(document.query.selection))
+
+
+def is_finalized(result: list[dict[str, t.Any]]) -> bool:
+    """
+    Whether there is any market or question in the result and all of them are finalized and resolved.
+    Finalized answer alone isn't enough, nothing is settled until the market (or the question's condition) is resolved.
+    """
+    now = to_int_timestamp(utcnow())
+    statuses = list(_iter_finalized_statuses(result, resolved=False, now=now))
+    return bool(statuses) and all(statuses)
+
+
+def _is_identity_filter(key: str) -> bool:
+    return key in ("id", "id_in", "fpmm", "fpmm_in") or key.endswith(("Id", "Id_in"))
+
+
+def _iter_filter_keys(value: InputValue.T) -> t.Iterator[str]:
+    if isinstance(value, InputValue.Object):
+        for key, nested in value.value.items():
+            yield key
+            yield from _iter_filter_keys(nested)
+
+
+def _iter_selects_volatile_fields(selections: list[Selection]) -> t.Iterator[bool]:
+    for selection in selections:
+        yield selection.fmeta.name in VOLATILE_FIELDS
+        yield from _iter_selects_volatile_fields(selection.selection)
+
+
+def _is_resolved(entity: dict[str, t.Any]) -> bool:
+    """
+    Markets are resolved once `resolutionTimestamp` is set, questions once their condition has payouts.
+    """
+    if entity.get("resolutionTimestamp") is not None:
+        return True
+    condition = entity.get("condition")
+    return isinstance(condition, dict) and bool(condition.get("payouts"))
+
+
+def _iter_finalized_statuses(
+    value: t.Any, resolved: bool, now: int
+) -> t.Iterator[bool]:
+    """
+    Yields whether each market or question (anything with `answerFinalizedTimestamp`) is finalized and resolved.
+    Nested entities (e.g. market's question) are resolved together with their parent.
+    """
+    if isinstance(value, dict):
+        resolved = resolved or _is_resolved(value)
+        if "answerFinalizedTimestamp" in value:
+            timestamp = value["answerFinalizedTimestamp"]
+            yield resolved and timestamp is not None and int(timestamp) <= now
+        for nested in value.values():
+            yield from _iter_finalized_statuses(nested, resolved, now)
+    elif isinstance(value, list):
+        for nested in value:
+            yield from _iter_finalized_statuses(nested, resolved, now)
@@ -6,6 +6,7 @@ import requests
 import tenacity
 from PIL import Image
 from PIL.Image import Image as ImageType
+from pydantic import BaseModel
 from subgrounds import FieldPath, Subgrounds
 
 from prediction_market_agent_tooling.config import APIKeys
@@ -13,6 +14,7 @@ from prediction_market_agent_tooling.gtypes import (
     ChecksumAddress,
     HexAddress,
     HexBytes,
+    HexStr,
     Wei,
     wei_type,
 )
@@ -20,8 +22,11 @@ from prediction_market_agent_tooling.loggers import logger
 from prediction_market_agent_tooling.markets.agent_market import FilterBy, SortBy
 from prediction_market_agent_tooling.markets.omen.data_models import (
     OMEN_BINARY_MARKET_OUTCOMES,
+    MarketFields,
     OmenBet,
     OmenMarket,
+    OmenMarketListing,
+    OmenMarketTrading,
     OmenPosition,
     OmenUserPosition,
     RealityAnswer,
@@ -33,8 +38,13 @@ from prediction_market_agent_tooling.markets.omen.omen_contracts import (
     WrappedxDaiContract,
     sDaiContract,
 )
+from prediction_market_agent_tooling.markets.omen.omen_local_index import OmenLocalIndex
+from prediction_market_agent_tooling.markets.omen.omen_subgraph_cache import (
+    OmenSubgraphQueryCache,
+)
 from prediction_market_agent_tooling.tools.singleton import SingletonMeta
 from prediction_market_agent_tooling.tools.utils import to_int_timestamp, utcnow
+from prediction_market_agent_tooling.tools.validation import validate_models
 from prediction_market_agent_tooling.tools.web3_utils import (
     ZERO_BYTES,
     byte32_to_ipfscidv0,
@@ -46,6 +56,19 @@ SAFE_COLLATERAL_TOKEN_MARKETS = (
     sDaiContract().address,
 )
 
+# The Graph doesn't allow to fetch more than 1000 items in a single query.
+DEFAULT_PAGE_SIZE = 1000
+# Number of markets put into a single `fpmm_in` filter, to keep the query size reasonable.
+MARKETS_IN_FILTER_CHUNK_SIZE = 100
+
+_T = t.TypeVar("_T", bound=BaseModel)
+
+MARKET_MODELS: dict[MarketFields, t.Type[OmenMarketListing]] = {
+    "listing": OmenMarketListing,
+    "trading": OmenMarketTrading,
+    "full": OmenMarket,
+}
+
 
 class OmenSubgraphHandler(metaclass=SingletonMeta):
     """
@@ -74,6 +97,19 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
 
         keys = APIKeys()
 
+        # Opt-in cache of the query results, in front of the retries, so that cached queries aren't retried.
+        self.query_cache: OmenSubgraphQueryCache | None = (
+            OmenSubgraphQueryCache(
+                cache_dir=(
+                    keys.CACHE_DIR if keys.OMEN_SUBGRAPH_QUERY_CACHE_PERSIST else None
+                )
+            )
+            if keys.OMEN_SUBGRAPH_QUERY_CACHE
+            else None
+        )
+        if self.query_cache is not None:
+            self.sg.query_json = self.query_cache.wrap(self.sg, self.sg.query_json)
+
         # Load the subgraph
         self.trades_subgraph = self.sg.load_subgraph(
             self.OMEN_TRADES_SUBGRAPH.format(
@@ -96,6 +132,24 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
             )
         )
 
+        # Opt-in local mirror, used to answer the most common queries without hitting the gateway.
+        self.local_index: OmenLocalIndex | None = (
+            OmenLocalIndex(keys.OMEN_LOCAL_INDEX_DB_URL)
+            if keys.OMEN_LOCAL_INDEX_DB_URL
+            else None
+        )
+
+    def _synced_local_index(self) -> OmenLocalIndex | None:
+        """
+        Returns the local index, if it's enabled and was already synced at least once, see `OmenLocalIndex.sync_if_stale`.
+        """
+        if self.local_index is None:
+            return None
+        if not self.local_index.sync_if_stale(self):
+            logger.debug("Local index was never synced, querying the subgraph.")
+            return None
+        return self.local_index
+
     def _get_fields_for_bets(self, bets_field: FieldPath) -> list[FieldPath]:
         markets = bets_field.fpmm
         fields_for_markets = self._get_fields_for_markets(markets)
@@ -173,31 +227,50 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
             questions_field.openingTimestamp,
         ]
 
-    def _get_fields_for_markets(self, markets_field: FieldPath) -> list[FieldPath]:
+    def _get_fields_for_markets(
+        self, markets_field: FieldPath, fields: MarketFields = "full"
+    ) -> list[FieldPath]:
+        """
+        `fields` selects the projection, matching the models in `MARKET_MODELS`.
+        """
         # In theory it's possible to store the subgraph schema locally (see https://github.com/0xPlaygrounds/subgrounds/issues/41).
         # Since it's still not working, we hardcode the schema to be fetched below.
-        return [
+        listing_fields = [
             markets_field.id,
             markets_field.title,
-            markets_field.creator,
-            markets_field.collateralVolume,
-            markets_field.usdVolume,
             markets_field.liquidityParameter,
-            markets_field.collateralToken,
             markets_field.outcomes,
             markets_field.outcomeTokenAmounts,
+            markets_field.creationTimestamp,
+        ]
+        trading_fields = listing_fields + [
+            markets_field.collateralToken,
             markets_field.outcomeTokenMarginalPrices,
-            markets_field.lastActiveDay,
-            markets_field.lastActiveHour,
             markets_field.fee,
             markets_field.answerFinalizedTimestamp,
             markets_field.resolutionTimestamp,
             markets_field.currentAnswer,
-            markets_field.creationTimestamp,
-            markets_field.category,
             markets_field.condition.id,
             markets_field.condition.outcomeSlotCount,
-        ] + self._get_fields_for_market_questions(markets_field.question)
+        ]
+        if fields == "listing":
+            return listing_fields + [markets_field.question.openingTimestamp]
+        if fields == "trading":
+            return trading_fields + [markets_field.question.openingTimestamp]
+        if fields == "full":
+            return (
+                trading_fields
+                + [
+                    markets_field.creator,
+                    markets_field.collateralVolume,
+                    markets_field.usdVolume,
+                    markets_field.lastActiveDay,
+                    markets_field.lastActiveHour,
+                    markets_field.category,
+                ]
+                + self._get_fields_for_market_questions(markets_field.question)
+            )
+        raise ValueError(f"Unknown fields: {fields}")
 
     def _build_where_statements(
         self,
@@ -318,6 +391,7 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
 
         return sort_direction, sort_by_field
 
+    @t.overload
     def get_omen_binary_markets_simple(
         self,
         limit: t.Optional[int],
@@ -331,9 +405,68 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
             tuple[ChecksumAddress, ...] | None
         ) = SAFE_COLLATERAL_TOKEN_MARKETS,
         category: str | None = None,
+        fields: t.Literal["full"] = "full",
     ) -> t.List[OmenMarket]:
+        ...
+
+    @t.overload
+    def get_omen_binary_markets_simple(
+        self,
+        limit: t.Optional[int],
+        # Enumerated values for simpler usage.
+        filter_by: FilterBy,
+        sort_by: SortBy,
+        # Additional filters, these can not be modified by the enums above.
+        created_after: datetime | None = None,
+        excluded_questions: set[str] | None = None,  # question titles
+        collateral_token_address_in: (
+            tuple[ChecksumAddress, ...] | None
+        ) = SAFE_COLLATERAL_TOKEN_MARKETS,
+        category: str | None = None,
+        *,
+        fields: t.Literal["trading"],
+    ) -> t.List[OmenMarketTrading]:
+        ...
+
+    @t.overload
+    def get_omen_binary_markets_simple(
+        self,
+        limit: t.Optional[int],
+        # Enumerated values for simpler usage.
+        filter_by: FilterBy,
+        sort_by: SortBy,
+        # Additional filters, these can not be modified by the enums above.
+        created_after: datetime | None = None,
+        excluded_questions: set[str] | None = None,  # question titles
+        collateral_token_address_in: (
+            tuple[ChecksumAddress, ...] | None
+        ) = SAFE_COLLATERAL_TOKEN_MARKETS,
+        category: str | None = None,
+        *,
+        fields: t.Literal["listing"],
+    ) -> t.List[OmenMarketListing]:
+        ...
+
+    def get_omen_binary_markets_simple(
+        self,
+        limit: t.Optional[int],
+        # Enumerated values for simpler usage.
+        filter_by: FilterBy,
+        sort_by: SortBy,
+        # Additional filters, these can not be modified by the enums above.
+        created_after: datetime | None = None,
+        excluded_questions: set[str] | None = None,  # question titles
+        collateral_token_address_in: (
+            tuple[ChecksumAddress, ...] | None
+        ) = SAFE_COLLATERAL_TOKEN_MARKETS,
+        category: str | None = None,
+        fields: MarketFields = "full",
+    ) -> t.Sequence[OmenMarketListing]:
         """
         Simplified `get_omen_binary_markets` method, which allows to fetch markets based on the filter_by and sort_by values.
+
+        `fields` selects a projection of the markets: "listing" and "trading" fetch and validate only a subset of the fields,
+        which is much cheaper for long listings, use `get_full_markets` to upgrade the markets that are needed in full.
         """
         # These values need to be set according to the filter_by value, so they can not be passed as arguments.
         finalized: bool | None = None
@@ -355,21 +488,39 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
         else:
             raise ValueError(f"Unknown filter_by: {filter_by}")
 
+        if (local_index := self._synced_local_index()) is not None:
+            return local_index.get_markets(
+                limit=limit,
+                finalized=finalized,
+                resolved=resolved,
+                opened_after=opened_after,
+                liquidity_bigger_than=liquidity_bigger_than,
+                sort_by=sort_by,
+                created_after=created_after,
+                excluded_questions=excluded_questions,
+                collateral_token_address_in=collateral_token_address_in,
+                category=category,
+            )
+
         sort_direction, sort_by_field = self._build_sort_params(sort_by)
 
-        return self.get_omen_binary_markets(
-            limit=limit,
+        where_stms = self._build_where_statements(
             finalized=finalized,
             resolved=resolved,
             opened_after=opened_after,
             liquidity_bigger_than=liquidity_bigger_than,
-            sort_direction=sort_direction,
-            sort_by_field=sort_by_field,
             created_after=created_after,
             excluded_questions=excluded_questions,
             collateral_token_address_in=collateral_token_address_in,
             category=category,
         )
+        markets = self._build_markets_query(
+            limit=limit,
+            where_stms=where_stms,
+            sort_by_field=sort_by_field,
+            sort_direction=sort_direction,
+        )
+        return self.do_markets_query(markets, fields=fields)
 
     def get_omen_binary_markets(
         self,
@@ -398,6 +549,31 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
         """
         Complete method to fetch Omen binary markets with various filters, use `get_omen_binary_markets_simple` for simplified version that uses FilterBy and SortBy enums.
         """
+        # Custom sorting is supported only through `get_omen_binary_markets_simple`.
+        if (
+            sort_by_field is None
+            and (local_index := self._synced_local_index()) is not None
+        ):
+            return local_index.get_markets(
+                limit=limit,
+                created_after=created_after,
+                opened_before=opened_before,
+                opened_after=opened_after,
+                finalized_before=finalized_before,
+                finalized_after=finalized_after,
+                finalized=finalized,
+                resolved=resolved,
+                creator=creator,
+                creator_in=creator_in,
+                liquidity_bigger_than=liquidity_bigger_than,
+                condition_id_in=condition_id_in,
+                id_in=id_in,
+                excluded_questions=excluded_questions,
+                outcomes=outcomes,
+                collateral_token_address_in=collateral_token_address_in,
+                category=category,
+            )
+
         where_stms = self._build_where_statements(
             creator=creator,
             creator_in=creator_in,
@@ -417,6 +593,23 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
             category=category,
         )
 
+        markets = self._build_markets_query(
+            limit=limit,
+            where_stms=where_stms,
+            sort_by_field=sort_by_field,
+            sort_direction=sort_direction,
+        )
+
+        omen_markets = self.do_markets_query(markets)
+        return omen_markets
+
+    def _build_markets_query(
+        self,
+        limit: t.Optional[int],
+        where_stms: dict[str, t.Any],
+        sort_by_field: FieldPath | None = None,
+        sort_direction: str | None = None,
+    ) -> FieldPath:
         # These values can not be set to `None`, but they can be omitted.
         optional_params = {}
         if sort_by_field is not None:
@@ -424,7 +617,7 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
         if sort_direction is not None:
             optional_params["orderDirection"] = sort_direction
 
-        markets = self.trades_subgraph.Query.fixedProductMarketMakers(
+        return self.trades_subgraph.Query.fixedProductMarketMakers(
             first=(
                 limit if limit else sys.maxsize
             ),  # if not limit, we fetch all possible markets
@@ -432,17 +625,141 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
             **optional_params,
         )
 
-        omen_markets = self.do_markets_query(markets)
-        return omen_markets
+    def iter_markets(
+        self,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        created_after: t.Optional[datetime] = None,
+        opened_before: t.Optional[datetime] = None,
+        opened_after: t.Optional[datetime] = None,
+        finalized_before: t.Optional[datetime] = None,
+        finalized_after: t.Optional[datetime] = None,
+        finalized: bool | None = None,
+        resolved: bool | None = None,
+        creator: t.Optional[HexAddress] = None,
+        creator_in: t.Optional[t.Sequence[HexAddress]] = None,
+        liquidity_bigger_than: Wei | None = None,
+        condition_id_in: list[HexBytes] | None = None,
+        id_in: list[str] | None = None,
+        excluded_questions: set[str] | None = None,  # question titles
+        outcomes: list[str] = OMEN_BINARY_MARKET_OUTCOMES,
+        collateral_token_address_in: (
+            tuple[ChecksumAddress, ...] | None
+        ) = SAFE_COLLATERAL_TOKEN_MARKETS,
+        category: str | None = None,
+    ) -> t.Iterator[OmenMarket]:
+        """
+        Streaming variant of `get_omen_binary_markets`, yields markets page by page (ordered by id), so it can be stopped at any time.
+        """
+        where_stms = self._build_where_statements(
+            creator=creator,
+            creator_in=creator_in,
+            outcomes=outcomes,
+            created_after=created_after,
+            opened_before=opened_before,
+            opened_after=opened_after,
+            finalized_before=finalized_before,
+            finalized_after=finalized_after,
+            finalized=finalized,
+            resolved=resolved,
+            condition_id_in=condition_id_in,
+            id_in=id_in,
+            excluded_questions=excluded_questions,
+            liquidity_bigger_than=liquidity_bigger_than,
+            collateral_token_address_in=collateral_token_address_in,
+            category=category,
+        )
 
-    def do_markets_query(self, markets: FieldPath) -> list[OmenMarket]:
-        fields = self._get_fields_for_markets(markets)
-        result = self.sg.query_json(fields)
+        def build_query(last_id: str | None, first: int) -> FieldPath:
+            return self.trades_subgraph.Query.fixedProductMarketMakers(
+                first=first,
+                where=where_stms
+                if last_id is None
+                else {**where_stms, "id_gt": last_id},
+                orderBy=self.trades_subgraph.FixedProductMarketMaker.id,
+                orderDirection="asc",
+            )
+
+        return self._iter_by_id_cursor(
+            build_query, self._get_fields_for_markets, OmenMarket, page_size
+        )
+
+    @t.overload
+    def do_markets_query(
+        self, markets: FieldPath, fields: t.Literal["full"] = "full"
+    ) -> list[OmenMarket]:
+        ...
+
+    @t.overload
+    def do_markets_query(
+        self, markets: FieldPath, fields: t.Literal["trading"]
+    ) -> list[OmenMarketTrading]:
+        ...
+
+    @t.overload
+    def do_markets_query(
+        self, markets: FieldPath, fields: t.Literal["listing"]
+    ) -> list[OmenMarketListing]:
+        ...
+
+    @t.overload
+    def do_markets_query(
+        self, markets: FieldPath, fields: MarketFields
+    ) -> t.Sequence[OmenMarketListing]:
+        ...
+
+    def do_markets_query(
+        self, markets: FieldPath, fields: MarketFields = "full"
+    ) -> t.Sequence[OmenMarketListing]:
+        query_fields = self._get_fields_for_markets(markets, fields)
+        result = self.sg.query_json(query_fields)
         items = self._parse_items_from_json(result)
-        omen_markets = [OmenMarket.model_validate(i) for i in items]
+        model = MARKET_MODELS[fields]
+        omen_markets = validate_models(model, items, trusted=True)
         return omen_markets
 
+    def get_full_markets(
+        self, markets: t.Sequence[OmenMarketListing]
+    ) -> list[OmenMarket]:
+        """
+        Upgrades markets fetched with a slimmer projection (e.g. `fields="listing"`) to full `OmenMarket`s, in the same order.
+        Markets that are already full are returned as they are, the rest is fetched in bulk.
+        """
+        full_markets: dict[HexAddress, OmenMarket] = {
+            m.id: m for m in markets if isinstance(m, OmenMarket)
+        }
+        missing_ids = list(
+            dict.fromkeys(m.id for m in markets if m.id not in full_markets)
+        )
+
+        if missing_ids and (local_index := self._synced_local_index()) is not None:
+            for market_id in missing_ids:
+                indexed_market = local_index.get_market_by_id(market_id)
+                if indexed_market is not None:
+                    full_markets[market_id] = indexed_market
+            missing_ids = [id_ for id_ in missing_ids if id_ not in full_markets]
+
+        for i in range(0, len(missing_ids), MARKETS_IN_FILTER_CHUNK_SIZE):
+            ids_chunk = missing_ids[i : i + MARKETS_IN_FILTER_CHUNK_SIZE]
+            # Don't apply the default filters, the markets are asked for explicitly.
+            query = self.trades_subgraph.Query.fixedProductMarketMakers(
+                first=len(ids_chunk),
+                where={"id_in": [id_.lower() for id_ in ids_chunk]},
+            )
+            for market in self.do_markets_query(query):
+                full_markets[market.id] = market
+
+        if not_found := [m.id for m in markets if m.id not in full_markets]:
+            raise ValueError(f"Markets {not_found} not found.")
+
+        return [full_markets[m.id] for m in markets]
+
     def get_omen_market_by_market_id(self, market_id: HexAddress) -> OmenMarket:
+        if (local_index := self._synced_local_index()) is not None:
+            # Don't apply the default filters, the market is asked for explicitly.
+            indexed_market = local_index.get_market_by_id(market_id)
+            if indexed_market is not None:
+                return indexed_market
+
         markets = self.trades_subgraph.Query.fixedProductMarketMaker(
             id=market_id.lower()
         )
@@ -472,6 +789,156 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
                     items.extend(v)
         return items
 
+    def _iter_by_id_cursor(
+        self,
+        build_query: t.Callable[[str | None, int], FieldPath],
+        get_fields: t.Callable[[FieldPath], list[FieldPath]],
+        model: t.Type[_T],
+        page_size: int,
+    ) -> t.Iterator[_T]:
+        for items in self._iter_raw_pages_by_id_cursor(
+            build_query, get_fields, page_size
+        ):
+            # Validate the whole page at once, it's much faster than item by item.
+            yield from validate_models(model, items, trusted=True)
+
+    def _iter_raw_by_id_cursor(
+        self,
+        build_query: t.Callable[[str | None, int], FieldPath],
+        get_fields: t.Callable[[FieldPath], list[FieldPath]],
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> t.Iterator[dict[str, t.Any]]:
+        for items in self._iter_raw_pages_by_id_cursor(
+            build_query, get_fields, page_size
+        ):
+            yield from items
+
+    def _iter_raw_pages_by_id_cursor(
+        self,
+        build_query: t.Callable[[str | None, int], FieldPath],
+        get_fields: t.Callable[[FieldPath], list[FieldPath]],
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> t.Iterator[list[dict[str, t.Any]]]:
+        """
+        Fetches items page by page, ordered by id and continuing after the last seen id.
+        Because it's a generator, the next page is fetched only once the previous one was consumed.
+
+        `build_query` receives the last seen id (`None` for the first page) and the page size.
+        """
+        last_id: str | None = None
+        while True:
+            query = build_query(last_id, page_size)
+            # Disable subgrounds' own pagination, as we are doing it here.
+            result = self.sg.query_json(get_fields(query), pagination_strategy=None)
+            items = self._parse_items_from_json(result)
+            if items:
+                yield items
+            if len(items) < page_size:
+                return
+            last_id = items[-1]["id"]
+
+    def _iter_raw_by_where(
+        self,
+        query_field: t.Callable[..., FieldPath],
+        id_field: FieldPath,
+        where_stms: dict[str, t.Any],
+        get_fields: t.Callable[[FieldPath], list[FieldPath]],
+    ) -> t.Iterator[dict[str, t.Any]]:
+        def build_query(last_id: str | None, first: int) -> FieldPath:
+            return query_field(
+                first=first,
+                where=where_stms
+                if last_id is None
+                else {**where_stms, "id_gt": last_id},
+                orderBy=id_field,
+                orderDirection="asc",
+            )
+
+        return self._iter_raw_by_id_cursor(build_query, get_fields)
+
+    def iter_raw_markets_created_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        return self._iter_raw_by_where(
+            self.trades_subgraph.Query.fixedProductMarketMakers,
+            self.trades_subgraph.FixedProductMarketMaker.id,
+            {
+                "creationTimestamp_gte": timestamp,
+                "title_not": None,
+                "question_not": None,
+            },
+            self._get_fields_for_markets,
+        )
+
+    def iter_raw_markets_by_id(self, ids: list[str]) -> t.Iterator[dict[str, t.Any]]:
+        return self._iter_raw_by_where(
+            self.trades_subgraph.Query.fixedProductMarketMakers,
+            self.trades_subgraph.FixedProductMarketMaker.id,
+            {"id_in": ids},
+            self._get_fields_for_markets,
+        )
+
+    def iter_raw_markets_resolved_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        return self._iter_raw_by_where(
+            self.trades_subgraph.Query.fixedProductMarketMakers,
+            self.trades_subgraph.FixedProductMarketMaker.id,
+            {
+                "resolutionTimestamp_gte": timestamp,
+                "title_not": None,
+                "question_not": None,
+            },
+            self._get_fields_for_markets,
+        )
+
+    def iter_raw_markets_by_question_id(
+        self, question_ids: list[str]
+    ) -> t.Iterator[dict[str, t.Any]]:
+        return self._iter_raw_by_where(
+            self.trades_subgraph.Query.fixedProductMarketMakers,
+            self.trades_subgraph.FixedProductMarketMaker.id,
+            {"question_in": question_ids, "title_not": None},
+            self._get_fields_for_markets,
+        )
+
+    def iter_raw_liquidity_changes_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        """
+        Liquidity added to or removed from the markets, only with the market's id and the time of the change.
+        """
+        return self._iter_raw_by_where(
+            self.trades_subgraph.Query.fpmmLiquidities,
+            self.trades_subgraph.FpmmLiquidity.id,
+            {"creationTimestamp_gte": timestamp},
+            lambda liquidity: [
+                liquidity.id,
+                liquidity.fpmm.id,
+                liquidity.creationTimestamp,
+            ],
+        )
+
+    def iter_raw_trades_created_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        return self._iter_raw_by_where(
+            self.trades_subgraph.Query.fpmmTrades,
+            self.trades_subgraph.FpmmTrade.id,
+            {"creationTimestamp_gte": timestamp},
+            self._get_fields_for_bets,
+        )
+
+    def iter_raw_reality_questions_updated_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        return self._iter_raw_by_where(
+            self.realityeth_subgraph.Query.questions,
+            self.realityeth_subgraph.Question.id,
+            {"updatedTimestamp_gte": timestamp},
+            self._get_fields_for_reality_questions,
+        )
+
     def _get_fields_for_user_positions(
         self, user_positions: FieldPath
     ) -> list[FieldPath]:
@@ -490,29 +957,64 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
             positions.indexSets,
         ]
 
-    def get_positions(
-        self,
-        condition_id: HexBytes | None = None,
-    ) -> list[OmenPosition]:
+    def _build_where_statements_for_positions(
+        self, condition_id: HexBytes | None = None
+    ) -> dict[str, t.Any]:
         where_stms: dict[str, t.Any] = {}
 
         if condition_id is not None:
             where_stms["conditionIds_contains"] = [condition_id.hex()]
 
+        return where_stms
+
+    def get_positions(
+        self,
+        condition_id: HexBytes | None = None,
+    ) -> list[OmenPosition]:
+        where_stms = self._build_where_statements_for_positions(
+            condition_id=condition_id
+        )
+
         positions = self.conditional_tokens_subgraph.Query.positions(
             first=sys.maxsize, where=where_stms
         )
         fields = self._get_fields_for_positions(positions)
         result = self.sg.query_json(fields)
         items = self._parse_items_from_json(result)
-        return [OmenPosition.model_validate(i) for i in items]
+        return validate_models(OmenPosition, items, trusted=True)
 
-    def get_user_positions(
+    def iter_positions(
+        self,
+        condition_id: HexBytes | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> t.Iterator[OmenPosition]:
+        """
+        Streaming variant of `get_positions`.
+        """
+        where_stms = self._build_where_statements_for_positions(
+            condition_id=condition_id
+        )
+
+        def build_query(last_id: str | None, first: int) -> FieldPath:
+            return self.conditional_tokens_subgraph.Query.positions(
+                first=first,
+                where=where_stms
+                if last_id is None
+                else {**where_stms, "id_gt": last_id},
+                orderBy=self.conditional_tokens_subgraph.Position.id,
+                orderDirection="asc",
+            )
+
+        return self._iter_by_id_cursor(
+            build_query, self._get_fields_for_positions, OmenPosition, page_size
+        )
+
+    def _build_where_statements_for_user_positions(
         self,
         better_address: ChecksumAddress,
         position_id_in: list[HexBytes] | None = None,
         total_balance_bigger_than: Wei | None = None,
-    ) -> list[OmenUserPosition]:
+    ) -> dict[str, t.Any]:
         where_stms: dict[str, t.Any] = {
             "user": better_address.lower(),
             "position_": {},
@@ -524,15 +1026,62 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
         if position_id_in is not None:
             where_stms["position_"]["positionId_in"] = [x.hex() for x in position_id_in]
 
+        return where_stms
+
+    def get_user_positions(
+        self,
+        better_address: ChecksumAddress,
+        position_id_in: list[HexBytes] | None = None,
+        total_balance_bigger_than: Wei | None = None,
+    ) -> list[OmenUserPosition]:
+        where_stms = self._build_where_statements_for_user_positions(
+            better_address=better_address,
+            position_id_in=position_id_in,
+            total_balance_bigger_than=total_balance_bigger_than,
+        )
+
         positions = self.conditional_tokens_subgraph.Query.userPositions(
             first=sys.maxsize, where=where_stms
         )
         fields = self._get_fields_for_user_positions(positions)
         result = self.sg.query_json(fields)
         items = self._parse_items_from_json(result)
-        return [OmenUserPosition.model_validate(i) for i in items]
+        return validate_models(OmenUserPosition, items, trusted=True)
 
-    def get_trades(
+    def iter_user_positions(
+        self,
+        better_address: ChecksumAddress,
+        position_id_in: list[HexBytes] | None = None,
+        total_balance_bigger_than: Wei | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> t.Iterator[OmenUserPosition]:
+        """
+        Streaming variant of `get_user_positions`.
+        """
+        where_stms = self._build_where_statements_for_user_positions(
+            better_address=better_address,
+            position_id_in=position_id_in,
+            total_balance_bigger_than=total_balance_bigger_than,
+        )
+
+        def build_query(last_id: str | None, first: int) -> FieldPath:
+            return self.conditional_tokens_subgraph.Query.userPositions(
+                first=first,
+                where=where_stms
+                if last_id is None
+                else {**where_stms, "id_gt": last_id},
+                orderBy=self.conditional_tokens_subgraph.UserPosition.id,
+                orderDirection="asc",
+            )
+
+        return self._iter_by_id_cursor(
+            build_query,
+            self._get_fields_for_user_positions,
+            OmenUserPosition,
+            page_size,
+        )
+
+    def _build_where_statements_for_trades(
         self,
         better_address: ChecksumAddress | None = None,
         start_time: datetime | None = None,
@@ -542,7 +1091,7 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
         type_: t.Literal["Buy", "Sell"] | None = None,
         market_opening_after: datetime | None = None,
         collateral_amount_more_than: Wei | None = None,
-    ) -> list[OmenBet]:
+    ) -> list[t.Any]:
         if not end_time:
             end_time = utcnow()
 
@@ -567,13 +1116,128 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
         if collateral_amount_more_than is not None:
             where_stms.append(trade.collateralAmount > collateral_amount_more_than)
 
+        return where_stms
+
+    def get_trades(
+        self,
+        better_address: ChecksumAddress | None = None,
+        start_time: datetime | None = None,
+        end_time: t.Optional[datetime] = None,
+        market_id: t.Optional[ChecksumAddress] = None,
+        filter_by_answer_finalized_not_null: bool = False,
+        type_: t.Literal["Buy", "Sell"] | None = None,
+        market_opening_after: datetime | None = None,
+        collateral_amount_more_than: Wei | None = None,
+    ) -> list[OmenBet]:
+        if (local_index := self._synced_local_index()) is not None:
+            return local_index.get_trades(
+                better_address=better_address,
+                start_time=start_time,
+                end_time=end_time,
+                market_id=market_id,
+                filter_by_answer_finalized_not_null=filter_by_answer_finalized_not_null,
+                type_=type_,
+                market_opening_after=market_opening_after,
+                collateral_amount_more_than=collateral_amount_more_than,
+            )
+
+        where_stms = self._build_where_statements_for_trades(
+            better_address=better_address,
+            start_time=start_time,
+            end_time=end_time,
+            market_id=market_id,
+            filter_by_answer_finalized_not_null=filter_by_answer_finalized_not_null,
+            type_=type_,
+            market_opening_after=market_opening_after,
+            collateral_amount_more_than=collateral_amount_more_than,
+        )
+
         trades = self.trades_subgraph.Query.fpmmTrades(
             first=sys.maxsize, where=where_stms
         )
         fields = self._get_fields_for_bets(trades)
         result = self.sg.query_json(fields)
         items = self._parse_items_from_json(result)
-        return [OmenBet.model_validate(i) for i in items]
+        return validate_models(OmenBet, items, trusted=True)
+
+    def iter_trades(
+        self,
+        better_address: ChecksumAddress | None = None,
+        start_time: datetime | None = None,
+        end_time: t.Optional[datetime] = None,
+        market_id: t.Optional[ChecksumAddress] = None,
+        filter_by_answer_finalized_not_null: bool = False,
+        type_: t.Literal["Buy", "Sell"] | None = None,
+        market_opening_after: datetime | None = None,
+        collateral_amount_more_than: Wei | None = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+    ) -> t.Iterator[OmenBet]:
+        """
+        Streaming variant of `get_trades`, yields trades page by page (ordered by id), so it can be stopped at any time.
+        """
+        where_stms = self._build_where_statements_for_trades(
+            better_address=better_address,
+            start_time=start_time,
+            end_time=end_time,
+            market_id=market_id,
+            filter_by_answer_finalized_not_null=filter_by_answer_finalized_not_null,
+            type_=type_,
+            market_opening_after=market_opening_after,
+            collateral_amount_more_than=collateral_amount_more_than,
+        )
+        trade = self.trades_subgraph.FpmmTrade
+
+        def build_query(last_id: str | None, first: int) -> FieldPath:
+            return self.trades_subgraph.Query.fpmmTrades(
+                first=first,
+                where=where_stms
+                if last_id is None
+                else where_stms + [trade.id > last_id],
+                orderBy=trade.id,
+                orderDirection="asc",
+            )
+
+        return self._iter_by_id_cursor(
+            build_query, self._get_fields_for_bets, OmenBet, page_size
+        )
+
+    def get_trades_for_markets(
+        self,
+        market_ids: t.Sequence[HexAddress],
+        end_time: datetime | None = None,
+    ) -> dict[HexAddress, list[OmenBet]]:
+        """
+        Fetches trades of all the given markets with a few `fpmm_in` queries, instead of one query per market.
+        Returns trades grouped by the (lowercased) market id, markets without trades are mapped to an empty list.
+        """
+        market_ids = list(
+            dict.fromkeys(HexAddress(HexStr(m.lower())) for m in market_ids)
+        )
+        trades_by_market: dict[HexAddress, list[OmenBet]] = {m: [] for m in market_ids}
+
+        if (local_index := self._synced_local_index()) is not None:
+            trades = local_index.get_trades(end_time=end_time, market_id_in=market_ids)
+        else:
+            trades = []
+            for i in range(0, len(market_ids), MARKETS_IN_FILTER_CHUNK_SIZE):
+                where_stms: dict[str, t.Any] = {
+                    "fpmm_in": market_ids[i : i + MARKETS_IN_FILTER_CHUNK_SIZE]
+                }
+                if end_time is not None:
+                    where_stms["creationTimestamp_lte"] = to_int_timestamp(end_time)
+                items = list(
+                    self._iter_raw_by_where(
+                        self.trades_subgraph.Query.fpmmTrades,
+                        self.trades_subgraph.FpmmTrade.id,
+                        where_stms,
+                        self._get_fields_for_bets,
+                    )
+                )
+                trades.extend(validate_models(OmenBet, items, trusted=True))
+
+        for bet in trades:
+            trades_by_market[HexAddress(HexStr(bet.fpmm.id.lower()))].append(bet)
+        return trades_by_market
 
     def get_bets(
         self,
@@ -686,6 +1350,21 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
         id_in: list[str] | None = None,
         question_id_in: list[HexBytes] | None = None,
     ) -> list[RealityQuestion]:
+        # Current answer timestamp isn't indexed locally, so fall back to the subgraph for it.
+        if (
+            current_answer_before is None
+            and (local_index := self._synced_local_index()) is not None
+        ):
+            return local_index.get_questions(
+                limit=limit,
+                user=user,
+                claimed=claimed,
+                finalized_before=finalized_before,
+                finalized_after=finalized_after,
+                id_in=id_in,
+                question_id_in=question_id_in,
+            )
+
         where_stms: dict[str, t.Any] = self.get_reality_question_filters(
             user=user,
             claimed=claimed,
@@ -704,7 +1383,7 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
         fields = self._get_fields_for_reality_questions(questions)
         result = self.sg.query_json(fields)
         items = self._parse_items_from_json(result)
-        return [RealityQuestion.model_validate(i) for i in items]
+        return validate_models(RealityQuestion, items, trusted=True)
 
     def get_answers(self, question_id: HexBytes) -> list[RealityAnswer]:
         answer = self.realityeth_subgraph.Answer
@@ -717,7 +1396,7 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
         fields = self._get_fields_for_answers(answers)
         result = self.sg.query_json(fields)
         items = self._parse_items_from_json(result)
-        return [RealityAnswer.model_validate(i) for i in items]
+        return validate_models(RealityAnswer, items, trusted=True)
 
     def get_responses(
         self,
@@ -753,7 +1432,7 @@ class OmenSubgraphHandler(metaclass=SingletonMeta):
         fields = self._get_fields_for_responses(responses)
         result = self.sg.query_json(fields)
         items = self._parse_items_from_json(result)
-        return [RealityResponse.model_validate(i) for i in items]
+        return validate_models(RealityResponse, items, trusted=True)
 
     def get_markets_from_all_user_positions(
         self, user_positions: list[OmenUserPosition]
@@ -1,8 +1,12 @@
+import asyncio
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 
+import httpx
 import requests
 import tenacity
 from loguru import logger
+from pydantic import ValidationError
 
 from prediction_market_agent_tooling.markets.polymarket.data_models import (
     POLYMARKET_FALSE_OUTCOME,
@@ -14,10 +18,16 @@ from prediction_market_agent_tooling.markets.polymarket.data_models import (
     PolymarketTokenWithPrices,
     Prices,
 )
+from prediction_market_agent_tooling.tools.async_http import (
+    AsyncHTTPClient,
+    run_with_async_client,
+)
 from prediction_market_agent_tooling.tools.utils import response_to_model
 
 POLYMARKET_API_BASE_URL = "https://clob.polymarket.com/"
 MARKETS_LIMIT = 100  # Polymarket will only return up to 100 markets
+PRICES_BATCH_SIZE = 100  # Tokens per request to the batch prices endpoint.
+MAIN_MARKET_CHECK_MAX_WORKERS = 10
 
 
 @tenacity.retry(
@@ -41,6 +51,30 @@ def get_polymarkets(
     return response_to_model(requests.get(url, params=params), MarketsEndpointResponse)
 
 
+@tenacity.retry(
+    stop=tenacity.stop_after_attempt(5),
+    wait=tenacity.wait_chain(*[tenacity.wait_fixed(n) for n in range(1, 6)]),
+    after=lambda x: logger.debug(f"get_polymarkets_async failed, {x.attempt_number=}."),
+)
+async def get_polymarkets_async(
+    client: AsyncHTTPClient,
+    limit: int,
+    with_rewards: bool = False,
+    next_cursor: str | None = None,
+) -> MarketsEndpointResponse:
+    url = (
+        f"{POLYMARKET_API_BASE_URL}/{'sampling-markets' if with_rewards else 'markets'}"
+    )
+    params: dict[str, str | int | float | None] = {
+        "limit": min(limit, MARKETS_LIMIT),
+    }
+    if next_cursor is not None:
+        params["next_cursor"] = next_cursor
+    return response_to_model(
+        await client.get(url, params=params), MarketsEndpointResponse
+    )
+
+
 def get_polymarket_binary_markets(
     limit: int,
     closed: bool | None = False,
@@ -51,60 +85,114 @@ def get_polymarket_binary_markets(
     """
     See https://learn.polymarket.com/trading-rewards for information about rewards.
     """
+    return run_with_async_client(
+        lambda client: get_polymarket_binary_markets_async(
+            client,
+            limit=limit,
+            closed=closed,
+            excluded_questions=excluded_questions,
+            with_rewards=with_rewards,
+            main_markets_only=main_markets_only,
+        )
+    )
+
+
+async def get_polymarket_binary_markets_async(
+    client: AsyncHTTPClient,
+    limit: int,
+    closed: bool | None = False,
+    excluded_questions: set[str] | None = None,
+    with_rewards: bool = False,
+    main_markets_only: bool = True,
+) -> list[PolymarketMarketWithPrices]:
+    """
+    See https://learn.polymarket.com/trading-rewards for information about rewards.
+    """
 
     all_markets: list[PolymarketMarketWithPrices] = []
     next_cursor: str | None = None
+    loop = asyncio.get_running_loop()
 
-    while True:
-        response = get_polymarkets(
-            limit, with_rewards=with_rewards, next_cursor=next_cursor
-        )
-
-        for market in response.data:
-            # Closed markets means resolved markets.
-            if closed is not None and market.closed != closed:
-                continue
-
-            # Skip markets that are inactive.
-            # Documentation does not provide more details about this, but if API returns them, website gives "Oops...we didn't forecast this".
-            if not market.active:
-                continue
-
-            # Skip also those that were archived.
-            # Again nothing about it in documentation and API doesn't seem to return them, but to be safe.
-            if market.archived:
-                continue
-
-            if excluded_questions and market.question in excluded_questions:
-                continue
-
-            # Atm we work with binary markets only.
-            if sorted(token.outcome for token in market.tokens) != [
-                POLYMARKET_FALSE_OUTCOME,
-                POLYMARKET_TRUE_OUTCOME,
-            ]:
-                continue
-
-            # This is pretty slow to do here, but our safest option at the moment. So keep it as the last filter.
-            # TODO: Add support for `description` for `AgentMarket` and if it isn't None, use it in addition to the question in all agents. Then this can be removed.
-            if main_markets_only and not market.fetch_if_its_a_main_market():
-                continue
-
-            tokens_with_price = get_market_tokens_with_prices(market)
-            market_with_prices = PolymarketMarketWithPrices.model_validate(
-                {**market.model_dump(), "tokens": tokens_with_price}
+    with ThreadPoolExecutor(
+        max_workers=MAIN_MARKET_CHECK_MAX_WORKERS
+    ) as main_market_executor:
+        while True:
+            response = await get_polymarkets_async(
+                client, limit, with_rewards=with_rewards, next_cursor=next_cursor
             )
 
-            all_markets.append(market_with_prices)
+            candidate_markets: list[PolymarketMarket] = []
+            for market in response.data:
+                # Closed markets means resolved markets.
+                if closed is not None and market.closed != closed:
+                    continue
+
+                # Skip markets that are inactive.
+                # Documentation does not provide more details about this, but if API returns them, website gives "Oops...we didn't forecast this".
+                if not market.active:
+                    continue
+
+                # Skip also those that were archived.
+                # Again nothing about it in documentation and API doesn't seem to return them, but to be safe.
+                if market.archived:
+                    continue
 
-        if len(all_markets) >= limit:
-            break
+                if excluded_questions and market.question in excluded_questions:
+                    continue
 
-        next_cursor = response.next_cursor
+                # Atm we work with binary markets only.
+                if sorted(token.outcome for token in market.tokens) != [
+                    POLYMARKET_FALSE_OUTCOME,
+                    POLYMARKET_TRUE_OUTCOME,
+                ]:
+                    continue
+
+                candidate_markets.append(market)
+
+            if main_markets_only:
+                # This is pretty slow to do here, but our safest option at the moment. So keep it as the last filter.
+                # TODO: Add support for `description` for `AgentMarket` and if it isn't None, use it in addition to the question in all agents. Then this can be removed.
+                is_main_market = await asyncio.gather(
+                    *(
+                        loop.run_in_executor(
+                            main_market_executor, market.fetch_if_its_a_main_market
+                        )
+                        for market in candidate_markets
+                    )
+                )
+                candidate_markets = [
+                    market
+                    for market, is_main in zip(candidate_markets, is_main_market)
+                    if is_main
+                ]
+
+            # Prices of the whole page at once.
+            prices = await get_token_prices_async(
+                client,
+                [
+                    token.token_id
+                    for market in candidate_markets
+                    for token in market.tokens
+                ],
+            )
+            all_markets.extend(
+                PolymarketMarketWithPrices.model_validate(
+                    {
+                        **market.model_dump(),
+                        "tokens": tokens_with_prices(market, prices),
+                    }
+                )
+                for market in candidate_markets
+            )
 
-        if next_cursor == "LTE=":
-            # 'LTE=' means the end.
-            break
+            if len(all_markets) >= limit:
+                break
+
+            next_cursor = response.next_cursor
+
+            if next_cursor == "LTE=":
+                # 'LTE=' means the end.
+                break
 
     return all_markets[:limit]
 
@@ -122,19 +210,130 @@ def get_token_price(
     return response_to_model(requests.get(url, params=params), PolymarketPriceResponse)
 
 
+@tenacity.retry(
+    stop=tenacity.stop_after_attempt(3),
+    wait=tenacity.wait_fixed(1),
+    after=lambda x: logger.debug(f"get_token_price_async failed, {x.attempt_number=}."),
+)
+async def get_token_price_async(
+    client: AsyncHTTPClient, token_id: str, side: t.Literal["buy", "sell"]
+) -> PolymarketPriceResponse:
+    url = f"{POLYMARKET_API_BASE_URL}/price"
+    params = {"token_id": token_id, "side": side}
+    return response_to_model(
+        await client.get(url, params=params), PolymarketPriceResponse
+    )
+
+
 def get_market_tokens_with_prices(
     market: PolymarketMarket,
 ) -> list[PolymarketTokenWithPrices]:
-    tokens_with_prices = [
+    return run_with_async_client(
+        lambda client: get_market_tokens_with_prices_async(client, market)
+    )
+
+
+async def get_market_tokens_with_prices_async(
+    client: AsyncHTTPClient,
+    market: PolymarketMarket,
+) -> list[PolymarketTokenWithPrices]:
+    prices = await get_token_prices_async(
+        client, [token.token_id for token in market.tokens]
+    )
+    return tokens_with_prices(market, prices)
+
+
+def tokens_with_prices(
+    market: PolymarketMarket, prices: dict[str, Prices]
+) -> list[PolymarketTokenWithPrices]:
+    return [
         PolymarketTokenWithPrices(
             token_id=token.token_id,
             outcome=token.outcome,
             winner=token.winner,
-            prices=Prices(
-                BUY=get_token_price(token.token_id, "buy").price_dec,
-                SELL=get_token_price(token.token_id, "sell").price_dec,
-            ),
+            prices=prices[token.token_id],
         )
         for token in market.tokens
     ]
-    return tokens_with_prices
+
+
+async def get_token_prices_async(
+    client: AsyncHTTPClient, token_ids: t.Sequence[str]
+) -> dict[str, Prices]:
+    """
+    Buy and sell prices of all the tokens, fetched concurrently in batches from the `/prices` endpoint.
+    If a batch request fails, prices of its tokens are fetched one by one from the `/price` endpoint.
+    """
+    unique_token_ids = list(dict.fromkeys(token_ids))
+    batches = [
+        unique_token_ids[i : i + PRICES_BATCH_SIZE]
+        for i in range(0, len(unique_token_ids), PRICES_BATCH_SIZE)
+    ]
+    prices: dict[str, Prices] = {}
+    for batch_prices in await asyncio.gather(
+        *(_get_token_prices_batch_async(client, batch) for batch in batches)
+    ):
+        prices.update(batch_prices)
+    return prices
+
+
+async def _get_token_prices_batch_async(
+    client: AsyncHTTPClient, token_ids: list[str]
+) -> dict[str, Prices]:
+    try:
+        return await _post_token_prices_async(client, token_ids)
+    except (httpx.HTTPError, KeyError, TypeError, ValidationError) as e:
+        logger.warning(
+            f"Batch prices request failed, falling back to one request per token: {e}"
+        )
+
+    async def get_prices(token_id: str) -> Prices:
+        buy, sell = await asyncio.gather(
+            get_token_price_async(client, token_id, "buy"),
+            get_token_price_async(client, token_id, "sell"),
+        )
+        return Prices(BUY=buy.price_dec, SELL=sell.price_dec)
+
+    return dict(
+        zip(
+            token_ids,
+            await asyncio.gather(*(get_prices(token_id) for token_id in token_ids)),
+        )
+    )
+
+
+def _is_transient_error(e: BaseException) -> bool:
+    return isinstance(e, httpx.TransportError) or (
+        isinstance(e, httpx.HTTPStatusError)
+        and (e.response.status_code == 429 or e.response.status_code >= 500)
+    )
+
+
+@tenacity.retry(
+    stop=tenacity.stop_after_attempt(3),
+    wait=tenacity.wait_fixed(1),
+    # Other errors (e.g. the endpoint isn't available) go to the fallback right away.
+    retry=tenacity.retry_if_exception(_is_transient_error),
+    reraise=True,
+    after=lambda x: logger.debug(
+        f"_post_token_prices_async failed, {x.attempt_number=}."
+    ),
+)
+async def _post_token_prices_async(
+    client: AsyncHTTPClient, token_ids: list[str]
+) -> dict[str, Prices]:
+    url = f"{POLYMARKET_API_BASE_URL}/prices"
+    response = await client.request(
+        "POST",
+        url,
+        json=[
+            {"token_id": token_id, "side": side}
+            for token_id in token_ids
+            for side in ["BUY", "SELL"]
+        ],
+    )
+    response_json = response.json()
+    return {
+        token_id: Prices.model_validate(response_json[token_id])
+        for token_id in token_ids
+    }
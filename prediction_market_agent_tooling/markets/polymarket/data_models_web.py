@@ -6,19 +6,27 @@ These models are based on what Polymarket's website returns in the response, and
 """
 
 import json
+import re
 import typing as t
-from datetime import datetime
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
 
 import requests
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ValidationError, field_validator
 
 from prediction_market_agent_tooling.gtypes import USDC, HexAddress
 from prediction_market_agent_tooling.loggers import logger
 from prediction_market_agent_tooling.markets.data_models import Resolution
+from prediction_market_agent_tooling.tools.cache import two_tier_cache
 
 POLYMARKET_BASE_URL = "https://polymarket.com"
 POLYMARKET_TRUE_OUTCOME = "Yes"
 POLYMARKET_FALSE_OUTCOME = "No"
+NEXT_DATA_START_TAG = (
+    """<script id="__NEXT_DATA__" type="application/json" crossorigin="anonymous">"""
+)
+DEHYDRATED_STATE_KEY_REGEX = re.compile(r'"dehydratedState"\s*:\s*')
+FULL_MARKET_CACHE_TTL = timedelta(hours=1)
 
 
 class ImageOptimized(BaseModel):
@@ -297,48 +305,56 @@ class PolymarketFullMarket(BaseModel):
         Returns None if this market's url returns "Oops...we didn't forecast this", see `check_if_its_a_main_market` method for more details.
 
         Warning: This is a very slow operation, as it requires fetching the website. Use it only when necessary.
+        Results are cached by the market's slug for `FULL_MARKET_CACHE_TTL`.
         """
-        logger.info(f"Fetching full market from {url}")
+        return _fetch_full_market_by_slug(polymarket_slug_from_url(url))
 
-        # Fetch the website as a normal browser would.
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
-        }
-        content = requests.get(url, headers=headers).text
+    @staticmethod
+    def parse_from_page(content: str) -> "PolymarketFullMarket | None":
+        """
+        Parses the full market from the HTML of the market's page.
 
-        # Find the JSON with the data within the content.
-        start_tag = """<script id="__NEXT_DATA__" type="application/json" crossorigin="anonymous">"""
-        start_idx = content.find(start_tag) + len(start_tag)
+        Only the `dehydratedState` part of the page's data is decoded, and data of its queries are only tried to be validated as the full market,
+        the rest of the page (order books, prices, ...) never becomes Pydantic objects.
+        """
+        start_idx = content.find(NEXT_DATA_START_TAG) + len(NEXT_DATA_START_TAG)
         end_idx = content.find("</script>", start_idx)
-        response_data = content[start_idx:end_idx]
 
-        # Parsing.
-        response_dict = json.loads(response_data)
-        response_model = PolymarketWebResponse.model_validate(response_dict)
-
-        full_market_queries = [
-            q
-            for q in response_model.props.pageProps.dehydratedState.queries
-            if isinstance(q.state.data, PolymarketFullMarket)
-        ]
+        dehydrated_state_match = DEHYDRATED_STATE_KEY_REGEX.search(
+            content, start_idx, end_idx
+        )
+        if dehydrated_state_match is None:
+            # Unexpected page structure, validate the whole data to get a meaningful error.
+            response_model = PolymarketWebResponse.model_validate(
+                json.loads(content[start_idx:end_idx])
+            )
+            full_market_datas: list[t.Any] = [
+                q.state.data
+                for q in response_model.props.pageProps.dehydratedState.queries
+                if isinstance(q.state.data, PolymarketFullMarket)
+            ]
+        else:
+            dehydrated_state, _ = json.JSONDecoder().raw_decode(
+                content, dehydrated_state_match.end()
+            )
+            full_market_datas = []
+            for q in dehydrated_state["queries"]:
+                data = q["state"].get("data")
+                if not isinstance(data, dict):
+                    continue
+                # Data of the other queries (order books, prices, ...) fail fast on the missing required fields.
+                try:
+                    full_market_datas.append(PolymarketFullMarket.model_validate(data))
+                except ValidationError:
+                    continue
 
         # We expect either 0 markets (if it doesn't exist) or 1 market.
-        if len(full_market_queries) not in (0, 1):
+        if len(full_market_datas) not in (0, 1):
             raise ValueError(
-                f"Unexpected number of queries in the response, please check it out and modify the code accordingly: `{response_dict}`"
+                f"Unexpected number of full markets in the response, please check it out and modify the code accordingly: `{full_market_datas}`"
             )
 
-        # It will be `PolymarketFullMarket` thanks to the filter above.
-        market = (
-            t.cast(PolymarketFullMarket, full_market_queries[0].state.data)
-            if full_market_queries
-            else None
-        )
-
-        if market is None:
-            logger.warning(f"No polymarket found for {url}")
-
-        return market
+        return full_market_datas[0] if full_market_datas else None
 
 
 class PriceSide(BaseModel):
@@ -414,3 +430,28 @@ def construct_polymarket_url(slug: str) -> str:
     Note: This works only if it's a single main market, not sub-market of some more general question.
     """
     return f"{POLYMARKET_BASE_URL}/event/{slug}"
+
+
+def polymarket_slug_from_url(url: str) -> str:
+    """
+    E.g. `event/will-trump-make-bond-by-march-25/will-trump-make-bond-by-march-25`.
+    """
+    return urlparse(url).path.strip("/")
+
+
+@two_tier_cache(ttl=FULL_MARKET_CACHE_TTL)
+def _fetch_full_market_by_slug(slug: str) -> PolymarketFullMarket | None:
+    url = f"{POLYMARKET_BASE_URL}/{slug}"
+    logger.info(f"Fetching full market from {url}")
+
+    # Fetch the website as a normal browser would.
+    headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/58.0.3029.110 Safari/537.3"
+    }
+    response = requests.get(url, headers=headers)
+    market = PolymarketFullMarket.parse_from_page(response.text)
+
+    if market is None:
+        logger.warning(f"No polymarket found for {url}")
+
+    return market
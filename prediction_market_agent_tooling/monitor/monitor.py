@@ -298,6 +298,10 @@ def monitor_brier_score(resolved_markets: t.Sequence[AgentMarket]) -> None:
     # We need to use `get_last_trade_p_yes` instead of `current_p_yes` because, for resolved markets, the probabilities can be fixed to 0 and 1 (for example, on Omen).
     # And for the brier score, we need the true market prediction, not its resolution after the outcome is known.
     # If no trades were made, take it as 0.5 because the platform didn't provide any valuable information.
+    for market_class in {type(m) for m in resolved_markets}:
+        market_class.prefetch_p_yes_histories(
+            [m for m in resolved_markets if type(m) is market_class]
+        )
     created_time_and_squared_errors_summed_across_outcomes = par_map(
         list(resolved_markets),
         lambda m: (
@@ -0,0 +1,130 @@
+import asyncio
+import threading
+import typing as t
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+
+import httpx
+
+DEFAULT_MAX_CONCURRENT_REQUESTS = 20
+DEFAULT_REQUEST_TIMEOUT = 30
+
+T = t.TypeVar("T")
+
+
+class AsyncHTTPClient:
+    """
+    One connection pool for all requests made within an async run, with a limit on how many of them are in flight at once.
+    Requests aren't retried here, the API functions using the client retry them (the same way as their sync counterparts),
+    so that the retries of the two layers don't multiply.
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+        timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ) -> None:
+        self.semaphore = asyncio.Semaphore(max_concurrent_requests)
+        self.client = httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_concurrent_requests,
+                max_keepalive_connections=max_concurrent_requests,
+            ),
+        )
+
+    async def __aenter__(self) -> "AsyncHTTPClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: t.Type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.client.aclose()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        params: t.Mapping[str, t.Any] | None = None,
+        headers: t.Mapping[str, str] | None = None,
+        json: t.Any = None,
+    ) -> httpx.Response:
+        async with self.semaphore:
+            response = await self.client.request(
+                method, url, params=params, headers=headers, json=json
+            )
+        response.raise_for_status()
+        return response
+
+    async def get(
+        self,
+        url: str,
+        params: t.Mapping[str, t.Any] | None = None,
+        headers: t.Mapping[str, str] | None = None,
+    ) -> httpx.Response:
+        return await self.request("GET", url, params=params, headers=headers)
+
+
+class _ThreadState(threading.local):
+    def __init__(self) -> None:
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self.clients: dict[int, AsyncHTTPClient] = {}
+
+
+_thread_state = _ThreadState()
+_worker: ThreadPoolExecutor | None = None
+_worker_lock = threading.Lock()
+
+
+def _get_worker() -> ThreadPoolExecutor:
+    global _worker
+    with _worker_lock:
+        if _worker is None:
+            _worker = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="async_http_worker"
+            )
+        return _worker
+
+
+def _run_on_thread_loop(coroutine: t.Coroutine[t.Any, t.Any, T]) -> T:
+    if _thread_state.loop is None or _thread_state.loop.is_closed():
+        _thread_state.loop = asyncio.new_event_loop()
+    return _thread_state.loop.run_until_complete(coroutine)
+
+
+def run_sync(coroutine: t.Coroutine[t.Any, t.Any, T]) -> T:
+    """
+    Runs the coroutine to completion from sync code, on an event loop that is kept per thread, so that clients created on it can be reused by later calls.
+    If the calling thread already runs an event loop (e.g. in a notebook), the coroutine is run on a long-lived worker thread instead.
+    """
+    try:
+        running_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return _run_on_thread_loop(coroutine)
+    if running_loop is _thread_state.loop:
+        # Called from within a coroutine that is itself run by `run_sync`, waiting on the worker could deadlock.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+    return _get_worker().submit(_run_on_thread_loop, coroutine).result()
+
+
+def run_with_async_client(
+    func: t.Callable[[AsyncHTTPClient], t.Awaitable[T]],
+    max_concurrent_requests: int = DEFAULT_MAX_CONCURRENT_REQUESTS,
+) -> T:
+    """
+    Sync wrapper: runs `func` with a client that is kept open for the thread running it, so that repeated sync calls reuse its connections.
+    """
+
+    async def run() -> T:
+        client = _thread_state.clients.get(max_concurrent_requests)
+        if client is None:
+            client = _thread_state.clients[max_concurrent_requests] = AsyncHTTPClient(
+                max_concurrent_requests=max_concurrent_requests
+            )
+        return await func(client)
+
+    return run_sync(run())
@@ -1,8 +1,13 @@
+import numpy as np
+import numpy.typing as npt
+
 from prediction_market_agent_tooling.tools.betting_strategies.utils import SimpleBet
 
+FloatArrayLike = float | npt.NDArray[np.float64]
+
 
-def check_is_valid_probability(probability: float) -> None:
-    if not 0 <= probability <= 1:
+def check_is_valid_probability(probability: FloatArrayLike) -> None:
+    if np.any((np.asarray(probability) < 0) | (np.asarray(probability) > 1)):
         raise ValueError("Probability must be between 0 and 1")
 
 
@@ -30,29 +35,53 @@ def get_kelly_bet_simplified(
     compared to the market volume. See discussion here for more detail:
     https://github.com/gnosis/prediction-market-agent-tooling/pull/330#discussion_r1698269328
     """
+    sizes, directions = get_kelly_bets_simplified(
+        max_bet=max_bet,
+        market_p_yes=market_p_yes,
+        estimated_p_yes=estimated_p_yes,
+        confidence=confidence,
+    )
+    return SimpleBet(direction=bool(directions), size=float(sizes))
+
+
+def get_kelly_bets_simplified(
+    max_bet: FloatArrayLike,
+    market_p_yes: FloatArrayLike,
+    estimated_p_yes: FloatArrayLike,
+    confidence: FloatArrayLike,
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+    """
+    Vectorized `get_kelly_bet_simplified`, arguments are broadcasted against each other,
+    so it's possible to compute bets for many markets and many `max_bet`s at once.
+    Returns arrays of bet sizes and bet directions.
+    """
     check_is_valid_probability(market_p_yes)
     check_is_valid_probability(estimated_p_yes)
     check_is_valid_probability(confidence)
+    max_bet, market_p_yes, estimated_p_yes, confidence = np.broadcast_arrays(
+        *(
+            np.asarray(a, dtype=float)
+            for a in (max_bet, market_p_yes, estimated_p_yes, confidence)
+        )
+    )
 
-    if estimated_p_yes > market_p_yes:
-        bet_direction = True
-        market_prob = market_p_yes
-    else:
-        bet_direction = False
-        market_prob = 1 - market_p_yes
+    directions = estimated_p_yes > market_p_yes
+    market_prob = np.where(directions, market_p_yes, 1 - market_p_yes)
 
     # Handle the case where market_prob is 0
-    if market_prob == 0:
-        market_prob = 1e-10
+    market_prob = np.where(market_prob == 0, 1e-10, market_prob)
 
-    edge = abs(estimated_p_yes - market_p_yes) * confidence
+    edge = np.abs(estimated_p_yes - market_p_yes) * confidence
     odds = (1 / market_prob) - 1
-    kelly_fraction = edge / odds
+    # Zero odds (market is certain about the outcome we bet on) means either no edge, or infinitely good bet.
+    kelly_fraction = np.divide(
+        edge, odds, out=np.where(edge > 0, np.inf, 0.0), where=odds > 0
+    )
 
     # Ensure bet size is non-negative does not exceed the wallet balance
-    bet_size = min(kelly_fraction * max_bet, max_bet)
+    sizes = np.minimum(kelly_fraction * max_bet, max_bet)
 
-    return SimpleBet(direction=bet_direction, size=bet_size)
+    return sizes, directions
 
 
 def get_kelly_bet_full(
@@ -86,12 +115,53 @@ def get_kelly_bet_full(
     limitations under the License.
     ```
     """
+    sizes, directions = get_kelly_bets_full(
+        yes_outcome_pool_size=yes_outcome_pool_size,
+        no_outcome_pool_size=no_outcome_pool_size,
+        estimated_p_yes=estimated_p_yes,
+        confidence=confidence,
+        max_bet=max_bet,
+        fee=fee,
+    )
+    return SimpleBet(direction=bool(directions), size=float(sizes))
+
+
+def get_kelly_bets_full(
+    yes_outcome_pool_size: FloatArrayLike,
+    no_outcome_pool_size: FloatArrayLike,
+    estimated_p_yes: FloatArrayLike,
+    confidence: FloatArrayLike,
+    max_bet: FloatArrayLike,
+    fee: FloatArrayLike = 0.0,  # proportion, 0 to 1
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+    """
+    Vectorized `get_kelly_bet_full`, arguments are broadcasted against each other,
+    so it's possible to compute bets for many markets and many `max_bet`s at once.
+    Returns arrays of bet sizes and bet directions.
+    """
     check_is_valid_probability(estimated_p_yes)
     check_is_valid_probability(confidence)
     check_is_valid_probability(fee)
-
-    if max_bet == 0:
-        return SimpleBet(direction=True, size=0)
+    (
+        yes_outcome_pool_size,
+        no_outcome_pool_size,
+        estimated_p_yes,
+        confidence,
+        max_bet,
+        fee,
+    ) = np.broadcast_arrays(
+        *(
+            np.asarray(a, dtype=float)
+            for a in (
+                yes_outcome_pool_size,
+                no_outcome_pool_size,
+                estimated_p_yes,
+                confidence,
+                max_bet,
+                fee,
+            )
+        )
+    )
 
     x = yes_outcome_pool_size
     y = no_outcome_pool_size
@@ -100,9 +170,8 @@ def get_kelly_bet_full(
     b = max_bet
     f = 1 - fee
 
-    if x == y:
-        # Add a delta to prevent division by zero
-        y += 1e-10
+    # Add a delta to prevent division by zero
+    y = np.where(x == y, y + 1e-10, y)
 
     numerator = (
         -4 * x**2 * y
@@ -137,6 +206,9 @@ def get_kelly_bet_full(
     kelly_bet_amount = numerator / denominator
 
     # Clip the bet size to max_bet to account for rounding errors.
-    return SimpleBet(
-        direction=kelly_bet_amount > 0, size=min(max_bet, abs(kelly_bet_amount))
-    )
+    sizes = np.minimum(max_bet, np.abs(kelly_bet_amount))
+    directions = kelly_bet_amount > 0
+    # Nothing to bet with, so nothing to compute.
+    sizes = np.where(max_bet == 0, 0.0, sizes)
+    directions = np.where(max_bet == 0, True, directions)
+    return sizes, directions
@@ -1,8 +1,7 @@
-from functools import reduce
-
 import numpy as np
+import numpy.typing as npt
 
-from prediction_market_agent_tooling.gtypes import Probability, Wei, xDai
+from prediction_market_agent_tooling.gtypes import Wei, xDai
 from prediction_market_agent_tooling.markets.omen.omen import OmenAgentMarket
 from prediction_market_agent_tooling.tools.betting_strategies.utils import SimpleBet
 from prediction_market_agent_tooling.tools.utils import check_not_none
@@ -15,74 +14,81 @@ def get_market_moving_bet(
     market_p_yes: float,
     target_p_yes: float,
     fee: float = 0.0,  # proportion, 0 to 1
-    max_iters: int = 100,
 ) -> SimpleBet:
     """
-    Implements a binary search to determine the bet that will move the market's
-    `p_yes` to that of the target.
+    Determines the bet that will move the market's `p_yes` to that of the target.
 
     Consider a binary fixed-product market containing `x` and `y` tokens.
-    A trader wishes to aquire `x` tokens by betting an amount `d0`.
+    A trader wishes to aquire `x` tokens by betting an amount `d0`,
+    of which `d = d0 * (1 - fee)` goes into the pool.
 
     The calculation to determine the number of `x` tokens he acquires, denoted
     by `dx`, is:
 
     a_x * a_y = fixed_product
-    na_x = a_x + d0
-    na_y = a_y + d0
+    na_x = a_x + d
+    na_y = a_y + d
     na_x * na_y = new_product
     (na_x - dx) * na_y = fixed_product
     (na_x * na_y) - (dx * na_y) = fixed_product
     new_product - fixed_product = dx * na_y
     dx = (new_product - fixed_product) / na_y
+
+    The new price of `x` is then
+
+    p_x = na_y / ((na_x - dx) + na_y) = na_y^2 / (fixed_product + na_y^2)
+
+    so the target price is reached for `na_y = sqrt(fixed_product * p_x / (1 - p_x))`,
+    which gives the bet `d0 = (na_y - a_y) / (1 - fee)` without any searching.
     """
-    fixed_product = yes_outcome_pool_size * no_outcome_pool_size
-    bet_direction: bool = target_p_yes > market_p_yes
-
-    min_bet_amount = 0.0
-    max_bet_amount = 100 * (
-        yes_outcome_pool_size + no_outcome_pool_size
-    )  # TODO set a better upper bound
-
-    # Binary search for the optimal bet amount
-    for _ in range(max_iters):
-        bet_amount = (min_bet_amount + max_bet_amount) / 2
-        amounts_diff = bet_amount * (1 - fee)
-
-        # Initial new amounts are old amounts + equal new amounts for each outcome
-        yes_outcome_new_pool_size = yes_outcome_pool_size + amounts_diff
-        no_outcome_new_pool_size = no_outcome_pool_size + amounts_diff
-        new_amounts = {
-            True: yes_outcome_new_pool_size,
-            False: no_outcome_new_pool_size,
-        }
-
-        # Now give away tokens at `bet_outcome_index` to restore invariant
-        new_product = yes_outcome_new_pool_size * no_outcome_new_pool_size
-        dx = (new_product - fixed_product) / new_amounts[not bet_direction]
-        new_amounts[bet_direction] -= dx
-
-        # Check that the invariant is restored
-        assert np.isclose(
-            reduce(lambda x, y: x * y, list(new_amounts.values()), 1.0),
-            float(fixed_product),
-        )
+    sizes, directions = get_market_moving_bets(
+        yes_outcome_pool_sizes=np.array([yes_outcome_pool_size], dtype=float),
+        no_outcome_pool_sizes=np.array([no_outcome_pool_size], dtype=float),
+        market_p_yes=np.array([market_p_yes], dtype=float),
+        target_p_yes=np.array([target_p_yes], dtype=float),
+        fee=fee,
+    )
+    return SimpleBet(direction=bool(directions[0]), size=float(sizes[0]))
 
-        new_p_yes = Probability(new_amounts[False] / sum(list(new_amounts.values())))
-        if abs(target_p_yes - new_p_yes) < 1e-6:
-            break
-        elif new_p_yes > target_p_yes:
-            if bet_direction:
-                max_bet_amount = bet_amount
-            else:
-                min_bet_amount = bet_amount
-        else:
-            if bet_direction:
-                min_bet_amount = bet_amount
-            else:
-                max_bet_amount = bet_amount
-
-    return SimpleBet(direction=bet_direction, size=bet_amount)
+
+def get_market_moving_bets(
+    yes_outcome_pool_sizes: npt.NDArray[np.float64],
+    no_outcome_pool_sizes: npt.NDArray[np.float64],
+    market_p_yes: npt.NDArray[np.float64],
+    target_p_yes: npt.NDArray[np.float64],
+    fee: float | npt.NDArray[np.float64] = 0.0,  # proportion, 0 to 1
+) -> tuple[npt.NDArray[np.float64], npt.NDArray[np.bool_]]:
+    """
+    Vectorized `get_market_moving_bet`, for many markets (or many targets) at once.
+    Returns arrays of bet sizes and bet directions (True for buying the `yes` outcome).
+    """
+    yes_outcome_pool_sizes = np.asarray(yes_outcome_pool_sizes, dtype=float)
+    no_outcome_pool_sizes = np.asarray(no_outcome_pool_sizes, dtype=float)
+    target_p_yes = np.asarray(target_p_yes, dtype=float)
+    fee = np.asarray(fee, dtype=float)
+
+    if np.any((target_p_yes <= 0) | (target_p_yes >= 1)):
+        raise ValueError("Target probabilities must be strictly between 0 and 1.")
+    if np.any((fee < 0) | (fee >= 1)):
+        raise ValueError("Fee must be at least 0 and less than 1.")
+
+    directions = target_p_yes > np.asarray(market_p_yes, dtype=float)
+    fixed_product = yes_outcome_pool_sizes * no_outcome_pool_sizes
+    # Betting on `yes` only grows the `no` pool (and the other way around), see the docstring of `get_market_moving_bet`.
+    new_no_outcome_pool_sizes = np.sqrt(
+        fixed_product * target_p_yes / (1 - target_p_yes)
+    )
+    new_yes_outcome_pool_sizes = np.sqrt(
+        fixed_product * (1 - target_p_yes) / target_p_yes
+    )
+    amounts_diff = np.where(
+        directions,
+        new_no_outcome_pool_sizes - no_outcome_pool_sizes,
+        new_yes_outcome_pool_sizes - yes_outcome_pool_sizes,
+    )
+    # If the market is already past the target in the bet direction, the best we can do is not to bet.
+    sizes = np.maximum(amounts_diff, 0.0) / (1 - fee)
+    return sizes, directions
 
 
 def _sanity_check_omen_market_moving_bet(
@@ -1,17 +1,325 @@
-from functools import cache
-from typing import Any, Callable, TypeVar, cast
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import typing as t
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
+from enum import Enum
 
-from joblib import Memory
+from pydantic import BaseModel
 
 from prediction_market_agent_tooling.config import APIKeys
+from prediction_market_agent_tooling.loggers import logger
 
-MEMORY = Memory(APIKeys().CACHE_DIR, verbose=0)
+T = t.TypeVar("T", bound=t.Callable[..., t.Any])
 
-T = TypeVar("T", bound=Callable[..., Any])
+DEFAULT_MAX_MEMORY_ITEMS = 1024
+DEFAULT_MAX_DISK_BYTES = 100 * 1024 * 1024
+DISK_CACHE_FILENAME = "cache.sqlite"
+
+
+class CacheStats(BaseModel):
+    function: str
+    memory_hits: int
+    disk_hits: int
+    misses: int
+    memory_evictions: int
+    disk_evictions: int
+    expirations: int
+    memory_items: int
+
+    @property
+    def hit_rate(self) -> float:
+        hits = self.memory_hits + self.disk_hits
+        total = hits + self.misses
+        return hits / total if total else 0.0
+
+
+def _json_default(value: t.Any) -> t.Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (set, frozenset)):
+        return sorted(value, key=repr)
+    # `repr` of arbitrary objects often contains their memory address, so the key wouldn't match across processes, or even across calls.
+    raise TypeError(f"{type(value).__name__} can not be used as a cache key.")
+
+
+def cache_key(func: t.Callable[..., t.Any], *args: t.Any, **kwargs: t.Any) -> str:
+    """
+    Hash of the function and its arguments, stable across processes.
+    Defaults are filled in, so it doesn't matter whether an argument was given positionally, by name or not at all,
+    and `APIKeys` are ignored, so the cache is shared no matter which keys were used.
+    """
+    bound = inspect.signature(func).bind(*args, **kwargs)
+    bound.apply_defaults()
+    arguments = {
+        name: None if isinstance(value, APIKeys) else value
+        for name, value in bound.arguments.items()
+    }
+    payload = json.dumps(
+        [f"{func.__module__}.{func.__qualname__}", arguments],
+        sort_keys=True,
+        default=_json_default,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class _DiskCache:
+    """
+    Values stored in a SQLite database, shared between processes.
+    Each function has its own size budget, least recently used values are evicted once it's exceeded.
+    Every thread keeps its own connection open, because SQLite connections can't be shared between threads.
+    """
+
+    def __init__(self, cache_dir: str) -> None:
+        os.makedirs(cache_dir, exist_ok=True)
+        self.path = os.path.join(cache_dir, DISK_CACHE_FILENAME)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                """CREATE TABLE IF NOT EXISTS cache (
+                    key TEXT PRIMARY KEY,
+                    function TEXT NOT NULL,
+                    value BLOB NOT NULL,
+                    size INTEGER NOT NULL,
+                    expires_at REAL,
+                    accessed_at REAL NOT NULL
+                )"""
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS cache_function_accessed_at ON cache (function, accessed_at)"
+            )
+
+    @contextmanager
+    def _connect(self) -> t.Generator[sqlite3.Connection, None, None]:
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        # A connection inherited from the parent process (after a fork) can't be used.
+        if conn is None or self._local.pid != os.getpid():
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=30)
+            self._local.pid = os.getpid()
+        with conn:  # Commits, or rolls back on exception.
+            yield conn
+
+    def get(self, key: str) -> tuple[bool, t.Any, float | None]:
+        """
+        Returns whether the key was found (and isn't expired), the value and its expiration time.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return False, None, None
+            value, expires_at = row
+            if expires_at is not None and expires_at <= now:
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                return False, None, None
+            conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+        return True, pickle.loads(value), expires_at
+
+    def set(
+        self,
+        function: str,
+        key: str,
+        value: t.Any,
+        expires_at: float | None,
+        max_bytes: int,
+    ) -> int:
+        """
+        Stores the value and returns the number of evicted values.
+        """
+        data = pickle.dumps(value)
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, function, data, len(data), expires_at, time.time()),
+            )
+            (total_size,) = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM cache WHERE function = ?",
+                (function,),
+            ).fetchone()
+            evicted = 0
+            if total_size > max_bytes:
+                # Expired values go first, then the least recently used ones.
+                rows = conn.execute(
+                    """SELECT key, size FROM cache WHERE function = ?
+                    ORDER BY (expires_at IS NOT NULL AND expires_at <= ?) DESC, accessed_at ASC""",
+                    (function, time.time()),
+                ).fetchall()
+                for row_key, size in rows:
+                    if total_size <= max_bytes:
+                        break
+                    conn.execute("DELETE FROM cache WHERE key = ?", (row_key,))
+                    total_size -= size
+                    evicted += 1
+        return evicted
+
+
+class TwoTierCache:
+    """
+    Bounded in-memory LRU cache (for speed) in front of a size-bounded disk cache (for persistence), both with an optional TTL.
+    Without `cache_dir`, values are kept only in memory.
+    """
+
+    def __init__(
+        self,
+        function: str,
+        ttl: timedelta | None,
+        max_memory_items: int,
+        max_disk_bytes: int,
+        cache_dir: str | None,
+    ) -> None:
+        self.function = function
+        self.ttl = ttl
+        self.max_memory_items = max_memory_items
+        self.max_disk_bytes = max_disk_bytes
+        self.disk = _DiskCache(cache_dir) if cache_dir is not None else None
+        self._memory: OrderedDict[str, tuple[t.Any, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+        self._memory_evictions = 0
+        self._disk_evictions = 0
+        self._expirations = 0
+
+    def get(self, key: str) -> tuple[bool, t.Any]:
+        with self._lock:
+            if key in self._memory:
+                value, expires_at = self._memory[key]
+                if expires_at is None or expires_at > time.time():
+                    self._memory.move_to_end(key)
+                    self._memory_hits += 1
+                    return True, value
+                del self._memory[key]
+                self._expirations += 1
+
+        if self.disk is None:
+            with self._lock:
+                self._misses += 1
+            return False, None
+
+        try:
+            found, value, expires_at = self.disk.get(key)
+        except sqlite3.Error as e:
+            logger.warning(
+                f"Failed to read from the disk cache of {self.function}: {e}"
+            )
+            found, value, expires_at = False, None, None
+
+        with self._lock:
+            if not found:
+                self._misses += 1
+                return False, None
+            self._disk_hits += 1
+            self._set_memory(key, value, expires_at)
+        return True, value
+
+    def set(self, key: str, value: t.Any, ttl: timedelta | None = None) -> None:
+        """
+        `ttl` overrides the cache's default TTL for this value.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.time() + ttl.total_seconds() if ttl else None
+        with self._lock:
+            self._set_memory(key, value, expires_at)
+        if self.disk is None:
+            return
+        try:
+            evicted = self.disk.set(
+                self.function, key, value, expires_at, self.max_disk_bytes
+            )
+        # Pickling raises `TypeError` or `AttributeError` for some values, e.g. locks or local functions.
+        except (sqlite3.Error, pickle.PicklingError, TypeError, AttributeError) as e:
+            logger.warning(f"Failed to write to the disk cache of {self.function}: {e}")
+            return
+        with self._lock:
+            self._disk_evictions += evicted
+
+    def _set_memory(self, key: str, value: t.Any, expires_at: float | None) -> None:
+        self._memory[key] = (value, expires_at)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_items:
+            self._memory.popitem(last=False)
+            self._memory_evictions += 1
+
+    def clear_memory(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                function=self.function,
+                memory_hits=self._memory_hits,
+                disk_hits=self._disk_hits,
+                misses=self._misses,
+                memory_evictions=self._memory_evictions,
+                disk_evictions=self._disk_evictions,
+                expirations=self._expirations,
+                memory_items=len(self._memory),
+            )
+
+
+def two_tier_cache(
+    ttl: timedelta | None = None,
+    max_memory_items: int = DEFAULT_MAX_MEMORY_ITEMS,
+    max_disk_bytes: int = DEFAULT_MAX_DISK_BYTES,
+) -> t.Callable[[T], T]:
+    """
+    Wraps a function with both file cache (for persistent cache) and in-memory cache (for speed),
+    values older than `ttl` are recomputed. Use `get_cache` to access the cache (e.g. its stats) of the wrapped function.
+    """
+
+    def decorator(func: T) -> T:
+        keys = APIKeys()
+        if not keys.ENABLE_CACHE:
+            return func
+
+        cache = TwoTierCache(
+            function=f"{func.__module__}.{func.__qualname__}",
+            ttl=ttl,
+            max_memory_items=max_memory_items,
+            max_disk_bytes=max_disk_bytes,
+            cache_dir=keys.CACHE_DIR,
+        )
+
+        @functools.wraps(func)
+        def wrapper(*args: t.Any, **kwargs: t.Any) -> t.Any:
+            key = cache_key(func, *args, **kwargs)
+            found, value = cache.get(key)
+            if not found:
+                value = func(*args, **kwargs)
+                cache.set(key, value)
+            return value
+
+        setattr(wrapper, "cache", cache)
+        return t.cast(T, wrapper)
+
+    return decorator
+
+
+def get_cache(func: t.Callable[..., t.Any]) -> TwoTierCache:
+    cache = getattr(func, "cache", None)
+    if not isinstance(cache, TwoTierCache):
+        raise ValueError(f"{func} isn't wrapped with a cache.")
+    return cache
 
 
 def persistent_inmemory_cache(func: T) -> T:
     """
-    Wraps a function with both file cache (for persistent cache) and in-memory cache (for speed).
+    Wraps a function with both file cache (for persistent cache) and in-memory cache (for speed), without expiration.
     """
-    return cast(T, cache(MEMORY.cache(func)) if APIKeys().ENABLE_CACHE else func)
+    return two_tier_cache()(func)
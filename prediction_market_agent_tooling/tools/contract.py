@@ -2,6 +2,7 @@ import json
 import os
 import time
 import typing as t
+from concurrent.futures import Future
 from contextlib import contextmanager
 
 from pydantic import BaseModel, field_validator
@@ -13,26 +14,37 @@ from prediction_market_agent_tooling.gtypes import (
     ABI,
     ChainID,
     ChecksumAddress,
+    HexBytes,
     Nonce,
     TxParams,
     TxReceipt,
     Wei,
 )
+from prediction_market_agent_tooling.loggers import logger
 from prediction_market_agent_tooling.tools.gnosis_rpc import (
     GNOSIS_NETWORK_ID,
     GNOSIS_RPC_URL,
 )
+from prediction_market_agent_tooling.tools.multicall import ContractCallsBatch
 from prediction_market_agent_tooling.tools.utils import (
     DatetimeWithTimezone,
     should_not_happen,
     utc_timestamp_to_utc_datetime,
 )
+from prediction_market_agent_tooling.tools.web3_provider import get_pooled_web3
 from prediction_market_agent_tooling.tools.web3_utils import (
     call_function_on_contract,
+    prepare_tx,
+    send_function_calls_on_contract_tx_using_safe_multisend,
     send_function_on_contract_tx,
     send_function_on_contract_tx_using_safe,
+    sign_and_send_tx,
+    wait_for_receipt_tx,
 )
 
+# Bounds the gas of a single MultiSend transaction (and the number of transactions in flight without Safe).
+DEFAULT_MAX_CALLS_PER_TX = 30
+
 
 def abi_field_validator(value: str) -> ABI:
     if value.endswith(".json"):
@@ -158,13 +170,269 @@ class ContractBaseClass(BaseModel):
             web3=web3,
         )
 
+    def send_many(
+        self,
+        api_keys: APIKeys,
+        calls: list[tuple[str, t.Optional[list[t.Any] | dict[str, t.Any]]]],
+        max_calls_per_tx: int = DEFAULT_MAX_CALLS_PER_TX,
+        timeout: int = 180,
+        web3: Web3 | None = None,
+    ) -> list[TxReceipt]:
+        """
+        Used for many independent writes (function name and its parameters) to the contract at once.
+        With Safe, calls are packed into MultiSend transactions of at most `max_calls_per_tx` calls,
+        otherwise they are sent as separate transactions, but back-to-back, without waiting for each one to be mined.
+        """
+        web3 = web3 or self.get_web3()
+        receipts: list[TxReceipt] = []
+        for i in range(0, len(calls), max_calls_per_tx):
+            chunk = calls[i : i + max_calls_per_tx]
+            if api_keys.SAFE_ADDRESS:
+                receipts.append(
+                    send_function_calls_on_contract_tx_using_safe_multisend(
+                        web3=web3,
+                        contract_address=self.address,
+                        contract_abi=self.abi,
+                        from_private_key=api_keys.bet_from_private_key,
+                        safe_address=api_keys.SAFE_ADDRESS,
+                        calls=chunk,
+                        timeout=timeout,
+                    )
+                )
+            else:
+                with TransactionsPipeline(api_keys, web3, timeout) as pipeline:
+                    for function_name, function_params in chunk:
+                        pipeline.send(self, function_name, function_params)
+                receipts.extend(pipeline.receipts)
+        return receipts
+
+    def try_send_many(
+        self,
+        api_keys: APIKeys,
+        calls: list[tuple[str, t.Optional[list[t.Any] | dict[str, t.Any]]]],
+        values: list[Wei] | None = None,
+        max_calls_per_tx: int = DEFAULT_MAX_CALLS_PER_TX,
+        timeout: int = 180,
+        web3: Web3 | None = None,
+    ) -> list[TxReceipt | Exception]:
+        """
+        Same as `send_many`, but one failed call doesn't stop the others. Returns receipt or error for each call, in the same order.
+        If `values` are given, each call sends the corresponding amount of chain's native currency.
+        With Safe, calls of a failed MultiSend transaction are retried one by one, to find out which of them failed
+        (calls from the same MultiSend transaction share its receipt).
+        """
+        if values is not None and len(values) != len(calls):
+            raise ValueError("There must be exactly one value for each call.")
+        web3 = web3 or self.get_web3()
+        results: list[TxReceipt | Exception | None] = [None] * len(calls)
+
+        if api_keys.SAFE_ADDRESS:
+            for i in range(0, len(calls), max_calls_per_tx):
+                chunk = calls[i : i + max_calls_per_tx]
+                chunk_values = (
+                    values[i : i + max_calls_per_tx] if values is not None else None
+                )
+                try:
+                    receipt = send_function_calls_on_contract_tx_using_safe_multisend(
+                        web3=web3,
+                        contract_address=self.address,
+                        contract_abi=self.abi,
+                        from_private_key=api_keys.bet_from_private_key,
+                        safe_address=api_keys.SAFE_ADDRESS,
+                        calls=chunk,
+                        values=chunk_values,
+                        timeout=timeout,
+                    )
+                    results[i : i + len(chunk)] = [receipt] * len(chunk)
+                except Exception as e:
+                    if len(chunk) == 1:
+                        results[i] = e
+                        continue
+                    logger.warning(
+                        f"MultiSend transaction failed, sending its calls one by one: {e}"
+                    )
+                    for j, (function_name, function_params) in enumerate(chunk):
+                        try:
+                            results[i + j] = self.send(
+                                api_keys=api_keys,
+                                function_name=function_name,
+                                function_params=function_params,
+                                tx_params=(
+                                    {"value": chunk_values[j]}
+                                    if chunk_values is not None
+                                    else None
+                                ),
+                                timeout=timeout,
+                                web3=web3,
+                            )
+                        except Exception as call_error:
+                            results[i + j] = call_error
+
+        else:
+            pipeline = TransactionsPipeline(api_keys, web3, timeout)
+            sent_indexes: list[int] = []
+            for i, (function_name, function_params) in enumerate(calls):
+                try:
+                    # Failing calls fail already here, in the gas estimation.
+                    pipeline.send(
+                        self,
+                        function_name,
+                        function_params,
+                        tx_params=(
+                            {"value": values[i]} if values is not None else None
+                        ),
+                    )
+                except Exception as e:
+                    results[i] = e
+                    continue
+                sent_indexes.append(i)
+            for i, result in zip(sent_indexes, pipeline.wait_each()):
+                results[i] = result
+
+        return [r if r is not None else should_not_happen() for r in results]
+
+    def call_batched(
+        self,
+        batch: ContractCallsBatch,
+        function_name: str,
+        function_params: t.Optional[list[t.Any] | dict[str, t.Any]] = None,
+    ) -> "Future[t.Any]":
+        """
+        Used for reading from the contract, but the call is only queued into the batch and executed together with the others.
+        """
+        return batch.add(
+            contract_address=self.address,
+            contract_abi=self.abi,
+            function_name=function_name,
+            function_params=function_params,
+        )
+
+    @classmethod
+    def batch(cls, web3: Web3 | None = None) -> ContractCallsBatch:
+        """
+        Creates a batch for read calls, see `ContractCallsBatch` for the usage.
+        """
+        return ContractCallsBatch(web3 or cls.get_web3())
+
     @classmethod
     def get_transaction_count(cls, for_address: ChecksumAddress) -> Nonce:
         return cls.get_web3().eth.get_transaction_count(for_address)
 
     @classmethod
     def get_web3(cls) -> Web3:
-        return Web3(Web3.HTTPProvider(cls.CHAIN_RPC_URL))
+        # Shared per RPC url, so that all the calls reuse keep-alive connections from a single pool.
+        return get_pooled_web3(cls.CHAIN_RPC_URL)
+
+
+class TransactionsPipeline:
+    """
+    Sends transactions back-to-back, without waiting for each one to be mined, receipts are awaited together at the end.
+    Use only for transactions that don't depend on each other, because transactions that depend on unmined ones
+    would fail already in the gas estimation.
+
+    Transactions sent by `ContractBaseClass.send` in the meantime are fine, as nonces are handed out by `NonceManager`.
+    If Safe is used, transactions are executed one by one, as before.
+
+    ```
+    with TransactionsPipeline(api_keys, web3) as pipeline:
+        pipeline.send(collateral_token_contract, "approve", [market_contract.address, amount_wei])
+        pipeline.send_with_value(wxdai_contract, "deposit", amount_wei)
+    print(pipeline.receipts)
+    ```
+    """
+
+    def __init__(self, api_keys: APIKeys, web3: Web3, timeout: int = 180) -> None:
+        self.api_keys = api_keys
+        self.web3 = web3
+        self.timeout = timeout
+        self.receipts: list[TxReceipt] = []
+        self._pending: list[tuple[TxParams, HexBytes]] = []
+
+    def __enter__(self) -> "TransactionsPipeline":
+        return self
+
+    def __exit__(self, exc_type: t.Any, exc_value: t.Any, traceback: t.Any) -> None:
+        if exc_type is None:
+            self.wait()
+            return
+        # Wait even on error, because already sent transactions are going to be mined anyway, but don't hide the original error.
+        try:
+            self.wait()
+        except Exception as e:
+            logger.warning(f"Pipelined transaction failed: {e}")
+
+    def send(
+        self,
+        contract: "ContractBaseClass",
+        function_name: str,
+        function_params: t.Optional[list[t.Any] | dict[str, t.Any]] = None,
+        tx_params: t.Optional[TxParams] = None,
+    ) -> None:
+        if self.api_keys.SAFE_ADDRESS:
+            self.receipts.append(
+                contract.send(
+                    api_keys=self.api_keys,
+                    function_name=function_name,
+                    function_params=function_params,
+                    tx_params=tx_params,
+                    timeout=self.timeout,
+                    web3=self.web3,
+                )
+            )
+            return
+
+        tx_params = prepare_tx(
+            web3=self.web3,
+            contract_address=contract.address,
+            contract_abi=contract.abi,
+            from_address=self.api_keys.bet_from_address,
+            function_name=function_name,
+            function_params=function_params,
+            tx_params=tx_params,
+        )
+        tx_hash = sign_and_send_tx(
+            self.web3, tx_params, self.api_keys.bet_from_private_key
+        )
+        self._pending.append((tx_params, tx_hash))
+
+    def send_with_value(
+        self,
+        contract: "ContractBaseClass",
+        function_name: str,
+        amount_wei: Wei,
+        function_params: t.Optional[list[t.Any] | dict[str, t.Any]] = None,
+        tx_params: t.Optional[TxParams] = None,
+    ) -> None:
+        self.send(
+            contract=contract,
+            function_name=function_name,
+            function_params=function_params,
+            tx_params={"value": amount_wei, **(tx_params or {})},
+        )
+
+    def wait(self) -> list[TxReceipt]:
+        errors = [r for r in self.wait_each() if isinstance(r, Exception)]
+        if errors:
+            raise errors[0]
+        return self.receipts
+
+    def wait_each(self) -> list[TxReceipt | Exception]:
+        """
+        Waits for the transactions sent since the last wait, and returns receipt or error of each of them, in the order they were sent.
+        """
+        pending, self._pending = self._pending, []
+        results: list[TxReceipt | Exception] = []
+        for tx_params, tx_hash in pending:
+            try:
+                receipt = wait_for_receipt_tx(
+                    self.web3, tx_params, tx_hash, self.timeout
+                )
+            except Exception as e:
+                results.append(e)
+                continue
+            self.receipts.append(receipt)
+            results.append(receipt)
+        return results
 
 
 class ContractProxyBaseClass(ContractBaseClass):
@@ -1,11 +1,12 @@
 import typing as t
+from datetime import timedelta
 
 import tenacity
 from googleapiclient.discovery import build
 
 from prediction_market_agent_tooling.config import APIKeys
 from prediction_market_agent_tooling.loggers import logger
-from prediction_market_agent_tooling.tools.cache import persistent_inmemory_cache
+from prediction_market_agent_tooling.tools.cache import two_tier_cache
 
 
 @tenacity.retry(
@@ -13,7 +14,8 @@ from prediction_market_agent_tooling.tools.cache import persistent_inmemory_cach
     stop=tenacity.stop_after_attempt(3),
     after=lambda x: logger.debug(f"search_google failed, {x.attempt_number=}."),
 )
-@persistent_inmemory_cache
+# Results change over time, e.g. for news queries.
+@two_tier_cache(ttl=timedelta(days=1))
 def search_google(
     query: str | None = None,
     num: int = 3,
@@ -11,6 +11,8 @@ from pydantic_core.core_schema import (
     with_info_before_validator_function,
 )
 
+from prediction_market_agent_tooling.tools.validation import TRUSTED_CONTEXT_KEY
+
 hex_serializer = plain_serializer_function_ser_schema(function=lambda x: x.hex())
 
 
@@ -64,6 +66,16 @@ class HexBytes(HexBytesBase, BaseHex):
     def __eth_pydantic_validate__(
         cls, value: t.Any, info: ValidationInfo | None = None
     ) -> "HexBytes":
+        if (
+            info is not None
+            and info.context is not None
+            and info.context.get(TRUSTED_CONTEXT_KEY)
+            and isinstance(value, str)
+            and value[:2] == "0x"
+            and len(value) % 2 == 0
+        ):
+            # Usual form of trusted values, skip the generic conversion.
+            return bytes.__new__(cls, bytes.fromhex(value[2:]))
         return HexBytes(value)
 
     def as_int(self) -> int:
@@ -0,0 +1,205 @@
+import os
+import typing as t
+from concurrent.futures import Future
+
+from eth_abi.exceptions import DecodingError
+from web3 import Web3
+from web3._utils.abi import get_abi_output_types, map_abi_data
+from web3._utils.normalizers import BASE_RETURN_NORMALIZERS
+from web3.contract.contract import ContractFunction
+from web3.types import RPCEndpoint
+
+from prediction_market_agent_tooling.gtypes import ABI, ChecksumAddress, HexBytes
+from prediction_market_agent_tooling.loggers import logger
+from prediction_market_agent_tooling.tools.web3_provider import PooledHTTPProvider
+from prediction_market_agent_tooling.tools.web3_utils import (
+    get_cached_web3_contract,
+    parse_function_params,
+)
+
+# Multicall3 is deployed on the same address on all major chains, see https://www.multicall3.com/deployments.
+MULTICALL3_ADDRESS = Web3.to_checksum_address(
+    "0xcA11bde05977b3631167028862bE2a173976CA11"
+)
+MULTICALL3_ABI = ABI(
+    open(
+        os.path.join(
+            os.path.dirname(os.path.realpath(__file__)), "../abis/multicall3.abi.json"
+        )
+    ).read()
+)
+# Bounds the calldata and gas of a single `eth_call`, public RPCs reject too big ones.
+DEFAULT_MAX_CALLS_PER_BATCH = 300
+
+_MULTICALL3_AVAILABLE: dict[str, bool] = {}
+
+
+class _PendingCall(t.NamedTuple):
+    contract_address: ChecksumAddress
+    function: ContractFunction
+    future: "Future[t.Any]"
+
+
+class ContractCallsBatch:
+    """
+    Collects read-only contract calls and executes them together, instead of doing one `eth_call` per call.
+
+    Calls are aggregated into Multicall3's `aggregate3`, if Multicall3 isn't available, JSON-RPC array batching is used instead.
+    Results are returned as futures, that are resolved after `flush` (or at the end of the `with` block).
+
+    ```
+    with ContractCallsBatch(web3) as batch:
+        supplies = [batch.add(m.address, m.abi, "totalSupply") for m in market_contracts]
+    print([s.result() for s in supplies])
+    ```
+    """
+
+    def __init__(
+        self,
+        web3: Web3,
+        max_calls_per_batch: int = DEFAULT_MAX_CALLS_PER_BATCH,
+        use_multicall: bool = True,
+    ) -> None:
+        self.web3 = web3
+        self.max_calls_per_batch = max_calls_per_batch
+        self.use_multicall = use_multicall
+        self._pending: list[_PendingCall] = []
+
+    def __enter__(self) -> "ContractCallsBatch":
+        return self
+
+    def __exit__(self, exc_type: t.Any, exc_value: t.Any, traceback: t.Any) -> None:
+        if exc_type is None:
+            self.flush()
+        else:
+            for call in self._pending:
+                call.future.cancel()
+            self._pending = []
+
+    def add(
+        self,
+        contract_address: ChecksumAddress,
+        contract_abi: ABI,
+        function_name: str,
+        function_params: t.Optional[list[t.Any] | dict[str, t.Any]] = None,
+    ) -> "Future[t.Any]":
+        contract = get_cached_web3_contract(self.web3, contract_address, contract_abi)
+        function = contract.functions[function_name](*parse_function_params(function_params))  # type: ignore # TODO: Fix Mypy, as this works just OK.
+        future: Future[t.Any] = Future()
+        self._pending.append(_PendingCall(contract_address, function, future))
+        return future
+
+    def flush(self) -> None:
+        pending, self._pending = self._pending, []
+        for i in range(0, len(pending), self.max_calls_per_batch):
+            chunk = pending[i : i + self.max_calls_per_batch]
+            if self.use_multicall and self._multicall_available():
+                self._execute_multicall(chunk)
+            else:
+                self._execute_json_rpc_batch(chunk)
+
+    def _multicall_available(self) -> bool:
+        # Cached per RPC, because the contract either is deployed there or not.
+        cache_key = str(self.web3.provider)
+        if cache_key not in _MULTICALL3_AVAILABLE:
+            _MULTICALL3_AVAILABLE[cache_key] = (
+                len(self.web3.eth.get_code(MULTICALL3_ADDRESS)) > 0
+            )
+            if not _MULTICALL3_AVAILABLE[cache_key]:
+                logger.warning(
+                    f"Multicall3 not deployed at {MULTICALL3_ADDRESS}, falling back to JSON-RPC batching."
+                )
+        return _MULTICALL3_AVAILABLE[cache_key]
+
+    def _execute_multicall(self, calls: list[_PendingCall]) -> None:
+        multicall = get_cached_web3_contract(
+            self.web3, MULTICALL3_ADDRESS, MULTICALL3_ABI
+        )
+        try:
+            results = multicall.functions.aggregate3(
+                [
+                    (
+                        call.contract_address,
+                        True,
+                        call.function._encode_transaction_data(),
+                    )
+                    for call in calls
+                ]
+            ).call()
+        except Exception as e:
+            logger.warning(
+                f"Multicall3 aggregate3 failed with {e}, falling back to JSON-RPC batching."
+            )
+            self._execute_json_rpc_batch(calls)
+            return
+
+        for call, (success, return_data) in zip(calls, results):
+            if success:
+                self._resolve(call, HexBytes(return_data))
+            else:
+                call.future.set_exception(
+                    ValueError(
+                        f"Call {call.function.fn_name} on {call.contract_address} reverted: {HexBytes(return_data).hex()}"
+                    )
+                )
+
+    def _execute_json_rpc_batch(self, calls: list[_PendingCall]) -> None:
+        provider = self.web3.provider
+        if not isinstance(provider, PooledHTTPProvider):
+            # Only our pooled provider knows how to send array requests.
+            self._execute_one_by_one(calls)
+            return
+
+        rpc_calls = [
+            (
+                RPCEndpoint("eth_call"),
+                [
+                    {
+                        "to": call.contract_address,
+                        "data": call.function._encode_transaction_data(),
+                    },
+                    "latest",
+                ],
+            )
+            for call in calls
+        ]
+        try:
+            responses = provider.make_batch_request(rpc_calls)
+        except Exception as e:
+            logger.warning(
+                f"JSON-RPC batch request failed with {e}, falling back to one by one calls."
+            )
+            self._execute_one_by_one(calls)
+            return
+
+        for call, response in zip(calls, responses):
+            if "error" in response:
+                call.future.set_exception(
+                    ValueError(
+                        f"Call {call.function.fn_name} on {call.contract_address} failed: {response['error']}"
+                    )
+                )
+            else:
+                self._resolve(call, HexBytes(response["result"]))
+
+    def _execute_one_by_one(self, calls: list[_PendingCall]) -> None:
+        for call in calls:
+            try:
+                call.future.set_result(call.function.call())
+            except Exception as e:
+                call.future.set_exception(e)
+
+    def _resolve(self, call: _PendingCall, return_data: HexBytes) -> None:
+        # Same decoding as web3's `ContractFunction.call` does.
+        output_types = get_abi_output_types(call.function.abi)
+        try:
+            output_data = self.web3.codec.decode(output_types, return_data)
+        except DecodingError as e:
+            call.future.set_exception(e)
+            return
+        normalized_data = map_abi_data(
+            BASE_RETURN_NORMALIZERS, output_types, output_data
+        )
+        call.future.set_result(
+            normalized_data[0] if len(normalized_data) == 1 else normalized_data
+        )
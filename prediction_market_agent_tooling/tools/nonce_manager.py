@@ -0,0 +1,97 @@
+import threading
+import typing as t
+from collections import defaultdict
+
+from web3 import Web3
+
+from prediction_market_agent_tooling.gtypes import ChecksumAddress, Nonce
+from prediction_market_agent_tooling.loggers import logger
+
+_AccountKey = tuple[str, ChecksumAddress]
+
+
+class NonceManager:
+    """
+    Hands out nonces for transactions sent from our accounts, so that transactions can be sent back-to-back,
+    without waiting for the previous ones to be mined.
+
+    While there is no transaction in flight for the account, the nonce is read from the node (as it was always done),
+    so transactions sent from elsewhere (e.g. by Safe, or by another process) are picked up.
+    While there are transactions in flight, following nonces are assigned locally.
+    If anything fails before the transaction reaches the node, its nonce is handed out again before any new one,
+    the node can't be asked meanwhile, because it doesn't count the transactions in flight behind the unused nonce.
+    """
+
+    # Guards the state below, held only for a moment, never during a request to the node.
+    _lock = threading.Lock()
+    _next_nonces: dict[_AccountKey, Nonce] = {}
+    _in_flight: defaultdict[_AccountKey, set[Nonce]] = defaultdict(set)
+    # Nonces that were handed out, but never used, while other transactions were in flight.
+    _free_nonces: defaultdict[_AccountKey, set[Nonce]] = defaultdict(set)
+    # Held while the nonce is read from the node, so only the account's own transactions wait for it.
+    _account_locks: defaultdict[_AccountKey, threading.Lock] = defaultdict(
+        threading.Lock
+    )
+
+    @staticmethod
+    def _account_key(web3: Web3, address: ChecksumAddress) -> _AccountKey:
+        rpc = getattr(web3.provider, "endpoint_uri", None) or repr(web3.provider)
+        return str(rpc), address
+
+    @classmethod
+    def acquire(cls, web3: Web3, address: ChecksumAddress) -> Nonce:
+        key = cls._account_key(web3, address)
+        with cls._lock:
+            account_lock = cls._account_locks[key]
+        with account_lock:
+            with cls._lock:
+                nonce = cls._acquire_locally(key)
+            if nonce is not None:
+                return nonce
+            # Nothing is in flight and no one else can acquire for this account meanwhile.
+            nonce = web3.eth.get_transaction_count(address, "pending")
+            with cls._lock:
+                cls._next_nonces[key] = Nonce(nonce + 1)
+                cls._in_flight[key].add(nonce)
+            return nonce
+
+    @classmethod
+    def _acquire_locally(cls, key: _AccountKey) -> Nonce | None:
+        if not cls._in_flight[key] or key not in cls._next_nonces:
+            return None
+        free_nonces = cls._free_nonces[key]
+        if free_nonces:
+            nonce = min(free_nonces)
+            free_nonces.remove(nonce)
+        else:
+            nonce = cls._next_nonces[key]
+            cls._next_nonces[key] = Nonce(nonce + 1)
+        cls._in_flight[key].add(nonce)
+        return nonce
+
+    @classmethod
+    def release(
+        cls,
+        web3: Web3,
+        address: ChecksumAddress,
+        nonce: Nonce,
+        failed: bool = False,
+    ) -> None:
+        """
+        Called once the transaction with the given nonce is mined, or if it failed before it was sent.
+        """
+        key = cls._account_key(web3, address)
+        with cls._lock:
+            cls._in_flight[key].discard(nonce)
+            if failed:
+                logger.debug(f"Transaction with {nonce=} of {address} failed.")
+                cls._free_nonces[key].add(nonce)
+            if not cls._in_flight[key]:
+                # Next nonce will be read from the node, that knows about all the sent transactions.
+                cls._free_nonces[key].clear()
+                cls._next_nonces.pop(key, None)
+
+    @classmethod
+    def in_flight(cls, web3: Web3, address: ChecksumAddress) -> t.Set[Nonce]:
+        with cls._lock:
+            return set(cls._in_flight[cls._account_key(web3, address)])
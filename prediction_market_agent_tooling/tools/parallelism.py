@@ -1,3 +1,5 @@
+import threading
+import time
 from typing import Callable, Generator, TypeVar
 
 from loky import get_reusable_executor
@@ -31,3 +33,22 @@ def par_generator(
     executor = get_reusable_executor(max_workers=max_workers, initializer=patch_logger)
     for res in executor.map(func, items):
         yield res
+
+
+class RateLimiter:
+    """Thread-safe limiter that spaces out calls to at most `calls_per_second`."""
+
+    def __init__(self, calls_per_second: float) -> None:
+        if calls_per_second <= 0:
+            raise ValueError("calls_per_second must be positive.")
+        self.interval = 1 / calls_per_second
+        self._lock = threading.Lock()
+        self._next_call_at = 0.0
+
+    def wait(self) -> None:
+        """Blocks until the next call is allowed."""
+        with self._lock:
+            now = time.monotonic()
+            call_at = max(now, self._next_call_at)
+            self._next_call_at = call_at + self.interval
+        time.sleep(max(0.0, call_at - now))
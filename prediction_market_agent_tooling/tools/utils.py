@@ -6,7 +6,6 @@ from datetime import datetime
 from typing import Any, NoReturn, Optional, Type, TypeVar, cast
 
 import pytz
-import requests
 from google.cloud import secretmanager
 from pydantic import BaseModel, ValidationError
 from pydantic.functional_validators import BeforeValidator
@@ -161,7 +160,19 @@ def get_current_git_url() -> str:
     return git.Repo(search_parent_directories=True).remotes.origin.url
 
 
-def response_to_json(response: requests.models.Response) -> dict[str, Any]:
+class HTTPResponse(t.Protocol):
+    """
+    Response of either `requests` or `httpx`.
+    """
+
+    def raise_for_status(self) -> t.Any:
+        ...
+
+    def json(self, **kwargs: t.Any) -> t.Any:
+        ...
+
+
+def response_to_json(response: HTTPResponse) -> dict[str, Any]:
     response.raise_for_status()
     response_json: dict[str, Any] = response.json()
     return response_json
@@ -170,9 +181,7 @@ def response_to_json(response: requests.models.Response) -> dict[str, Any]:
 BaseModelT = TypeVar("BaseModelT", bound=BaseModel)
 
 
-def response_to_model(
-    response: requests.models.Response, model: Type[BaseModelT]
-) -> BaseModelT:
+def response_to_model(response: HTTPResponse, model: Type[BaseModelT]) -> BaseModelT:
     response_json = response_to_json(response)
     try:
         return model.model_validate(response_json)
@@ -181,7 +190,7 @@ def response_to_model(
 
 
 def response_list_to_model(
-    response: requests.models.Response, model: Type[BaseModelT]
+    response: HTTPResponse, model: Type[BaseModelT]
 ) -> list[BaseModelT]:
     response_json = response_to_json(response)
     try:
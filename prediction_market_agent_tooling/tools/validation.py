@@ -0,0 +1,117 @@
+import gc
+import threading
+import typing as t
+from contextlib import contextmanager, nullcontext
+
+from pydantic import BaseModel, TypeAdapter
+
+BaseModelT = t.TypeVar("BaseModelT", bound=BaseModel)
+
+# Key in the validation context, custom types (e.g. `HexBytes`) can skip the checks needed only for arbitrary input if it's set.
+TRUSTED_CONTEXT_KEY = "trusted"
+
+# The garbage collector is process-wide, so it's paused only for inputs large enough for its runs to matter (e.g. full subgraph pages).
+GC_PAUSE_MIN_ITEMS = 1000
+
+_list_type_adapters: dict[t.Type[BaseModel], TypeAdapter[t.Any]] = {}
+
+# Number of `paused_gc` contexts in progress, and whether the garbage collector was enabled before the first of them.
+_gc_pause_lock = threading.Lock()
+_gc_pause_count = 0
+_gc_was_enabled = False
+
+
+def get_list_type_adapter(
+    model: t.Type[BaseModelT],
+) -> TypeAdapter[list[BaseModelT]]:
+    """
+    Building the adapter is expensive, so it's created only once per model.
+    """
+    adapter = _list_type_adapters.get(model)
+    if adapter is None:
+        adapter = _list_type_adapters[model] = TypeAdapter(list[model])  # type: ignore[valid-type]
+    return adapter
+
+
+def validate_models(
+    model: t.Type[BaseModelT],
+    items: t.Sequence[dict[str, t.Any]],
+    trusted: bool = False,
+) -> list[BaseModelT]:
+    """
+    Validates all the items in one call, instead of calling `model.model_validate` on each of them,
+    with the garbage collector paused if there are at least `GC_PAUSE_MIN_ITEMS` of them.
+
+    Use `trusted` only for data that already matches the schema of its source (e.g. items returned by a subgraph):
+    - nested models with the same `id` are validated only once and the instance is shared between all the parents, so don't modify them,
+    - custom types use their fast paths, that don't handle arbitrary input.
+    The items themselves are never modified.
+    """
+    adapter = get_list_type_adapter(model)
+    with paused_gc() if len(items) >= GC_PAUSE_MIN_ITEMS else nullcontext():
+        if not trusted:
+            return adapter.validate_python(items)
+        return adapter.validate_python(
+            _with_shared_nested_models(model, items),
+            context={TRUSTED_CONTEXT_KEY: True},
+        )
+
+
+@contextmanager
+def paused_gc() -> t.Generator[None, None, None]:
+    """
+    Validation of many items allocates a lot of objects, which triggers the cyclic garbage collector over and over,
+    and each run walks through all the (large) input again. Validated models don't form cycles, so it's safe to pause it meanwhile.
+
+    The garbage collector is process-wide, so it's paused by the first of the concurrent (or nested) callers
+    and enabled again only by the last one, and only if it was enabled before.
+    """
+    global _gc_pause_count, _gc_was_enabled
+    with _gc_pause_lock:
+        if _gc_pause_count == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pause_count += 1
+    try:
+        yield
+    finally:
+        with _gc_pause_lock:
+            _gc_pause_count -= 1
+            if _gc_pause_count == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+def _with_shared_nested_models(
+    model: t.Type[BaseModel], items: t.Sequence[dict[str, t.Any]]
+) -> t.Sequence[dict[str, t.Any]]:
+    for name, field in model.model_fields.items():
+        nested_model = field.annotation
+        if not (isinstance(nested_model, type) and issubclass(nested_model, BaseModel)):
+            continue
+
+        unique_nested_items: dict[t.Any, dict[str, t.Any]] = {}
+        for item in items:
+            nested_item = item.get(name)
+            if isinstance(nested_item, dict) and "id" in nested_item:
+                unique_nested_items.setdefault(nested_item["id"], nested_item)
+        # Nothing to share if every nested item is different.
+        if len(unique_nested_items) == len(items):
+            continue
+
+        nested_models = dict(
+            zip(
+                unique_nested_items,
+                validate_models(
+                    nested_model, list(unique_nested_items.values()), trusted=True
+                ),
+            )
+        )
+        items = [
+            (
+                {**item, name: nested_models[item[name]["id"]]}
+                if isinstance(item.get(name), dict) and "id" in item[name]
+                else item
+            )
+            for item in items
+        ]
+    return items
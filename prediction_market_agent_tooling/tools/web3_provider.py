@@ -0,0 +1,210 @@
+import bisect
+import json
+import threading
+import time
+import typing as t
+
+import requests
+from pydantic import BaseModel
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+from web3.providers.rpc import HTTPProvider
+from web3.types import RPCEndpoint, RPCResponse
+
+# Upper bounds (in milliseconds) of the buckets in the request latency histogram, the last bucket is unbounded.
+LATENCY_BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+DEFAULT_POOL_MAXSIZE = 20
+DEFAULT_REQUEST_TIMEOUT = 30
+
+
+class Web3PoolStats(BaseModel):
+    rpc_url: str
+    hits: int
+    misses: int
+    requests: int
+    errors: int
+    open_connections: int
+    latency_histogram_ms: dict[str, int]
+
+
+class _PoolStatsRecorder:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.requests = 0
+        self.errors = 0
+        self.latency_buckets = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record_lookup(self, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def record_request(self, elapsed_seconds: float, failed: bool) -> None:
+        bucket = bisect.bisect_left(LATENCY_BUCKETS_MS, elapsed_seconds * 1000)
+        with self._lock:
+            self.requests += 1
+            self.latency_buckets[bucket] += 1
+            if failed:
+                self.errors += 1
+
+    def latency_histogram(self) -> dict[str, int]:
+        labels = [f"<={b}ms" for b in LATENCY_BUCKETS_MS] + [
+            f">{LATENCY_BUCKETS_MS[-1]}ms"
+        ]
+        with self._lock:
+            return dict(zip(labels, self.latency_buckets))
+
+
+class PooledHTTPProvider(HTTPProvider):
+    """
+    HTTPProvider that sends all requests through one shared keep-alive `requests.Session`.
+
+    Web3's default HTTPProvider caches sessions per thread, so every worker thread (and every new `Web3` instance created in a new thread)
+    would open its own connections, here all of them share a single bounded connection pool.
+    """
+
+    def __init__(
+        self,
+        endpoint_uri: str,
+        session: requests.Session,
+        stats: _PoolStatsRecorder,
+        request_kwargs: dict[str, t.Any] | None = None,
+    ) -> None:
+        super().__init__(
+            endpoint_uri,
+            request_kwargs={
+                "timeout": DEFAULT_REQUEST_TIMEOUT,
+                **(request_kwargs or {}),
+            },
+        )
+        self.rpc_url = endpoint_uri
+        self.session = session
+        self.stats = stats
+
+    def make_request(self, method: RPCEndpoint, params: t.Any) -> RPCResponse:
+        request_data = self.encode_rpc_request(method, params)
+        start = time.monotonic()
+        failed = True
+        try:
+            response = self.session.post(
+                self.rpc_url, data=request_data, **self.get_request_kwargs()
+            )
+            response.raise_for_status()
+            failed = False
+        finally:
+            self.stats.record_request(time.monotonic() - start, failed=failed)
+        return self.decode_rpc_response(response.content)
+
+    def make_batch_request(
+        self, calls: list[tuple[RPCEndpoint, t.Any]]
+    ) -> list[RPCResponse]:
+        """
+        Sends all the calls as a single JSON-RPC array request, responses are returned in the same order as the calls.
+        """
+        request_data = [
+            {"jsonrpc": "2.0", "method": method, "params": params, "id": i}
+            for i, (method, params) in enumerate(calls)
+        ]
+        start = time.monotonic()
+        failed = True
+        try:
+            response = self.session.post(
+                self.rpc_url,
+                data=json.dumps(request_data),
+                **self.get_request_kwargs(),
+            )
+            response.raise_for_status()
+            failed = False
+        finally:
+            self.stats.record_request(time.monotonic() - start, failed=failed)
+        responses: list[RPCResponse] = response.json()
+        if not isinstance(responses, list):
+            # Some nodes answer with a single error object if they don't support batching.
+            raise ValueError(f"Batch request failed: {responses}")
+        responses_by_id = {r["id"]: r for r in responses}
+        return [responses_by_id[i] for i in range(len(calls))]
+
+
+class _PooledConnection:
+    def __init__(self, rpc_url: str, pool_maxsize: int) -> None:
+        self.pool_maxsize = pool_maxsize
+        self.adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session = requests.Session()
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        self.stats = _PoolStatsRecorder()
+        self.web3 = Web3(PooledHTTPProvider(rpc_url, self.session, self.stats))
+
+    def open_connections(self) -> int:
+        open_connections = 0
+        for key in self.adapter.poolmanager.pools.keys():
+            pool = self.adapter.poolmanager.pools[key]
+            if pool is None or pool.pool is None:
+                continue
+            idle = list(pool.pool.queue)
+            in_use = pool.pool.maxsize - len(idle)
+            open_connections += in_use + sum(1 for conn in idle if conn is not None)
+        return open_connections
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Web3ProviderRegistry:
+    """
+    Process-wide registry of pooled Web3 instances, keyed by the RPC url.
+
+    Thread-safe, so the same instance can be shared by all workers of a thread pool.
+    """
+
+    _lock = threading.Lock()
+    _connections: dict[str, _PooledConnection] = {}
+
+    @classmethod
+    def get_web3(cls, rpc_url: str, pool_maxsize: int = DEFAULT_POOL_MAXSIZE) -> Web3:
+        connection = cls._connections.get(rpc_url)
+        if connection is None:
+            with cls._lock:
+                connection = cls._connections.get(rpc_url)
+                if connection is None:
+                    connection = cls._connections[rpc_url] = _PooledConnection(
+                        rpc_url, pool_maxsize
+                    )
+                    connection.stats.record_lookup(hit=False)
+                    return connection.web3
+        connection.stats.record_lookup(hit=True)
+        return connection.web3
+
+    @classmethod
+    def get_stats(cls, rpc_url: str) -> Web3PoolStats:
+        connection = cls._connections.get(rpc_url)
+        if connection is None:
+            raise ValueError(f"No pooled connection for {rpc_url=}.")
+        return Web3PoolStats(
+            rpc_url=rpc_url,
+            hits=connection.stats.hits,
+            misses=connection.stats.misses,
+            requests=connection.stats.requests,
+            errors=connection.stats.errors,
+            open_connections=connection.open_connections(),
+            latency_histogram_ms=connection.stats.latency_histogram(),
+        )
+
+    @classmethod
+    def get_all_stats(cls) -> list[Web3PoolStats]:
+        return [cls.get_stats(rpc_url) for rpc_url in list(cls._connections)]
+
+    @classmethod
+    def close_all(cls) -> None:
+        with cls._lock:
+            for connection in cls._connections.values():
+                connection.close()
+            cls._connections.clear()
+
+
+def get_pooled_web3(rpc_url: str) -> Web3:
+    return Web3ProviderRegistry.get_web3(rpc_url)
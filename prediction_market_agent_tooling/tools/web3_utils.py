@@ -1,15 +1,19 @@
 import binascii
-from typing import Any, Optional, TypeVar
+from functools import lru_cache
+from typing import Any, Optional, TypeVar, cast
 
 import base58
 import tenacity
 from eth_account import Account
 from eth_typing import URI
 from gnosis.eth import EthereumClient
+from gnosis.safe.enums import SafeOperationEnum
+from gnosis.safe.multi_send import MultiSend, MultiSendOperation, MultiSendTx
 from gnosis.safe.safe import Safe
 from pydantic.types import SecretStr
 from web3 import Web3
 from web3.constants import HASH_ZERO
+from web3.contract.contract import Contract as Web3Contract
 from web3.types import AccessList, AccessListEntry, Nonce, TxParams, TxReceipt, Wei
 
 from prediction_market_agent_tooling.gtypes import (
@@ -24,6 +28,7 @@ from prediction_market_agent_tooling.gtypes import (
     xdai_type,
 )
 from prediction_market_agent_tooling.loggers import logger
+from prediction_market_agent_tooling.tools.nonce_manager import NonceManager
 
 ONE_NONCE = Nonce(1)
 ONE_XDAI = xdai_type(1)
@@ -92,6 +97,18 @@ def parse_function_params(params: Optional[list[Any] | dict[str, Any]]) -> list[
     raise ValueError(f"Invalid type for function parameters: {type(params)}")
 
 
+@lru_cache(maxsize=1024)
+def get_cached_web3_contract(
+    web3: Web3,
+    contract_address: ChecksumAddress,
+    contract_abi: ABI,
+) -> Web3Contract:
+    """
+    Building the contract object parses the whole ABI, so keep it around, as the same contracts are called over and over.
+    """
+    return web3.eth.contract(address=contract_address, abi=contract_abi)
+
+
 @tenacity.retry(
     wait=tenacity.wait_chain(*[tenacity.wait_fixed(n) for n in range(1, 6)]),
     stop=tenacity.stop_after_attempt(5),
@@ -106,7 +123,7 @@ def call_function_on_contract(
     function_name: str,
     function_params: Optional[list[Any] | dict[str, Any]] = None,
 ) -> Any:
-    contract = web3.eth.contract(address=contract_address, abi=contract_abi)
+    contract = get_cached_web3_contract(web3, contract_address, contract_abi)
     output = contract.functions[function_name](*parse_function_params(function_params)).call()  # type: ignore # TODO: Fix Mypy, as this works just OK.
     return output
 
@@ -122,11 +139,15 @@ def prepare_tx(
     tx_params: Optional[TxParams] = None,
 ) -> TxParams:
     tx_params_new = _prepare_tx_params(web3, from_address, access_list, tx_params)
-    contract = web3.eth.contract(address=contract_address, abi=contract_abi)
-
-    # Build the transaction.
-    function_call = contract.functions[function_name](*parse_function_params(function_params))  # type: ignore # TODO: Fix Mypy, as this works just OK.
-    tx_params_new = function_call.build_transaction(tx_params_new)
+    try:
+        contract = web3.eth.contract(address=contract_address, abi=contract_abi)
+        # Build the transaction.
+        function_call = contract.functions[function_name](*parse_function_params(function_params))  # type: ignore # TODO: Fix Mypy, as this works just OK.
+        tx_params_new = function_call.build_transaction(tx_params_new)
+    except Exception:
+        # For example, gas estimation fails if the transaction would revert.
+        _release_nonce(web3, tx_params_new, failed=True)
+        raise
     return tx_params_new
 
 
@@ -151,7 +172,7 @@ def _prepare_tx_params(
 
     if not tx_params_new.get("nonce"):
         from_checksummed = Web3.to_checksum_address(tx_params_new["from"])
-        tx_params_new["nonce"] = web3.eth.get_transaction_count(from_checksummed)
+        tx_params_new["nonce"] = NonceManager.acquire(web3, from_checksummed)
 
     if access_list is not None:
         tx_params_new["accessList"] = access_list
@@ -256,6 +277,8 @@ def send_function_on_contract_tx_using_safe(
         access_list=access_list,
         tx_params=tx_params,
     )
+    # Safe's nonce isn't used, transaction is only used to build the multisig transaction below.
+    _release_nonce(web3, tx_params)
     safe_tx = s.build_multisig_tx(
         to=Web3.to_checksum_address(tx_params["to"]),
         data=HexBytes(tx_params["data"]),
@@ -269,25 +292,109 @@ def send_function_on_contract_tx_using_safe(
     return receipt_tx
 
 
+def send_function_calls_on_contract_tx_using_safe_multisend(
+    web3: Web3,
+    contract_address: ChecksumAddress,
+    contract_abi: ABI,
+    from_private_key: PrivateKey,
+    safe_address: ChecksumAddress,
+    calls: list[tuple[str, Optional[list[Any] | dict[str, Any]]]],
+    values: list[Wei] | None = None,
+    timeout: int = 180,
+) -> TxReceipt:
+    """
+    Executes all the function calls (function name and its parameters) on the contract in a single Safe transaction,
+    by delegating to Safe's MultiSendCallOnly contract.
+    If `values` are given, each call sends the corresponding amount of chain's native currency from the Safe.
+    """
+    if values is not None and len(values) != len(calls):
+        raise ValueError("There must be exactly one value for each call.")
+    if not web3.provider.endpoint_uri:  # type: ignore
+        raise EnvironmentError("RPC_URL not available in web3 object.")
+    ethereum_client = EthereumClient(ethereum_node_url=URI(web3.provider.endpoint_uri))  # type: ignore
+    s = Safe(safe_address, ethereum_client)  # type: ignore
+    # Raises if the MultiSend contract isn't deployed on this chain, so the address is always set below.
+    multisend = MultiSend(ethereum_client, call_only=True)
+    contract = get_cached_web3_contract(web3, contract_address, contract_abi)
+    multisend_txs = [
+        MultiSendTx(
+            MultiSendOperation.CALL,
+            contract_address,
+            values[i] if values is not None else 0,
+            contract.functions[function_name](*parse_function_params(function_params))._encode_transaction_data(),  # type: ignore # TODO: Fix Mypy, as this works just OK.
+        )
+        for i, (function_name, function_params) in enumerate(calls)
+    ]
+    safe_tx = s.build_multisig_tx(
+        to=cast(ChecksumAddress, multisend.address),
+        value=0,
+        data=multisend.build_tx_data(multisend_txs),
+        operation=SafeOperationEnum.DELEGATE_CALL.value,
+    )
+    safe_tx.sign(from_private_key.get_secret_value())
+    safe_tx.call()  # simulate call
+    tx_hash, tx = safe_tx.execute(from_private_key.get_secret_value())
+    receipt_tx = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+    check_tx_receipt(receipt_tx)
+    return receipt_tx
+
+
 def sign_send_and_get_receipt_tx(
     web3: Web3,
     tx_params_new: TxParams,
     from_private_key: PrivateKey,
     timeout: int = 180,
 ) -> TxReceipt:
-    # Sign with the private key.
-    signed_tx = web3.eth.account.sign_transaction(
-        tx_params_new, private_key=from_private_key.get_secret_value()
-    )
-    # Send the signed transaction.
-    send_tx = web3.eth.send_raw_transaction(signed_tx.rawTransaction)
-    # And wait for the receipt.
-    receipt_tx = web3.eth.wait_for_transaction_receipt(send_tx, timeout=timeout)
+    tx_hash = sign_and_send_tx(web3, tx_params_new, from_private_key)
+    return wait_for_receipt_tx(web3, tx_params_new, tx_hash, timeout)
+
+
+def sign_and_send_tx(
+    web3: Web3,
+    tx_params_new: TxParams,
+    from_private_key: PrivateKey,
+) -> HexBytes:
+    """
+    Sends the transaction without waiting for it to be mined, use `wait_for_receipt_tx` to wait for it.
+    """
+    try:
+        # Sign with the private key.
+        signed_tx = web3.eth.account.sign_transaction(
+            tx_params_new, private_key=from_private_key.get_secret_value()
+        )
+        # Send the signed transaction.
+        tx_hash = web3.eth.send_raw_transaction(signed_tx.rawTransaction)
+    except Exception:
+        _release_nonce(web3, tx_params_new, failed=True)
+        raise
+    return HexBytes(tx_hash)
+
+
+def wait_for_receipt_tx(
+    web3: Web3,
+    tx_params_new: TxParams,
+    tx_hash: HexBytes,
+    timeout: int = 180,
+) -> TxReceipt:
+    try:
+        receipt_tx = web3.eth.wait_for_transaction_receipt(tx_hash, timeout=timeout)
+    finally:
+        _release_nonce(web3, tx_params_new)
     # Verify it didn't fail.
     check_tx_receipt(receipt_tx)
     return receipt_tx
 
 
+def _release_nonce(web3: Web3, tx_params: TxParams, failed: bool = False) -> None:
+    if "nonce" in tx_params and "from" in tx_params:
+        NonceManager.release(
+            web3,
+            Web3.to_checksum_address(tx_params["from"]),
+            tx_params["nonce"],
+            failed=failed,
+        )
+
+
 def send_xdai_to(
     web3: Web3,
     from_private_key: PrivateKey,
@@ -303,19 +410,22 @@ def send_xdai_to(
         tx_params_new.update(tx_params)
     tx_params_new = _prepare_tx_params(web3, from_address, tx_params=tx_params_new)
 
-    # We need gas and gasPrice here (and not elsewhere) because we are not calling
-    # contract.functions.myFunction().build_transaction, which autofills some params
-    # with defaults, incl. gas and gasPrice.
-    gas = web3.eth.estimate_gas(tx_params_new)
-    tx_params_new["gas"] = int(
-        gas * 1.5
-    )  # We conservatively overestimate gas here, knowing it will be returned if unused
-    tx_params_new["gasPrice"] = web3.eth.gas_price
-
-    receipt_tx = sign_send_and_get_receipt_tx(
-        web3, tx_params_new, from_private_key, timeout
-    )
-    return receipt_tx
+    try:
+        # We need gas and gasPrice here (and not elsewhere) because we are not calling
+        # contract.functions.myFunction().build_transaction, which autofills some params
+        # with defaults, incl. gas and gasPrice.
+        gas = web3.eth.estimate_gas(tx_params_new)
+        tx_params_new["gas"] = int(
+            gas * 1.5
+        )  # We conservatively overestimate gas here, knowing it will be returned if unused
+        tx_params_new["gasPrice"] = web3.eth.gas_price
+        tx_hash = sign_and_send_tx(web3, tx_params_new, from_private_key)
+    except Exception:
+        # Nonce would stay in flight forever otherwise, and later transactions would wait behind it.
+        _release_nonce(web3, tx_params_new, failed=True)
+        raise
+
+    return wait_for_receipt_tx(web3, tx_params_new, tx_hash, timeout)
 
 
 def ipfscidv0_to_byte32(cid: IPFSCIDVersion0) -> HexBytes:
@@ -0,0 +1,90 @@
+import json
+import os
+import statistics
+import time
+import typing as t
+from itertools import islice
+
+import typer
+from pydantic import BaseModel
+
+from prediction_market_agent_tooling.loggers import logger
+from prediction_market_agent_tooling.markets.omen.data_models import OmenBet, OmenMarket
+from prediction_market_agent_tooling.markets.omen.omen_subgraph_handler import (
+    OmenSubgraphHandler,
+)
+from prediction_market_agent_tooling.tools.validation import validate_models
+
+BaseModelT = t.TypeVar("BaseModelT", bound=BaseModel)
+
+
+def main(
+    markets_fixture: str = typer.Option("markets.json"),
+    trades_fixture: str = typer.Option("trades.json"),
+    n_markets: int = typer.Option(10_000),
+    n_trades: int = typer.Option(50_000),
+    repeat: int = typer.Option(5),
+) -> None:
+    """
+    Micro-benchmark of the validation of subgraph items, item by item versus in bulk (`validate_models`), with and without the trusted mode.
+
+    Fixtures are raw items as returned by the subgraph, if they don't exist yet, they are recorded first (that requires `GRAPH_API_KEY`):
+
+    ```bash
+    python scripts/benchmark_subgraph_validation.py --markets-fixture markets.json --trades-fixture trades.json
+    ```
+    """
+    markets = load_or_record(
+        markets_fixture,
+        lambda: OmenSubgraphHandler().iter_raw_markets_created_since(0),
+        n_markets,
+    )
+    trades = load_or_record(
+        trades_fixture,
+        lambda: OmenSubgraphHandler().iter_raw_trades_created_since(0),
+        n_trades,
+    )
+
+    fixtures: list[tuple[t.Type[BaseModel], list[dict[str, t.Any]]]] = [
+        (OmenMarket, markets),
+        (OmenBet, trades),
+    ]
+    for model, items in fixtures:
+        one_by_one = benchmark(lambda: [model.model_validate(i) for i in items], repeat)
+        bulk = benchmark(lambda: validate_models(model, items), repeat)
+        trusted = benchmark(lambda: validate_models(model, items, trusted=True), repeat)
+        logger.info(
+            f"{model.__name__} x {len(items)}: one by one {one_by_one:.3f}s, "
+            f"bulk {bulk:.3f}s ({one_by_one / bulk:.1f}x), "
+            f"bulk trusted {trusted:.3f}s ({one_by_one / trusted:.1f}x)."
+        )
+
+
+def load_or_record(
+    path: str,
+    iter_raw_items: t.Callable[[], t.Iterator[dict[str, t.Any]]],
+    n_items: int,
+) -> list[dict[str, t.Any]]:
+    if not os.path.exists(path):
+        logger.info(f"Recording {n_items} items into {path}.")
+        with open(path, "w") as f:
+            json.dump(list(islice(iter_raw_items(), n_items)), f)
+    with open(path) as f:
+        items: list[dict[str, t.Any]] = json.load(f)
+    return items[:n_items]
+
+
+def benchmark(func: t.Callable[[], t.Sequence[BaseModelT]], repeat: int) -> float:
+    """
+    Returns the median time out of `repeat` runs, garbage collector pauses make the timings noisy.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times)
+
+
+if __name__ == "__main__":
+    typer.run(main)
@@ -0,0 +1,71 @@
+import time
+import typing as t
+
+from prediction_market_agent_tooling.deploy.agent import DeployableTraderAgent
+from prediction_market_agent_tooling.gtypes import Probability
+from prediction_market_agent_tooling.markets.agent_market import (
+    AgentMarket,
+    FilterBy,
+    SortBy,
+)
+from prediction_market_agent_tooling.markets.data_models import (
+    PlacedTrade,
+    ProbabilisticAnswer,
+)
+from prediction_market_agent_tooling.markets.markets import MarketType
+
+
+class SlowAnsweringAgent(DeployableTraderAgent):
+    bet_on_n_markets_per_run = 2
+    max_concurrent_markets = 5
+
+    def load(self) -> None:
+        self.traded_markets: list[str] = []
+
+    def get_markets(
+        self,
+        market_type: MarketType,
+        limit: int = 20,
+        sort_by: SortBy = SortBy.CLOSING_SOONEST,
+        filter_by: FilterBy = FilterBy.OPEN,
+    ) -> t.Sequence[AgentMarket]:
+        return [
+            AgentMarket(
+                id=str(i),
+                question=f"Question {i}?",
+                description=None,
+                outcomes=["Yes", "No"],
+                outcome_token_pool=None,
+                resolution=None,
+                created_time=None,
+                close_time=None,
+                current_p_yes=Probability(0.5),
+                url="https://example.com",
+                volume=None,
+            )
+            for i in range(20)
+        ]
+
+    def verify_market(self, market_type: MarketType, market: AgentMarket) -> bool:
+        return True
+
+    def answer_binary_market(self, market: AgentMarket) -> ProbabilisticAnswer | None:
+        time.sleep(0.2)
+        return ProbabilisticAnswer(p_yes=Probability(0.6), confidence=0.5)
+
+    def trade_on_market(
+        self, market: AgentMarket, answer: ProbabilisticAnswer
+    ) -> list[PlacedTrade]:
+        self.traded_markets.append(market.id)
+        return []
+
+
+def test_process_markets_concurrently_stops_after_n_markets() -> None:
+    agent = SlowAnsweringAgent(enable_langfuse=False)
+    start = time.monotonic()
+    agent.process_markets(MarketType.MANIFOLD)
+
+    assert len(agent.traded_markets) == agent.bet_on_n_markets_per_run
+    # Markets were answered concurrently and the remaining ones were cancelled.
+    assert time.monotonic() - start < 20 * 0.2 / 2
+    assert agent._markets_left_to_trade is None
@@ -0,0 +1,140 @@
+import json
+import threading
+import time
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from prediction_market_agent_tooling.markets.manifold import api
+
+NOW_MS = int(time.time() * 1000)
+
+
+def lite_market(n: int, probability: float = 0.5) -> dict[str, t.Any]:
+    return {
+        "id": f"market-{n}",
+        "question": f"Will {n} happen?",
+        "creatorId": "creator",
+        "closeTime": NOW_MS + 86_400_000,
+        "createdTime": NOW_MS - n,
+        "creatorName": "Creator",
+        "creatorUsername": "creator",
+        "isResolved": False,
+        "lastUpdatedTime": NOW_MS,
+        "mechanism": "cpmm-1",
+        "outcomeType": "BINARY",
+        "pool": {"NO": 10.0, "YES": 20.0},
+        "probability": probability,
+        "slug": f"will-{n}-happen",
+        "uniqueBettorCount": 1,
+        "url": f"https://manifold.markets/creator/will-{n}-happen",
+        "volume": 100.0,
+        "volume24Hours": 10.0,
+    }
+
+
+def full_market(n: int, probability: float = 0.5) -> dict[str, t.Any]:
+    return {
+        **lite_market(n, probability),
+        "description": f"Description of {n}.",
+        "textDescription": f"Description of {n}.",
+    }
+
+
+class _FakeManifoldHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    n_markets = 10
+    # Markets whose search results already contain the full data.
+    full_in_search: set[int] = set()
+    probability = 0.5
+    requests: list[str] = []
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        self.requests.append(url.path)
+        if url.path == "/v0/search-markets":
+            query = parse_qs(url.query)
+            offset, limit = int(query["offset"][0]), int(query["limit"][0])
+            self._respond(
+                [
+                    (
+                        full_market(n, self.probability)
+                        if n in self.full_in_search
+                        else lite_market(n, self.probability)
+                    )
+                    for n in range(offset, min(offset + limit, self.n_markets))
+                ]
+            )
+        else:
+            self._respond(
+                full_market(int(url.path.rsplit("-", 1)[1]), self.probability)
+            )
+
+    def _respond(self, data: t.Any) -> None:
+        body = json.dumps(data)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_manifold(monkeypatch: pytest.MonkeyPatch) -> t.Generator[None, None, None]:
+    _FakeManifoldHandler.requests = []
+    _FakeManifoldHandler.probability = 0.5
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeManifoldHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        api, "MANIFOLD_API_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}"
+    )
+    monkeypatch.setattr(api, "_market_details_cache", type(api._market_details_cache)())
+    yield
+    server.shutdown()
+
+
+def test_get_full_manifold_binary_markets(fake_manifold: None) -> None:
+    _FakeManifoldHandler.full_in_search = {0, 1}
+
+    markets = api.get_full_manifold_binary_markets(limit=5, sort="newest")
+
+    assert [m.id for m in markets] == [f"market-{n}" for n in range(5)]
+    assert all(
+        m.textDescription == f"Description of {n}." for n, m in enumerate(markets)
+    )
+    # Details are fetched only for markets that weren't complete in the search results.
+    assert sorted(_FakeManifoldHandler.requests) == sorted(
+        ["/v0/search-markets"] + [f"/v0/market/market-{n}" for n in range(2, 5)]
+    )
+
+    # Second time, details of all the markets are in the cache, but the prices come from the new search results.
+    _FakeManifoldHandler.requests = []
+    _FakeManifoldHandler.full_in_search = set()
+    _FakeManifoldHandler.probability = 0.7
+    updated_markets = api.get_full_manifold_binary_markets(limit=5, sort="newest")
+    assert _FakeManifoldHandler.requests == ["/v0/search-markets"]
+    assert all(m.probability == 0.7 for m in updated_markets)
+    assert updated_markets == [
+        m.model_copy(update={"probability": 0.7}) for m in markets
+    ]
+
+
+def test_get_manifold_markets_details_cache_expires(
+    fake_manifold: None, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(api, "MARKET_DETAILS_CACHE_TTL", api.timedelta(0))
+
+    # Each market is fetched only once.
+    api.get_manifold_markets(["market-0", "market-1", "market-0"])
+    assert len(_FakeManifoldHandler.requests) == 2
+    api.get_full_manifold_binary_markets(limit=1, sort="newest")
+    assert _FakeManifoldHandler.requests[2:] == [
+        "/v0/search-markets",
+        "/v0/market/market-0",
+    ]
@@ -124,6 +124,20 @@ def test_get_binary_market_p_yes_history() -> None:
     assert history[0] == 0.5
 
 
+def test_prefetch_p_yes_histories_matches_single_fetch() -> None:
+    markets = [
+        OmenAgentMarket.from_data_model(m)
+        for m in OmenSubgraphHandler().get_omen_binary_markets_simple(
+            limit=10, filter_by=FilterBy.RESOLVED, sort_by=SortBy.NEWEST
+        )
+    ]
+    OmenAgentMarket.prefetch_p_yes_histories(markets)
+    for market in markets:
+        assert market._binary_market_p_yes_history == get_binary_market_p_yes_history(
+            market
+        )
+
+
 def test_get_positions_0() -> None:
     """
     Create a new account and verify that there are no positions for the account
@@ -0,0 +1,332 @@
+import threading
+import time
+import typing as t
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from prediction_market_agent_tooling.gtypes import HexAddress, HexStr
+from prediction_market_agent_tooling.markets.agent_market import SortBy
+from prediction_market_agent_tooling.markets.omen import omen_local_index
+from prediction_market_agent_tooling.markets.omen.omen_local_index import OmenLocalIndex
+from prediction_market_agent_tooling.tools.utils import to_int_timestamp, utcnow
+
+NOW = to_int_timestamp(utcnow())
+CREATOR = "0x" + "a" * 40
+BETTER = "0x" + "b" * 40
+
+
+def market_item(
+    n: int, creation_timestamp: int, resolved: bool = False
+) -> dict[str, t.Any]:
+    return {
+        "id": f"0x{n:040x}",
+        "title": f"Market {n}?",
+        "creator": CREATOR,
+        "category": "misc",
+        "collateralVolume": "0",
+        "usdVolume": "0",
+        "liquidityParameter": str(10**18),
+        "collateralToken": "0x" + "c" * 40,
+        "outcomes": ["Yes", "No"],
+        "outcomeTokenAmounts": ["1000", "1000"],
+        "outcomeTokenMarginalPrices": ["0.5", "0.5"],
+        "lastActiveDay": "0",
+        "lastActiveHour": "0",
+        "fee": "20000000000000000",
+        "answerFinalizedTimestamp": str(NOW - 100) if resolved else None,
+        "resolutionTimestamp": str(NOW - 50) if resolved else None,
+        "currentAnswer": "0x" + "0" * 64 if resolved else None,
+        "creationTimestamp": str(creation_timestamp),
+        "condition": {"id": f"0x{n:064x}", "outcomeSlotCount": 2},
+        "question": {
+            "id": f"0x{n:064x}",
+            "title": f"Market {n}?",
+            "outcomes": ["Yes", "No"],
+            "answerFinalizedTimestamp": None,
+            "currentAnswer": None,
+            "data": f"Market {n}?",
+            "templateId": 2,
+            "isPendingArbitration": False,
+            "openingTimestamp": str(NOW - 1000 if resolved else NOW + 1000),
+        },
+    }
+
+
+def trade_item(
+    n: int, market: dict[str, t.Any], creation_timestamp: int
+) -> dict[str, t.Any]:
+    return {
+        "id": f"{market['id']}{BETTER[2:]}{n}",
+        "title": market["title"],
+        "collateralToken": market["collateralToken"],
+        "outcomeTokenMarginalPrice": "0.6",
+        "oldOutcomeTokenMarginalPrice": "0.5",
+        "type": "Buy",
+        "creator": {"id": BETTER},
+        "creationTimestamp": str(creation_timestamp),
+        "collateralAmount": str(10**18),
+        "collateralAmountUSD": "1",
+        "feeAmount": "0",
+        "outcomeIndex": "0",
+        "outcomeTokensTraded": str(2 * 10**18),
+        "transactionHash": "0x" + "d" * 64,
+        "fpmm": market,
+    }
+
+
+class FakeOmenSubgraph:
+    def __init__(self) -> None:
+        self.markets: dict[str, dict[str, t.Any]] = {}
+        self.trades: list[dict[str, t.Any]] = []
+        self.questions: list[dict[str, t.Any]] = []
+        self.liquidity_changes: list[dict[str, t.Any]] = []
+        self.requested_since: list[int] = []
+
+    def iter_raw_markets_created_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        self.requested_since.append(timestamp)
+        return (
+            m
+            for m in self.markets.values()
+            if int(m["creationTimestamp"]) >= timestamp
+            and m["title"] is not None
+            and m["question"] is not None
+        )
+
+    def iter_raw_markets_by_id(self, ids: list[str]) -> t.Iterator[dict[str, t.Any]]:
+        return (self.markets[id_] for id_ in ids if id_ in self.markets)
+
+    def iter_raw_trades_created_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        return (
+            {**t, "fpmm": self.markets[t["fpmm"]["id"]]}
+            for t in self.trades
+            if int(t["creationTimestamp"]) >= timestamp
+        )
+
+    def iter_raw_reality_questions_updated_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        return (q for q in self.questions if int(q["updatedTimestamp"]) >= timestamp)
+
+    def iter_raw_markets_resolved_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        return (
+            m
+            for m in self.markets.values()
+            if m["resolutionTimestamp"] is not None
+            and int(m["resolutionTimestamp"]) >= timestamp
+            and m["question"] is not None
+        )
+
+    def iter_raw_markets_by_question_id(
+        self, question_ids: list[str]
+    ) -> t.Iterator[dict[str, t.Any]]:
+        return (
+            m
+            for m in self.markets.values()
+            if m["question"] is not None and m["question"]["id"] in question_ids
+        )
+
+    def iter_raw_liquidity_changes_since(
+        self, timestamp: int
+    ) -> t.Iterator[dict[str, t.Any]]:
+        return (
+            c
+            for c in self.liquidity_changes
+            if int(c["creationTimestamp"]) >= timestamp
+        )
+
+
+@pytest.fixture
+def local_index(tmp_path: Path) -> OmenLocalIndex:
+    return OmenLocalIndex(
+        sqlalchemy_db_url=f"sqlite:///{tmp_path / 'omen.db'}",
+        max_staleness=timedelta(hours=1),
+    )
+
+
+def test_local_index_answers_queries(local_index: OmenLocalIndex) -> None:
+    subgraph = FakeOmenSubgraph()
+    open_market = market_item(1, creation_timestamp=NOW - 300)
+    resolved_market = market_item(2, creation_timestamp=NOW - 200, resolved=True)
+    categorical_market = {
+        **market_item(3, creation_timestamp=NOW - 100),
+        "outcomes": ["A", "B", "C"],
+    }
+    for m in [open_market, resolved_market, categorical_market]:
+        subgraph.markets[m["id"]] = m
+    subgraph.trades.append(trade_item(0, open_market, NOW - 250))
+    subgraph.trades.append(trade_item(1, resolved_market, NOW - 150))
+
+    local_index.sync(subgraph)
+
+    markets = local_index.get_markets(limit=None, sort_by=SortBy.NEWEST)
+    assert [m.id for m in markets] == [resolved_market["id"], open_market["id"]]
+    assert [m.id for m in local_index.get_markets(limit=None, resolved=True)] == [
+        resolved_market["id"]
+    ]
+    assert [
+        m.id for m in local_index.get_markets(limit=None, opened_after=utcnow())
+    ] == [open_market["id"]]
+
+    bets = local_index.get_trades(
+        better_address=BETTER,  # type: ignore[arg-type] # Not checksummed in the test data.
+        start_time=utcnow() - timedelta(seconds=200),
+    )
+    assert [b.fpmm.id for b in bets] == [resolved_market["id"]]
+    assert (
+        len(
+            local_index.get_trades(
+                market_id=HexAddress(HexStr(open_market["id"])),  # type: ignore[arg-type]
+                filter_by_answer_finalized_not_null=True,
+            )
+        )
+        == 0
+    )
+
+
+def test_local_index_syncs_incrementally(local_index: OmenLocalIndex) -> None:
+    subgraph = FakeOmenSubgraph()
+    market = market_item(1, creation_timestamp=NOW - 300)
+    subgraph.markets[market["id"]] = market
+    local_index.sync(subgraph)
+    assert not local_index.is_stale()
+
+    # New trade moves the market, the stored market should be updated together with it.
+    subgraph.markets[market["id"]] = {**market, "liquidityParameter": "0"}
+    subgraph.trades.append(trade_item(0, market, NOW - 10))
+    new_market = market_item(2, creation_timestamp=NOW - 5)
+    subgraph.markets[new_market["id"]] = new_market
+    local_index.sync(subgraph)
+
+    assert subgraph.requested_since == [0, NOW - 300]
+    markets = local_index.get_markets(limit=None, sort_by=SortBy.NEWEST)
+    assert [m.id for m in markets] == [new_market["id"], market["id"]]
+    assert markets[1].liquidityParameter == 0
+    assert len(local_index.get_trades()) == 1
+    assert [
+        t.fpmm.id
+        for t in local_index.get_trades(
+            market_id_in=[HexAddress(HexStr(new_market["id"])), market["id"]]
+        )
+    ] == [market["id"]]
+
+
+def test_local_index_syncs_trades_in_chunks_and_skips_markets_without_question(
+    local_index: OmenLocalIndex, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(omen_local_index, "TRADES_SYNC_CHUNK_SIZE", 1)
+    subgraph = FakeOmenSubgraph()
+    market = market_item(1, creation_timestamp=NOW - 300)
+    market_without_question = {
+        **market_item(2, creation_timestamp=NOW - 200),
+        "question": None,
+    }
+    for m in [market, market_without_question]:
+        subgraph.markets[m["id"]] = m
+    subgraph.trades.append(trade_item(0, market, NOW - 100))
+    subgraph.trades.append(trade_item(1, market_without_question, NOW - 50))
+    subgraph.trades.append(trade_item(2, market, NOW - 150))
+
+    local_index.sync(subgraph)
+
+    assert [m.id for m in local_index.get_markets(limit=None)] == [market["id"]]
+    assert sorted(t.id for t in local_index.get_trades()) == sorted(
+        t["id"] for t in subgraph.trades if t["fpmm"]["id"] == market["id"]
+    )
+    assert local_index._get_last_timestamp("omen_index_trade") == NOW - 50
+
+
+def test_local_index_refreshes_only_changed_markets(
+    local_index: OmenLocalIndex,
+) -> None:
+    subgraph = FakeOmenSubgraph()
+    # All of them opened long ago, they are refreshed anyway once something changes.
+    markets = [market_item(n, creation_timestamp=NOW - 100_000 - n) for n in range(5)]
+    for m in markets:
+        m["question"]["openingTimestamp"] = str(NOW - 90_000)
+        subgraph.markets[m["id"]] = m
+    local_index.sync(subgraph)
+
+    # Market 1 is answered, market 2 resolved, liquidity of market 3 is withdrawn, market 4 doesn't change.
+    # Market 0 is the newest, so it's fetched again anyway as the sync of the new markets is inclusive.
+    subgraph.markets[markets[1]["id"]] = {
+        **markets[1],
+        "answerFinalizedTimestamp": str(NOW + 100),
+        "currentAnswer": "0x" + "0" * 64,
+    }
+    subgraph.questions.append(
+        {
+            "id": "question-1",
+            "user": CREATOR,
+            "updatedTimestamp": str(NOW - 10),
+            "questionId": markets[1]["question"]["id"],
+            "contentHash": "0x" + "c" * 64,
+            "historyHash": "0x" + "f" * 64,
+            "answerFinalizedTimestamp": str(NOW + 100),
+            "currentScheduledFinalizationTimestamp": str(NOW + 100),
+        }
+    )
+    subgraph.markets[markets[2]["id"]] = {
+        **markets[2],
+        "answerFinalizedTimestamp": str(NOW - 100),
+        "resolutionTimestamp": str(NOW - 5),
+        "currentAnswer": "0x" + "0" * 64,
+    }
+    subgraph.markets[markets[3]["id"]] = {**markets[3], "liquidityParameter": "0"}
+    subgraph.liquidity_changes.append(
+        {
+            "id": "liquidity-3",
+            "fpmm": {"id": markets[3]["id"]},
+            "creationTimestamp": str(NOW - 20),
+        }
+    )
+    # Changed in the subgraph without any event the index follows, so it must not be fetched again.
+    subgraph.markets[markets[4]["id"]] = {**markets[4], "category": "changed"}
+    local_index.sync(subgraph)
+
+    by_id = {m.id: m for m in local_index.get_markets(limit=None)}
+    assert by_id[markets[1]["id"]].answerFinalizedTimestamp == NOW + 100
+    assert by_id[markets[2]["id"]].resolutionTimestamp == NOW - 5
+    assert by_id[markets[3]["id"]].liquidityParameter == 0
+    assert by_id[markets[4]["id"]].category == "misc"
+
+
+def test_local_index_sync_if_stale(
+    local_index: OmenLocalIndex, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    subgraph = FakeOmenSubgraph()
+
+    # The first, full, sync needs to be run explicitly.
+    assert not local_index.sync_if_stale(subgraph)
+    assert subgraph.requested_since == []
+    local_index.sync(subgraph)
+
+    monkeypatch.setattr(local_index, "max_staleness", timedelta(0))
+    original_sync = local_index._sync
+
+    def slow_sync(source: omen_local_index.OmenIndexSource) -> None:
+        # Long enough for all the callers to find the index stale.
+        time.sleep(0.2)
+        original_sync(source)
+        # Now it's fresh, until the other callers get the lock.
+        local_index.max_staleness = timedelta(hours=1)
+
+    monkeypatch.setattr(local_index, "_sync", slow_sync)
+    threads = [
+        threading.Thread(target=local_index.sync_if_stale, args=(subgraph,))
+        for _ in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Only one of the concurrent callers synced it.
+    assert len(subgraph.requested_since) == 2
@@ -0,0 +1,215 @@
+import threading
+import time
+import typing as t
+
+import pytest
+
+from prediction_market_agent_tooling.config import APIKeys
+from prediction_market_agent_tooling.gtypes import HexBytes, Wei
+from prediction_market_agent_tooling.markets.data_models import Resolution
+from prediction_market_agent_tooling.markets.markets import MarketType
+from prediction_market_agent_tooling.markets.omen import omen_resolving
+from prediction_market_agent_tooling.markets.omen.data_models import (
+    INVALID_ANSWER_HEX_BYTES,
+    OmenMarket,
+    RealityResponse,
+)
+from prediction_market_agent_tooling.markets.omen.omen_contracts import (
+    OmenRealitioContract,
+)
+from prediction_market_agent_tooling.tools.web3_utils import ZERO_BYTES
+from tests.markets.omen.test_omen_local_index import NOW, market_item
+
+
+def test_find_resolutions_on_other_markets(monkeypatch: pytest.MonkeyPatch) -> None:
+    markets = [
+        OmenMarket.model_validate(market_item(n, creation_timestamp=NOW))
+        for n in range(3)
+    ]
+    # Market 0 is resolved on Manifold, market 1 on Polymarket, market 2 nowhere.
+    answers = {
+        (MarketType.MANIFOLD, markets[0].question_title): Resolution.YES,
+        (MarketType.POLYMARKET, markets[1].question_title): Resolution.NO,
+    }
+    lock = threading.Lock()
+    calls: list[tuple[MarketType, str]] = []
+
+    def fake_find_resolution_on_market_type(
+        market_type: MarketType, question: str
+    ) -> Resolution | None:
+        with lock:
+            calls.append((market_type, question))
+        time.sleep(0.1)
+        return answers.get((market_type, question))
+
+    monkeypatch.setattr(
+        omen_resolving,
+        "find_resolution_on_market_type",
+        fake_find_resolution_on_market_type,
+    )
+
+    start = time.monotonic()
+    resolutions = omen_resolving.find_resolutions_on_other_markets(markets)
+
+    # All 6 lookups ran at once, not one after another.
+    assert time.monotonic() - start < 0.4
+    assert len(calls) == 6
+    assert resolutions == {
+        markets[0].id: Resolution.YES,
+        markets[1].id: Resolution.NO,
+        markets[2].id: None,
+    }
+
+
+def test_find_resolutions_on_other_markets_prefers_platforms_in_order(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    market = OmenMarket.model_validate(market_item(0, creation_timestamp=NOW))
+
+    def fake_find_resolution_on_market_type(
+        market_type: MarketType, question: str
+    ) -> Resolution | None:
+        # Manifold is first in the order, but answers later than Polymarket.
+        if market_type == MarketType.MANIFOLD:
+            time.sleep(0.1)
+            return Resolution.YES
+        return Resolution.NO
+
+    monkeypatch.setattr(
+        omen_resolving,
+        "find_resolution_on_market_type",
+        fake_find_resolution_on_market_type,
+    )
+
+    assert omen_resolving.RESOLUTION_LOOKUP_MARKET_TYPES[0] == MarketType.MANIFOLD
+    assert omen_resolving.find_resolutions_on_other_markets([market]) == {
+        market.id: Resolution.YES
+    }
+
+
+def test_find_resolutions_on_other_markets_raises_if_lookup_fails(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    markets = [
+        OmenMarket.model_validate(market_item(n, creation_timestamp=NOW))
+        for n in range(2)
+    ]
+
+    def fake_find_resolution_on_market_type(
+        market_type: MarketType, question: str
+    ) -> Resolution | None:
+        if market_type == MarketType.MANIFOLD and question == markets[1].question_title:
+            raise ConnectionError("Manifold is down.")
+        return None
+
+    monkeypatch.setattr(
+        omen_resolving,
+        "find_resolution_on_market_type",
+        fake_find_resolution_on_market_type,
+    )
+
+    # Not found anywhere would make it invalid, so the failure can't be treated as not found.
+    with pytest.raises(ConnectionError):
+        omen_resolving.find_resolutions_on_other_markets(markets)
+
+
+def response_item(n: int, question_id: HexBytes) -> dict[str, t.Any]:
+    return {
+        "id": f"response-{n}",
+        "timestamp": NOW + n,
+        "answer": "0x" + f"{n % 2:064x}",
+        "isUnrevealed": False,
+        "isCommitment": False,
+        "bond": str(10**18 * 2**n),
+        "user": "0x" + f"{n:040x}",
+        "historyHash": "0x" + f"{n + 1:064x}",
+        "question": {
+            "id": f"question-{n}",
+            "user": "0x" + "a" * 40,
+            "historyHash": "0x" + "f" * 64,
+            "updatedTimestamp": NOW,
+            "contentHash": "0x" + "c" * 64,
+            "questionId": question_id.hex(),
+            "answerFinalizedTimestamp": NOW,
+            "currentScheduledFinalizationTimestamp": NOW,
+        },
+        "createdBlock": n,
+        "revealedBlock": None,
+    }
+
+
+def test_build_claim_winnings_params() -> None:
+    question_id = HexBytes("0x" + "1" * 64)
+    # Out of order, as they can come from the subgraph.
+    responses = [
+        RealityResponse.model_validate(response_item(n, question_id)) for n in [1, 0, 2]
+    ]
+
+    params = omen_resolving.build_claim_winnings_params(question_id, responses)
+
+    # Last-to-first, with history hash of the previous response, and zero for the first one.
+    assert params["question_id"] == question_id
+    assert params["history_hashes"] == [
+        HexBytes("0x" + f"{n + 1:064x}") for n in [1, 0]
+    ] + [ZERO_BYTES]
+    assert [a.lower() for a in params["addrs"]] == [
+        "0x" + f"{n:040x}" for n in [2, 1, 0]
+    ]
+    assert params["bonds"] == [10**18 * 2**n for n in [2, 1, 0]]
+
+    with pytest.raises(ValueError):
+        omen_resolving.build_claim_winnings_params(question_id, [])
+
+
+def test_finalize_markets_reports_failures_per_market(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    markets = [
+        OmenMarket.model_validate(
+            market_item(n, creation_timestamp=NOW - 10_000, resolved=True)
+        )
+        for n in range(4)
+    ]
+    sent: list[tuple[list[t.Any], list[Wei] | None]] = []
+
+    def fake_try_send_many(
+        self: OmenRealitioContract,
+        api_keys: APIKeys,
+        calls: list[t.Any],
+        values: list[Wei] | None = None,
+        **kwargs: t.Any,
+    ) -> list[t.Any]:
+        sent.append((calls, values))
+        # Submitting the answer for the third market fails.
+        return [
+            ValueError("Reverted.") if i == 2 else {"status": 1}
+            for i in range(len(calls))
+        ]
+
+    monkeypatch.setattr(OmenRealitioContract, "try_send_many", fake_try_send_many)
+
+    finalized = omen_resolving.finalize_markets(
+        APIKeys(),
+        [
+            (markets[0], Resolution.YES),
+            (markets[1], Resolution.CANCEL),
+            (markets[2], Resolution.NO),
+            (markets[3], None),  # Closed only recently, so skipped.
+        ],
+    )
+
+    # All answers were sent at once.
+    assert len(sent) == 1
+    calls, values = sent[0]
+    assert [(name, params["answer"]) for name, params in calls] == [
+        ("submitAnswer", HexBytes("0x" + "0" * 64)),
+        ("submitAnswer", INVALID_ANSWER_HEX_BYTES),
+        ("submitAnswer", HexBytes("0x" + "0" * 63 + "1")),
+    ]
+    # Same parameters as a single `submitAnswer` would send.
+    assert calls[0][1] == OmenRealitioContract.submit_answer_params(
+        question_id=markets[0].question.id, answer=HexBytes("0x" + "0" * 64)
+    )
+    assert values is not None and len(set(values)) == 1
+    # The invalid one doesn't count as finalized, and the failed one neither.
+    assert finalized == [markets[0].id]
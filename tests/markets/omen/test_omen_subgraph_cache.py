@@ -0,0 +1,115 @@
+import time
+import typing as t
+from datetime import timedelta
+from types import SimpleNamespace
+
+from subgrounds.query import Argument, Document, InputValue, Query, Selection
+from subgrounds.schema import TypeMeta, TypeRef
+
+from prediction_market_agent_tooling.markets.omen.omen_subgraph_cache import (
+    OmenSubgraphQueryCache,
+)
+from tests.markets.omen.test_omen_local_index import NOW, market_item
+
+
+def markets_query(
+    where: dict[str, InputValue.T] | None, fields: tuple[str, ...] = ("id",)
+) -> Document:
+    def field(name: str, type_name: str) -> TypeMeta.FieldMeta:
+        return TypeMeta.FieldMeta(
+            name=name, args=[], type=TypeRef.Named(name=type_name, kind="OBJECT")
+        )
+
+    return Document(
+        url="https://subgraph",
+        query=Query(
+            selection=[
+                Selection(
+                    fmeta=field("fixedProductMarketMakers", "FixedProductMarketMaker"),
+                    arguments=(
+                        [Argument("where", InputValue.Object(where))] if where else []
+                    ),
+                    selection=[
+                        Selection(fmeta=field(name, "String")) for name in fields
+                    ],
+                )
+            ]
+        ),
+    )
+
+
+class FakeSubgrounds:
+    def __init__(self, results: dict[str, list[dict[str, t.Any]]]) -> None:
+        self.results = results
+        self.queries: list[str] = []
+
+    def mk_request(self, documents: list[Document]) -> SimpleNamespace:
+        return SimpleNamespace(documents=documents)
+
+    def query_json(
+        self, document: Document, pagination_strategy: t.Any = None
+    ) -> list[dict[str, t.Any]]:
+        self.queries.append(document.graphql)
+        return self.results[document.graphql]
+
+
+def test_omen_subgraph_query_cache() -> None:
+    open_market = market_item(1, creation_timestamp=NOW - 300)
+    finalized_market = market_item(2, creation_timestamp=NOW - 300, resolved=True)
+    finalized_market["question"]["answerFinalizedTimestamp"] = str(NOW - 100)
+    by_id = markets_query(
+        {"id_in": InputValue.List([InputValue.String(finalized_market["id"])])}
+    )
+    open_by_id = markets_query(
+        {"id_in": InputValue.List([InputValue.String(open_market["id"])])}
+    )
+    listing = markets_query({"resolutionTimestamp_not": InputValue.Null()})
+    sg = FakeSubgrounds(
+        {
+            by_id.graphql: [{"fixedProductMarketMakers": [finalized_market]}],
+            open_by_id.graphql: [{"fixedProductMarketMakers": [open_market]}],
+            listing.graphql: [{"fixedProductMarketMakers": [finalized_market]}],
+        }
+    )
+    cache = OmenSubgraphQueryCache(
+        open_ttl=timedelta(milliseconds=50), finalized_ttl=timedelta(days=1)
+    )
+    query_json = cache.wrap(sg, sg.query_json)
+
+    for _ in range(2):
+        for document in [by_id, open_by_id, listing]:
+            assert query_json(document) == sg.results[document.graphql]
+    # Each query was fetched only once.
+    assert len(sg.queries) == 3
+    assert cache.stats().hit_rate == 0.5
+
+    time.sleep(0.1)
+    for document in [by_id, open_by_id, listing]:
+        query_json(document)
+    # Finalized market looked up by its id is still cached, but the open market and the listing (that can get new items) expired.
+    assert sg.queries[3:] == [open_by_id.graphql, listing.graphql]
+
+    # Different arguments are a different query.
+    query_json(by_id, pagination_strategy=None)
+    assert len(sg.queries) == 6
+
+
+def test_omen_subgraph_query_cache_ttl_of_markets_that_can_still_change() -> None:
+    cache = OmenSubgraphQueryCache(
+        open_ttl=timedelta(minutes=1), finalized_ttl=timedelta(days=1)
+    )
+    resolved_market = market_item(1, creation_timestamp=NOW - 300, resolved=True)
+    unresolved_market = market_item(2, creation_timestamp=NOW - 300, resolved=True)
+    unresolved_market["resolutionTimestamp"] = None
+    for market in [resolved_market, unresolved_market]:
+        market["question"]["answerFinalizedTimestamp"] = str(NOW - 100)
+
+    def ttl(market: dict[str, t.Any], fields: tuple[str, ...] = ("id",)) -> timedelta:
+        document = markets_query({"id": InputValue.String(market["id"])}, fields=fields)
+        return cache.get_ttl([document], [{"fixedProductMarketMakers": [market]}])
+
+    assert ttl(resolved_market) == cache.finalized_ttl
+    # Answer is finalized, but the market isn't resolved yet.
+    assert ttl(unresolved_market) == cache.open_ttl
+    # Liquidity can be withdrawn even from resolved markets.
+    assert ttl(resolved_market, fields=("id", "outcomeTokenAmounts")) == cache.open_ttl
@@ -1,5 +1,6 @@
 import sys
 from datetime import datetime
+from itertools import islice
 
 import pytest
 from eth_typing import HexAddress, HexStr
@@ -7,6 +8,9 @@ from web3 import Web3
 
 from prediction_market_agent_tooling.markets.agent_market import FilterBy, SortBy
 from prediction_market_agent_tooling.markets.omen.data_models import (
+    OmenMarket,
+    OmenMarketListing,
+    OmenMarketTrading,
     OmenPosition,
     OmenUserPosition,
 )
@@ -106,6 +110,63 @@ def test_get_bets(
     )
 
 
+def test_iter_trades_pages_through_all_trades(
+    agent0_address: str, omen_subgraph_handler: OmenSubgraphHandler
+) -> None:
+    better_address = Web3.to_checksum_address(agent0_address)
+    start_time, end_time = datetime(2024, 2, 1), datetime(2024, 3, 1)
+    trades = omen_subgraph_handler.get_trades(
+        better_address=better_address, start_time=start_time, end_time=end_time
+    )
+    iterated_trades = list(
+        omen_subgraph_handler.iter_trades(
+            better_address=better_address,
+            start_time=start_time,
+            end_time=end_time,
+            page_size=7,
+        )
+    )
+    assert len(trades) > 7, "Test needs more than one page of trades."
+    assert sorted(t.id for t in trades) == [t.id for t in iterated_trades]
+
+
+def test_iter_markets_can_stop_early(
+    omen_subgraph_handler: OmenSubgraphHandler,
+) -> None:
+    markets = list(
+        islice(omen_subgraph_handler.iter_markets(page_size=10, resolved=True), 25)
+    )
+    assert len(markets) == 25
+    assert len(set(m.id for m in markets)) == 25
+    for market in markets:
+        assert market.is_resolved
+
+
+def test_get_markets_projections(
+    omen_subgraph_handler: OmenSubgraphHandler,
+) -> None:
+    listings = omen_subgraph_handler.get_omen_binary_markets_simple(
+        limit=20, filter_by=FilterBy.RESOLVED, sort_by=SortBy.NEWEST, fields="listing"
+    )
+    tradings = omen_subgraph_handler.get_omen_binary_markets_simple(
+        limit=20, filter_by=FilterBy.RESOLVED, sort_by=SortBy.NEWEST, fields="trading"
+    )
+    markets = omen_subgraph_handler.get_omen_binary_markets_simple(
+        limit=20, filter_by=FilterBy.RESOLVED, sort_by=SortBy.NEWEST
+    )
+    assert all(type(m) is OmenMarketListing for m in listings)
+    assert all(type(m) is OmenMarketTrading for m in tradings)
+    assert (
+        [m.id for m in listings] == [m.id for m in tradings] == [m.id for m in markets]
+    )
+    assert [m.close_time for m in listings] == [m.close_time for m in markets]
+    assert [m.current_p_yes for m in tradings] == [m.current_p_yes for m in markets]
+
+    full_markets = omen_subgraph_handler.get_full_markets(listings[::-1])
+    assert all(isinstance(m, OmenMarket) for m in full_markets)
+    assert full_markets == markets[::-1]
+
+
 def test_filter_open_markets(omen_subgraph_handler: OmenSubgraphHandler) -> None:
     # ToDo
     limit = 100
@@ -0,0 +1,111 @@
+import json
+import threading
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from prediction_market_agent_tooling.gtypes import usdc_type
+from prediction_market_agent_tooling.markets.polymarket import api
+from prediction_market_agent_tooling.markets.polymarket.data_models import Prices
+from prediction_market_agent_tooling.tools.async_http import run_with_async_client
+
+
+def fake_price(token_id: str, side: str) -> str:
+    return str(int(token_id) / 100 + (0.01 if side.upper() == "BUY" else 0))
+
+
+class _FakeClobHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    batch_supported = True
+    # Number of the next batch requests that fail with a server error.
+    failing_batch_requests = 0
+    requests: list[str] = []
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        self.requests.append(url.path)
+        query = parse_qs(url.query)
+        self._respond(
+            200, {"price": fake_price(query["token_id"][0], query["side"][0])}
+        )
+
+    def do_POST(self) -> None:
+        self.requests.append(self.path)
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        if not self.batch_supported:
+            self._respond(404, {"error": "not found"})
+            return
+        if self.failing_batch_requests:
+            type(self).failing_batch_requests -= 1
+            self._respond(503, {"error": "unavailable"})
+            return
+        prices: dict[str, dict[str, str]] = {}
+        for item in body:
+            prices.setdefault(item["token_id"], {})[item["side"]] = fake_price(
+                item["token_id"], item["side"]
+            )
+        self._respond(200, prices)
+
+    def _respond(self, status: int, data: t.Any) -> None:
+        body = json.dumps(data)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_clob(monkeypatch: pytest.MonkeyPatch) -> t.Generator[None, None, None]:
+    _FakeClobHandler.requests = []
+    _FakeClobHandler.failing_batch_requests = 0
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeClobHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setattr(
+        api, "POLYMARKET_API_BASE_URL", f"http://127.0.0.1:{server.server_address[1]}"
+    )
+    monkeypatch.setattr(api, "PRICES_BATCH_SIZE", 2)
+    yield
+    server.shutdown()
+
+
+@pytest.mark.parametrize("batch_supported", [True, False])
+def test_get_token_prices(fake_clob: None, batch_supported: bool) -> None:
+    _FakeClobHandler.batch_supported = batch_supported
+    token_ids = ["10", "20", "30", "10"]
+
+    prices = run_with_async_client(
+        lambda client: api.get_token_prices_async(client, token_ids)
+    )
+
+    assert prices == {
+        token_id: Prices(
+            BUY=usdc_type(fake_price(token_id, "buy")),
+            SELL=usdc_type(fake_price(token_id, "sell")),
+        )
+        for token_id in token_ids
+    }
+    n_batch_requests = _FakeClobHandler.requests.count("/prices")
+    assert n_batch_requests == 2
+    assert _FakeClobHandler.requests.count("/price") == (
+        0 if batch_supported else 2 * 3
+    )
+
+
+def test_get_token_prices_retries_failed_batch(fake_clob: None) -> None:
+    _FakeClobHandler.batch_supported = True
+    _FakeClobHandler.failing_batch_requests = 1
+
+    prices = run_with_async_client(
+        lambda client: api.get_token_prices_async(client, ["10", "20"])
+    )
+
+    assert set(prices) == {"10", "20"}
+    # Batch request was retried, instead of falling back to the requests per token.
+    assert _FakeClobHandler.requests == ["/prices", "/prices"]
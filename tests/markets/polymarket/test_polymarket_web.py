@@ -0,0 +1,114 @@
+import json
+import typing as t
+
+from prediction_market_agent_tooling.markets.data_models import Resolution
+from prediction_market_agent_tooling.markets.polymarket.data_models_web import (
+    NEXT_DATA_START_TAG,
+    PolymarketFullMarket,
+    polymarket_slug_from_url,
+)
+
+FULL_MARKET = {
+    "id": "1",
+    "ticker": "will-it-rain",
+    "slug": "will-it-rain",
+    "title": "Will it rain?",
+    "description": "Resolves YES if it rains.",
+    "endDate": "2024-03-25T00:00:00Z",
+    "active": True,
+    "closed": True,
+    "createdAt": "2024-03-01T00:00:00Z",
+    "updatedAt": "2024-03-26T00:00:00Z",
+    "markets": [
+        {
+            "id": "2",
+            "question": "Will it rain?",
+            "conditionId": "0x" + "1" * 64,
+            "slug": "will-it-rain",
+            "endDate": "2024-03-25T00:00:00Z",
+            "description": "Resolves YES if it rains.",
+            "createdAt": "2024-03-01T00:00:00Z",
+            "outcomes": ["Yes", "No"],
+            "outcomePrices": ["1", "0"],
+            "active": True,
+            "closed": True,
+            "marketMakerAddress": "",
+            "resolutionData": {
+                "id": "3",
+                "author": "0x" + "2" * 40,
+                "lastUpdateTimestamp": "2024-03-26T00:00:00Z",
+                "status": "resolved",
+                "wasDisputed": False,
+                "price": "1",
+                "proposedPrice": "1",
+                "reproposedPrice": "0",
+                "updates": "",
+                "newVersionQ": False,
+                "transactionHash": "0x" + "3" * 64,
+                "logIndex": "0",
+            },
+        }
+    ],
+}
+
+
+def page(queries: list[dict[str, t.Any] | None]) -> str:
+    query_state = {
+        "dataUpdateCount": 1,
+        "dataUpdatedAt": 0,
+        "errorUpdateCount": 0,
+        "errorUpdatedAt": 0,
+        "fetchFailureCount": 0,
+        "isInvalidated": False,
+        "status": "success",
+        "fetchStatus": "idle",
+    }
+    next_data = {
+        "props": {
+            "pageProps": {
+                "key": "key",
+                "dehydratedState": {
+                    "mutations": [],
+                    "queries": [
+                        {
+                            "state": {**query_state, "data": data},
+                            "queryKey": ["key"],
+                            "queryHash": "hash",
+                        }
+                        for data in queries
+                    ],
+                },
+                "eslug": "will-it-rain",
+                "isSingleMarket": True,
+            }
+        },
+        "page": "/event/[slug]",
+    }
+    return f"<html><body>{NEXT_DATA_START_TAG}{json.dumps(next_data, indent=1)}</script></body></html>"
+
+
+def test_parse_full_market_from_page() -> None:
+    price = {"price": "0.5", "side": "BUY"}
+    full_market = PolymarketFullMarket.parse_from_page(page([price, FULL_MARKET]))
+    assert full_market is not None
+    assert full_market.slug == "will-it-rain"
+    assert full_market.main_market.resolution == Resolution.YES
+
+    assert PolymarketFullMarket.parse_from_page(page([price, None])) is None
+
+
+def test_parse_full_market_from_page_skips_other_queries_with_markets() -> None:
+    # E.g. a list of related events, it isn't the full market even though it has `markets`.
+    related_events = {"events": [], "markets": [{"id": "4"}]}
+    full_market = PolymarketFullMarket.parse_from_page(
+        page([related_events, FULL_MARKET])
+    )
+    assert full_market is not None
+    assert full_market.id == "1"
+
+
+def test_polymarket_slug_from_url() -> None:
+    assert (
+        polymarket_slug_from_url("https://polymarket.com/event/will-it-rain/")
+        == "event/will-it-rain"
+    )
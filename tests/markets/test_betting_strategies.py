@@ -36,6 +36,7 @@ from prediction_market_agent_tooling.tools.betting_strategies.kelly_criterion im
 from prediction_market_agent_tooling.tools.betting_strategies.market_moving import (
     _sanity_check_omen_market_moving_bet,
     get_market_moving_bet,
+    get_market_moving_bets,
 )
 from prediction_market_agent_tooling.tools.betting_strategies.minimum_bet_to_win import (
     minimum_bet_to_win,
@@ -190,6 +191,41 @@ def test_get_market_moving_bet(
     assert bet.direction == expected_bet_direction
 
 
+def test_get_market_moving_bets_vectorized() -> None:
+    rng = np.random.default_rng(42)
+    n = 1000
+    yes_pools = rng.uniform(1, 1000, n)
+    no_pools = rng.uniform(1, 1000, n)
+    market_p_yes = no_pools / (yes_pools + no_pools)
+    target_p_yes = rng.uniform(0.01, 0.99, n)
+    fee = 0.02
+
+    sizes, directions = get_market_moving_bets(
+        yes_pools, no_pools, market_p_yes, target_p_yes, fee=fee
+    )
+
+    # Same as the single-market version.
+    for i in range(0, n, 100):
+        bet = get_market_moving_bet(
+            yes_outcome_pool_size=yes_pools[i],
+            no_outcome_pool_size=no_pools[i],
+            market_p_yes=market_p_yes[i],
+            target_p_yes=target_p_yes[i],
+            fee=fee,
+        )
+        assert bet.direction == directions[i]
+        assert np.isclose(bet.size, sizes[i])
+
+    # Bets move the markets exactly to the targets.
+    amounts = sizes * (1 - fee)
+    new_yes_pools = yes_pools + amounts
+    new_no_pools = no_pools + amounts
+    fixed_products = yes_pools * no_pools
+    new_yes_pools = np.where(directions, fixed_products / new_no_pools, new_yes_pools)
+    new_no_pools = np.where(directions, new_no_pools, fixed_products / new_yes_pools)
+    assert np.allclose(new_no_pools / (new_yes_pools + new_no_pools), target_p_yes)
+
+
 @pytest.mark.parametrize("target_p_yes", [0.1, 0.51, 0.9])
 def test_sanity_check_market_moving_bet(target_p_yes: float) -> None:
     market = OmenAgentMarket.get_binary_markets(
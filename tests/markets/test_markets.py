@@ -1,3 +1,5 @@
+from datetime import timedelta
+
 import pytest
 
 from prediction_market_agent_tooling.gtypes import Probability
@@ -9,7 +11,9 @@ from prediction_market_agent_tooling.markets.agent_market import (
 from prediction_market_agent_tooling.markets.markets import (
     MARKET_TYPE_TO_AGENT_MARKET,
     MarketType,
+    RecentBetsIndex,
 )
+from prediction_market_agent_tooling.tools.utils import utcnow
 
 
 @pytest.mark.parametrize("market_type", list(MarketType))
@@ -38,6 +42,32 @@ def test_valid_token_pool() -> None:
     assert market.get_pool_tokens("no") == 2.0
 
 
+def test_recent_bets_index() -> None:
+    market = AgentMarket(
+        id="foo",
+        question="bar",
+        description=None,
+        outcomes=["yes", "no"],
+        outcome_token_pool=None,
+        resolution=None,
+        created_time=None,
+        close_time=None,
+        current_p_yes=Probability(0.5),
+        url="https://example.com",
+        volume=None,
+    )
+    index = RecentBetsIndex(
+        start_time=utcnow() - timedelta(hours=24),
+        latest_bet_times={"bar": utcnow() - timedelta(hours=2)},
+    )
+    assert index.have_bet_on_market_since(market, since=timedelta(hours=3))
+    assert not index.have_bet_on_market_since(market, since=timedelta(hours=1))
+    assert not index.covers(timedelta(hours=48))
+
+    index.add_bet(market.model_copy(update={"question": "baz"}))
+    assert "baz" in index.latest_bet_times
+
+
 def test_invalid_token_pool() -> None:
     with pytest.raises(ValueError) as e:
         AgentMarket(
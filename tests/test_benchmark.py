@@ -1,4 +1,6 @@
 import tempfile
+import threading
+import time
 from datetime import timedelta
 
 import pytest
@@ -84,6 +86,153 @@ def test_benchmark_run(
     benchmarker.generate_markdown_report()
 
 
+class SleepingAgent(bm.AbstractBenchmarkedAgent):
+    def __init__(self, agent_name: str, max_workers: int, sleep: float) -> None:
+        super().__init__(agent_name=agent_name, max_workers=max_workers)
+        self.sleep = sleep
+        self.lock = threading.Lock()
+        self.running = 0
+        self.max_running = 0
+
+    def check_and_predict(self, market_question: str) -> bm.Prediction:
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        time.sleep(self.sleep)
+        with self.lock:
+            self.running -= 1
+        return bm.Prediction(is_predictable=False)
+
+
+def test_benchmark_run_agents_concurrently() -> None:
+    markets = [
+        PolymarketAgentMarket(
+            description=None,
+            id=str(i),
+            volume=None,
+            url="url",
+            question=f"Will GNO go up {i}?",
+            current_p_yes=Probability(0.1),
+            outcomes=["Yes", "No"],
+            close_time=utcnow() + timedelta(hours=48),
+            resolution=None,
+            created_time=utcnow() - timedelta(hours=48),
+            outcome_token_pool=None,
+        )
+        for i in range(4)
+    ]
+    slow_agent = SleepingAgent("slow", max_workers=2, sleep=0.2)
+    fast_agent = SleepingAgent("fast", max_workers=1, sleep=0.1)
+    benchmarker = bm.Benchmarker(markets=markets, agents=[slow_agent, fast_agent])
+
+    start = time.monotonic()
+    benchmarker.run_agents()
+    elapsed = time.monotonic() - start
+
+    # Run one after another, it would take 0.4s + 0.4s.
+    assert elapsed < 0.7
+    assert slow_agent.max_running == 2
+    assert fast_agent.max_running == 1
+    for agent in [slow_agent, fast_agent]:
+        for market in markets:
+            assert not benchmarker.get_prediction(
+                agent.agent_name, market.question
+            ).is_predictable
+
+
+def test_benchmark_compute_metrics(
+    dummy_agent: DummyAgent, dummy_agent_no_prediction: DummyAgentNoPrediction
+) -> None:
+    markets = [
+        PolymarketAgentMarket(
+            description=None,
+            id=str(i),
+            volume=None,
+            url="url",
+            question=f"Will GNO go up {i}?",
+            current_p_yes=Probability(p_yes),
+            outcomes=["Yes", "No"],
+            close_time=utcnow() + timedelta(hours=48),
+            resolution=None,
+            created_time=utcnow() - timedelta(hours=48),
+            outcome_token_pool=None,
+        )
+        for i, p_yes in enumerate([0.1, 0.7])
+    ]
+    benchmarker = bm.Benchmarker(
+        markets=markets,
+        agents=[dummy_agent, dummy_agent_no_prediction],
+        frame_metric_fns={"Answered": lambda frame: int(frame["is_answered"].sum())},
+    )
+    benchmarker.run_agents()
+
+    metrics = benchmarker.compute_metrics()
+    assert metrics["Agents"] == ["dummy", "dummy_no_prediction"]
+    assert metrics["Answered"] == [2, 0]
+    assert metrics["MSE for `p_yes`"][0] == pytest.approx((0.5**2 + 0.1**2) / 2)
+    assert metrics["MSE for `p_yes`"][1] is None
+    assert metrics["% within +-0.1"][0] == 50
+    assert metrics["% correct outcome"][0] == 50
+    assert metrics["% precision for `yes`"][0] == 50
+    assert metrics["% recall for `yes`"][0] == 100
+    assert metrics["% precision for `no`"][0] == 0
+    assert metrics["Proportion answerable"] == [1, 0]
+
+    overall_summary, per_market = benchmarker.compute_expected_returns_summary()
+    assert overall_summary["Mean expected returns"][0] == pytest.approx(-20)
+    assert per_market["dummy"] == [pytest.approx(-80), pytest.approx(40)]
+    assert per_market["dummy_no_prediction"] == [None, None]
+
+
+def test_benchmark_sharded_run(dummy_agent: DummyAgent) -> None:
+    markets = [
+        PolymarketAgentMarket(
+            description=None,
+            id=str(i),
+            volume=None,
+            url="url",
+            question=f"Will GNO go up {i}?",
+            current_p_yes=Probability(0.1),
+            outcomes=["Yes", "No"],
+            close_time=utcnow() + timedelta(hours=48),
+            resolution=None,
+            created_time=utcnow() - timedelta(hours=48),
+            outcome_token_pool=None,
+        )
+        for i in range(10)
+    ]
+    n_shards = 3
+    with tempfile.TemporaryDirectory() as tmpdir:
+        shard_cache_paths = [f"{tmpdir}/cache-{i}.jsonl" for i in range(n_shards)]
+        for shard_index, shard_cache_path in enumerate(shard_cache_paths):
+            benchmarker = bm.Benchmarker(
+                markets=markets, agents=[dummy_agent], cache_path=shard_cache_path
+            )
+            benchmarker.run_agents(n_shards=n_shards, shard_index=shard_index)
+
+        # Re-running a shard (e.g. after it was killed) has nothing left to do.
+        benchmarker = bm.Benchmarker(
+            markets=markets, agents=[dummy_agent], cache_path=shard_cache_paths[0]
+        )
+        n_cached = len(benchmarker.predictions.predictions[dummy_agent.agent_name])
+        benchmarker.run_agents(n_shards=n_shards, shard_index=0)
+        assert (
+            len(benchmarker.predictions.predictions[dummy_agent.agent_name])
+            == n_cached
+            < len(markets)
+        )
+
+        merged = bm.Benchmarker(
+            markets=markets,
+            agents=[dummy_agent],
+            shard_cache_paths=shard_cache_paths,
+            only_cached=True,
+        )
+        assert merged.markets == markets
+        assert merged.compute_metrics()["Proportion answered"] == [1.0]
+        merged.generate_markdown_report()
+
+
 def test_cache() -> None:
     cache = bm.PredictionsCache(
         predictions={
@@ -107,6 +256,34 @@ def test_cache() -> None:
         assert cache == cache_loaded
 
 
+def test_cache_append() -> None:
+    def prediction(p_yes: float) -> bm.Prediction:
+        return bm.Prediction(
+            outcome_prediction=OutcomePrediction(
+                p_yes=Probability(p_yes), confidence=0.8, info_utility=None
+            )
+        )
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        cache_path = f"{tmpdir}/cache.json"
+        bm.PredictionsCache(predictions={"bar": {"foo": prediction(0.1)}}).save(
+            cache_path
+        )
+        bm.PredictionsCache.append(cache_path, "bar", "baz", prediction(0.2))
+        # Simulate a crash in the middle of a write.
+        with open(cache_path, "a") as f:
+            f.write('{"agent_name": "bar", "question": "tor')
+        bm.PredictionsCache.append(cache_path, "qux", "foo", prediction(0.3))
+
+        cache_loaded = bm.PredictionsCache.load(cache_path)
+        assert cache_loaded == bm.PredictionsCache(
+            predictions={
+                "bar": {"foo": prediction(0.1), "baz": prediction(0.2)},
+                "qux": {"foo": prediction(0.3)},
+            }
+        )
+
+
 def test_benchmarker_cache(dummy_agent: DummyAgent) -> None:
     with tempfile.TemporaryDirectory() as tmpdir:
         cache_path = f"{tmpdir}/cache.json"
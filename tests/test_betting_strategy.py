@@ -3,7 +3,10 @@ from unittest.mock import Mock
 import pytest
 
 from prediction_market_agent_tooling.deploy.betting_strategy import (
+    BettingStrategy,
+    KellyBettingStrategy,
     MaxAccuracyBettingStrategy,
+    MaxAccuracyWithKellyScaledBetsStrategy,
 )
 from prediction_market_agent_tooling.gtypes import Probability
 from prediction_market_agent_tooling.markets.data_models import (
@@ -60,3 +63,66 @@ def test_rebalance() -> None:
     sell_trade = trades[1]
     assert sell_trade.trade_type == TradeType.SELL
     assert sell_trade.amount.amount == mock_amount.amount
+
+
+def mock_omen_market(
+    market_id: str, yes_pool: float, no_pool: float, has_token_pool: bool
+) -> Mock:
+    market = Mock(OmenAgentMarket, wraps=OmenAgentMarket)
+    market.id = market_id
+    market.currency = Currency.xDai
+    market.current_p_yes = no_pool / (yes_pool + no_pool)
+    market.has_token_pool.return_value = has_token_pool
+    market.outcome_token_pool = {
+        OmenAgentMarket.get_outcome_str_from_bool(True): yes_pool,
+        OmenAgentMarket.get_outcome_str_from_bool(False): no_pool,
+    }
+    return market
+
+
+@pytest.mark.parametrize(
+    "strategy",
+    [
+        KellyBettingStrategy(max_bet_amount=5),
+        MaxAccuracyWithKellyScaledBetsStrategy(max_bet_amount=5),
+        MaxAccuracyBettingStrategy(bet_amount=1),
+    ],
+)
+def test_calculate_trades_many(strategy: BettingStrategy) -> None:
+    markets = [
+        mock_omen_market(f"0x{i}", yes_pool, no_pool, has_token_pool=i % 3 != 0)
+        for i, (yes_pool, no_pool) in enumerate(
+            [(10, 20), (20, 10), (15, 15), (5, 50), (50, 5), (30, 31)]
+        )
+    ]
+    answers = [
+        ProbabilisticAnswer(p_yes=Probability(p_yes), confidence=confidence)
+        for p_yes, confidence in [
+            (0.9, 1.0),
+            (0.2, 0.5),
+            (0.5, 0.8),
+            (0.95, 0.9),
+            (0.99, 0.1),
+            (0.3, 1.0),
+        ]
+    ]
+    existing_position = Position(
+        market_id="0x1",
+        amounts={
+            OmenAgentMarket.get_outcome_str_from_bool(True): TokenAmount(
+                amount=1, currency=Currency.xDai
+            )
+        },
+    )
+    existing_positions = [None, existing_position, None, None, None, None]
+
+    # Same trades as when calculated one by one.
+    assert strategy.calculate_trades_many(existing_positions, answers, markets) == [
+        strategy.calculate_trades(existing_position, answer, market)
+        for existing_position, answer, market in zip(
+            existing_positions, answers, markets
+        )
+    ]
+
+    with pytest.raises(ValueError):
+        strategy.calculate_trades_many(existing_positions[:1], answers, markets)
@@ -0,0 +1,74 @@
+import json
+import threading
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from prediction_market_agent_tooling.tools.web3_provider import Web3ProviderRegistry
+
+FAKE_TRANSACTION_COUNT = 5
+
+
+def _fake_rpc_result(method: str, params: list[t.Any]) -> t.Any:
+    if method == "eth_chainId":
+        return "0x64"
+    if method == "eth_getCode":
+        # No contracts deployed on the fake chain.
+        return "0x"
+    if method == "eth_getTransactionCount":
+        return hex(FAKE_TRANSACTION_COUNT)
+    if method == "eth_estimateGas":
+        return hex(21_000)
+    if method == "eth_call":
+        # Echo the last 32 bytes of the calldata, so `balanceOf(address)` returns the address as uint256.
+        return "0x" + params[0]["data"][-64:]
+    raise ValueError(f"Unsupported method {method}")
+
+
+class _FakeRPCHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    batch_sizes: list[int] = []
+
+    def do_POST(self) -> None:
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        requests = request if isinstance(request, list) else [request]
+        self.batch_sizes.append(len(requests))
+        responses = [self._respond_to(r) for r in requests]
+        body = json.dumps(responses if isinstance(request, list) else responses[0])
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode())
+
+    @staticmethod
+    def _respond_to(request: dict[str, t.Any]) -> dict[str, t.Any]:
+        try:
+            result = _fake_rpc_result(request["method"], request["params"])
+        except ValueError as e:
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": -32601, "message": str(e)},
+            }
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_rpc_batch_sizes() -> list[int]:
+    _FakeRPCHandler.batch_sizes = []
+    return _FakeRPCHandler.batch_sizes
+
+
+@pytest.fixture
+def fake_rpc_url(fake_rpc_batch_sizes: list[int]) -> t.Generator[str, None, None]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeRPCHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    Web3ProviderRegistry.close_all()
+    server.shutdown()
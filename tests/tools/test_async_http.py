@@ -0,0 +1,94 @@
+import asyncio
+import json
+import threading
+import time
+import typing as t
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from prediction_market_agent_tooling.tools.async_http import (
+    AsyncHTTPClient,
+    run_with_async_client,
+)
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    lock = threading.Lock()
+    in_flight = 0
+    max_in_flight = 0
+    requested_paths: list[str] = []
+
+    def do_GET(self) -> None:
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+            cls.requested_paths.append(self.path)
+        time.sleep(0.05)
+        body = json.dumps({"path": self.path})
+        self.send_response(503 if self.path.startswith("/fail") else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body.encode())
+        with cls.lock:
+            cls.in_flight -= 1
+
+    def log_message(self, *args: t.Any) -> None:
+        pass
+
+
+@pytest.fixture
+def slow_server_url() -> t.Generator[str, None, None]:
+    _SlowHandler.max_in_flight = 0
+    _SlowHandler.requested_paths = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+def test_async_http_client(slow_server_url: str) -> None:
+    n_requests = 20
+
+    async def fetch_all(client: AsyncHTTPClient) -> list[str]:
+        responses = await asyncio.gather(
+            *(client.get(f"{slow_server_url}/{i}") for i in range(n_requests))
+        )
+        return [r.json()["path"] for r in responses]
+
+    paths = run_with_async_client(fetch_all, max_concurrent_requests=5)
+
+    assert paths == [f"/{i}" for i in range(n_requests)]
+    assert 1 < _SlowHandler.max_in_flight <= 5
+
+
+def test_async_http_client_does_not_retry(slow_server_url: str) -> None:
+    async def fetch(client: AsyncHTTPClient) -> httpx.Response:
+        return await client.get(f"{slow_server_url}/fail")
+
+    # Retries are up to the callers.
+    with pytest.raises(httpx.HTTPStatusError):
+        run_with_async_client(fetch)
+    assert _SlowHandler.requested_paths == ["/fail"]
+
+
+def test_run_with_async_client_reuses_client(slow_server_url: str) -> None:
+    async def fetch(client: AsyncHTTPClient) -> AsyncHTTPClient:
+        await client.get(f"{slow_server_url}/reuse")
+        return client
+
+    first = run_with_async_client(fetch)
+    second = run_with_async_client(fetch)
+    assert first is second
+
+    async def fetch_under_running_loop() -> tuple[AsyncHTTPClient, AsyncHTTPClient]:
+        return run_with_async_client(fetch), run_with_async_client(fetch)
+
+    worker_first, worker_second = asyncio.run(fetch_under_running_loop())
+    assert worker_first is worker_second
+    assert worker_first is not first
@@ -0,0 +1,133 @@
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from prediction_market_agent_tooling.config import APIKeys
+from prediction_market_agent_tooling.tools.cache import (
+    cache_key,
+    get_cache,
+    two_tier_cache,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setenv("ENABLE_CACHE", "true")
+    monkeypatch.setenv("CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_cache_key_is_stable() -> None:
+    def func(question: str, api_keys: APIKeys | None = None, n: int = 3) -> None:
+        pass
+
+    key = cache_key(func, "question")
+    assert key == cache_key(func, question="question", n=3)
+    assert key == cache_key(func, "question", APIKeys())
+    assert key != cache_key(func, "question", n=4)
+
+
+def test_two_tier_cache(cache_dir: Path) -> None:
+    calls = []
+
+    @two_tier_cache(max_memory_items=2)
+    def square(x: int) -> int:
+        calls.append(x)
+        return x * x
+
+    assert [square(x) for x in [1, 2, 1, 3, 1]] == [1, 4, 1, 9, 1]
+    assert calls == [1, 2, 3]
+
+    cache = get_cache(square)
+    stats = cache.stats()
+    assert (stats.memory_hits, stats.disk_hits, stats.misses) == (2, 0, 3)
+    assert stats.memory_evictions == 1
+    assert stats.memory_items == 2
+
+    # Evicted from memory, but still on the disk.
+    assert square(2) == 4
+    assert calls == [1, 2, 3]
+    assert cache.stats().disk_hits == 1
+
+
+def test_two_tier_cache_ttl(cache_dir: Path) -> None:
+    calls = []
+
+    @two_tier_cache(ttl=timedelta(seconds=0.2))
+    def identity(x: int) -> int:
+        calls.append(x)
+        return x
+
+    identity(1)
+    identity(1)
+    time.sleep(0.3)
+    identity(1)
+    assert calls == [1, 1]
+    assert get_cache(identity).stats().expirations == 1
+
+
+def test_two_tier_cache_disk_budget(cache_dir: Path) -> None:
+    @two_tier_cache(max_memory_items=1, max_disk_bytes=3500)
+    def payload(x: int) -> bytes:
+        return bytes(1000)
+
+    for x in range(5):
+        payload(x)
+
+    cache = get_cache(payload)
+    assert cache.stats().disk_evictions == 2
+    cache.clear_memory()
+    payload(4)
+    assert cache.stats().disk_hits == 1
+    payload(0)
+    assert cache.stats().misses == 6
+
+
+def test_cache_key_rejects_unkeyable_arguments() -> None:
+    def func(value: object) -> None:
+        pass
+
+    with pytest.raises(TypeError):
+        cache_key(func, object())
+
+
+def test_two_tier_cache_keeps_unpicklable_values_in_memory(cache_dir: Path) -> None:
+    calls = []
+
+    @two_tier_cache()
+    def make_lock(x: int) -> threading.Lock:
+        calls.append(x)
+        return threading.Lock()
+
+    lock = make_lock(1)
+    assert make_lock(1) is lock
+    assert calls == [1]
+
+
+def test_two_tier_cache_reuses_disk_connection_per_thread(cache_dir: Path) -> None:
+    @two_tier_cache()
+    def identity(x: int) -> int:
+        return x
+
+    disk = get_cache(identity).disk
+    assert disk is not None
+    with disk._connect() as conn:
+        pass
+    identity(1)
+    identity(2)
+    with disk._connect() as same_conn:
+        assert same_conn is conn
+
+    other_thread_conns = []
+
+    def connect() -> None:
+        with disk._connect() as other_conn:
+            other_thread_conns.append(other_conn)
+
+    thread = threading.Thread(target=connect)
+    thread.start()
+    thread.join()
+    assert other_thread_conns[0] is not conn
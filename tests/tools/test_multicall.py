@@ -0,0 +1,22 @@
+from web3 import Web3
+
+from prediction_market_agent_tooling.tools.contract import ContractERC20BaseClass
+from prediction_market_agent_tooling.tools.web3_provider import get_pooled_web3
+
+
+def test_batch_falls_back_to_json_rpc_batching(
+    fake_rpc_url: str, fake_rpc_batch_sizes: list[int]
+) -> None:
+    web3 = get_pooled_web3(fake_rpc_url)
+    addresses = [Web3.to_checksum_address(f"0x{i:040x}") for i in range(1, 11)]
+    token = ContractERC20BaseClass(address=addresses[0])
+
+    with token.batch(web3=web3) as batch:
+        balances = [
+            token.call_batched(batch, "balanceOf", [address]) for address in addresses
+        ]
+        assert not any(balance.done() for balance in balances)
+
+    assert [balance.result() for balance in balances] == list(range(1, 11))
+    # One request to check if Multicall3 is deployed and one for all the calls.
+    assert fake_rpc_batch_sizes == [1, 10]
@@ -0,0 +1,66 @@
+import pytest
+from web3 import Web3
+
+from prediction_market_agent_tooling.gtypes import Nonce, Wei, private_key_type
+from prediction_market_agent_tooling.tools.nonce_manager import NonceManager
+from prediction_market_agent_tooling.tools.web3_provider import get_pooled_web3
+from prediction_market_agent_tooling.tools.web3_utils import (
+    private_key_to_public_key,
+    send_xdai_to,
+)
+from tests.tools.conftest import FAKE_TRANSACTION_COUNT
+
+ADDRESS = Web3.to_checksum_address("0x" + "1" * 40)
+
+
+def test_nonces_are_assigned_locally_while_in_flight(fake_rpc_url: str) -> None:
+    web3 = get_pooled_web3(fake_rpc_url)
+
+    first = NonceManager.acquire(web3, ADDRESS)
+    second = NonceManager.acquire(web3, ADDRESS)
+    assert (first, second) == (FAKE_TRANSACTION_COUNT, FAKE_TRANSACTION_COUNT + 1)
+    assert NonceManager.in_flight(web3, ADDRESS) == {first, second}
+
+    NonceManager.release(web3, ADDRESS, first)
+    assert NonceManager.acquire(web3, ADDRESS) == FAKE_TRANSACTION_COUNT + 2
+
+    for nonce in NonceManager.in_flight(web3, ADDRESS):
+        NonceManager.release(web3, ADDRESS, nonce)
+    assert NonceManager.in_flight(web3, ADDRESS) == set()
+
+    # Once nothing is in flight, the next nonce is read from the node again.
+    assert NonceManager.acquire(web3, ADDRESS) == FAKE_TRANSACTION_COUNT
+    NonceManager.release(web3, ADDRESS, Nonce(FAKE_TRANSACTION_COUNT))
+
+
+def test_failed_nonce_is_reused_while_others_are_in_flight(fake_rpc_url: str) -> None:
+    web3 = get_pooled_web3(fake_rpc_url)
+
+    a = NonceManager.acquire(web3, ADDRESS)
+    b = NonceManager.acquire(web3, ADDRESS)
+    # A fails before it's sent, while B is already on its way.
+    NonceManager.release(web3, ADDRESS, a, failed=True)
+    c = NonceManager.acquire(web3, ADDRESS)
+    d = NonceManager.acquire(web3, ADDRESS)
+
+    # The gap is filled first, and B's nonce isn't handed out again.
+    assert (a, b, c, d) == (
+        FAKE_TRANSACTION_COUNT,
+        FAKE_TRANSACTION_COUNT + 1,
+        FAKE_TRANSACTION_COUNT,
+        FAKE_TRANSACTION_COUNT + 2,
+    )
+
+    for nonce in NonceManager.in_flight(web3, ADDRESS):
+        NonceManager.release(web3, ADDRESS, nonce)
+
+
+def test_nonce_is_released_if_sending_fails(fake_rpc_url: str) -> None:
+    web3 = get_pooled_web3(fake_rpc_url)
+    private_key = private_key_type("0x" + "2" * 64)
+
+    # Fake node doesn't support `eth_gasPrice`, so it fails after the nonce is acquired.
+    with pytest.raises(Exception, match="eth_gasPrice"):
+        send_xdai_to(web3, private_key, ADDRESS, Wei(1))
+
+    assert NonceManager.in_flight(web3, private_key_to_public_key(private_key)) == set()
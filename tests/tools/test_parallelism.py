@@ -1,4 +1,11 @@
-from prediction_market_agent_tooling.tools.parallelism import par_generator, par_map
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from prediction_market_agent_tooling.tools.parallelism import (
+    RateLimiter,
+    par_generator,
+    par_map,
+)
 
 
 def test_par_map() -> None:
@@ -13,3 +20,12 @@ def test_par_generator() -> None:
     f = lambda x: x**2
     results = par_generator(l, f, max_workers=5)
     assert [f(x) for x in l] == sorted(results)
+
+
+def test_rate_limiter() -> None:
+    rate_limiter = RateLimiter(calls_per_second=20)
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(lambda _: rate_limiter.wait(), range(5)))
+    # First call goes immediately, the other four are spaced by 0.05s.
+    assert 0.2 <= time.monotonic() - start < 0.5
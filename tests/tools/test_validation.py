@@ -0,0 +1,105 @@
+import copy
+import gc
+import typing as t
+
+from pydantic import BaseModel, model_validator
+
+from prediction_market_agent_tooling.gtypes import HexBytes, Wei
+from prediction_market_agent_tooling.tools.validation import (
+    GC_PAUSE_MIN_ITEMS,
+    paused_gc,
+    validate_models,
+)
+
+
+class Parent(BaseModel):
+    id: str
+    hash: HexBytes
+    amount: Wei
+
+
+class Child(BaseModel):
+    id: str
+    hash: HexBytes
+    parent: Parent
+
+
+def child_item(n: int, parent_n: int) -> dict[str, t.Any]:
+    return {
+        "id": str(n),
+        "hash": f"0x{n:064x}",
+        "parent": {"id": str(parent_n), "hash": f"0x{parent_n:040x}", "amount": "1"},
+    }
+
+
+def test_validate_models_matches_model_validate() -> None:
+    items = [child_item(n, n % 3) for n in range(10)]
+    original_items = copy.deepcopy(items)
+    expected = [Child.model_validate(i) for i in items]
+
+    assert validate_models(Child, items) == expected
+    trusted = validate_models(Child, items, trusted=True)
+    assert trusted == expected
+    assert all(isinstance(c.hash, HexBytes) for c in trusted)
+    # Same nested entities are validated only once and shared.
+    assert trusted[0].parent is trusted[3].parent
+    assert trusted[0].parent is not trusted[1].parent
+    assert items == original_items
+
+
+def test_paused_gc_overlapping() -> None:
+    assert gc.isenabled()
+    first, second = paused_gc(), paused_gc()
+
+    first.__enter__()
+    second.__enter__()
+    # The first one to finish doesn't enable it, while the other one still runs.
+    first.__exit__(None, None, None)
+    assert not gc.isenabled()
+    second.__exit__(None, None, None)
+    assert gc.isenabled()
+
+    gc.disable()
+    try:
+        with paused_gc():
+            pass
+        # Stays disabled if it was disabled before.
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
+
+
+class GCStateRecorder(BaseModel):
+    id: str
+    gc_enabled: bool = True
+
+    @model_validator(mode="after")
+    def record_gc_state(self) -> "GCStateRecorder":
+        self.gc_enabled = gc.isenabled()
+        return self
+
+
+def test_validate_models_pauses_gc_only_for_large_inputs() -> None:
+    small = validate_models(GCStateRecorder, [{"id": "0"}])
+    assert small[0].gc_enabled
+
+    large = validate_models(
+        GCStateRecorder, [{"id": str(n)} for n in range(GC_PAUSE_MIN_ITEMS)]
+    )
+    assert not any(m.gc_enabled for m in large)
+    assert gc.isenabled()
+
+
+class HashHolder(BaseModel):
+    hash: HexBytes
+
+
+def test_validate_models_trusted_hex_without_usual_form() -> None:
+    items = [{"hash": "0x0"}, {"hash": "abcd"}, {"hash": "0xabcd"}]
+    trusted = validate_models(HashHolder, items, trusted=True)
+    assert trusted == validate_models(HashHolder, items)
+    assert [m.hash for m in trusted] == [
+        HexBytes("0x00"),
+        HexBytes("0xabcd"),
+        HexBytes("0xabcd"),
+    ]
@@ -0,0 +1,33 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from prediction_market_agent_tooling.tools.web3_provider import (
+    Web3ProviderRegistry,
+    get_pooled_web3,
+)
+
+
+def test_pooled_web3_is_shared(fake_rpc_url: str) -> None:
+    web3 = get_pooled_web3(fake_rpc_url)
+    assert get_pooled_web3(fake_rpc_url) is web3
+
+    stats = Web3ProviderRegistry.get_stats(fake_rpc_url)
+    assert stats.misses == 1
+    assert stats.hits == 1
+
+
+def test_pooled_web3_reuses_connections_across_threads(fake_rpc_url: str) -> None:
+    n_requests = 50
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        chain_ids = list(
+            executor.map(
+                lambda _: get_pooled_web3(fake_rpc_url).eth.chain_id,
+                range(n_requests),
+            )
+        )
+
+    assert chain_ids == [100] * n_requests
+    stats = Web3ProviderRegistry.get_stats(fake_rpc_url)
+    assert stats.requests == n_requests
+    assert stats.errors == 0
+    assert sum(stats.latency_histogram_ms.values()) == n_requests
+    assert 1 <= stats.open_connections <= 5
@@ -2,13 +2,20 @@ import re
 
 import pytest
 from pydantic.types import SecretStr
+from web3 import Web3
 
-from prediction_market_agent_tooling.gtypes import IPFSCIDVersion0
+from prediction_market_agent_tooling.gtypes import (
+    ABI,
+    IPFSCIDVersion0,
+    Wei,
+    private_key_type,
+)
 from prediction_market_agent_tooling.tools.web3_utils import (
     NOT_REVERTED_ICASE_REGEX_PATTERN,
     byte32_to_ipfscidv0,
     ipfscidv0_to_byte32,
     private_key_to_public_key,
+    send_function_calls_on_contract_tx_using_safe_multisend,
 )
 
 
@@ -46,3 +53,16 @@ def test_ipfs_hash_conversion() -> None:
 def test_not_reverted_regex(string: str, matched: bool) -> None:
     p = re.compile(NOT_REVERTED_ICASE_REGEX_PATTERN)
     assert bool(p.match(string)) == matched
+
+
+def test_multisend_requires_value_for_each_call() -> None:
+    with pytest.raises(ValueError, match="one value for each call"):
+        send_function_calls_on_contract_tx_using_safe_multisend(
+            web3=Web3(),
+            contract_address=Web3.to_checksum_address("0x" + "1" * 40),
+            contract_abi=ABI("[]"),
+            from_private_key=private_key_type("0x" + "2" * 64),
+            safe_address=Web3.to_checksum_address("0x" + "3" * 40),
+            calls=[("deposit", None), ("deposit", None)],
+            values=[Wei(1)],
+        )
@@ -128,3 +128,48 @@ def test_wont_retry(local_web3: Web3, accounts: list[TestAccount]) -> None:
     assert (
         end_time - start_time < 1
     ), "Should not retry --> should take less then 1 second to execute."
+
+
+def test_batched_calls_match_single_calls(
+    local_web3: Web3, accounts: list[TestAccount]
+) -> None:
+    wxdai = WrappedxDaiContract()
+    addresses = [Web3.to_checksum_address(account.address) for account in accounts]
+
+    with wxdai.batch(web3=local_web3) as batch:
+        balances = [
+            wxdai.call_batched(batch, "balanceOf", [address]) for address in addresses
+        ]
+        symbol = wxdai.call_batched(batch, "symbol")
+
+    assert [balance.result() for balance in balances] == [
+        wxdai.balanceOf(address, web3=local_web3) for address in addresses
+    ]
+    assert symbol.result() == wxdai.symbol(web3=local_web3)
+
+
+def test_send_many_pipelined_in_chunks(
+    local_web3: Web3, accounts: list[TestAccount]
+) -> None:
+    wxdai = WrappedxDaiContract()
+    api_keys = APIKeys(BET_FROM_PRIVATE_KEY=private_key_type(accounts[0].private_key))
+    spenders = [Web3.to_checksum_address(account.address) for account in accounts[1:6]]
+    amounts = [xdai_to_wei(xDai(i + 1)) for i in range(len(spenders))]
+
+    receipts = wxdai.send_many(
+        api_keys=api_keys,
+        calls=[
+            ("approve", [spender, amount]) for spender, amount in zip(spenders, amounts)
+        ],
+        # Multiple chunks, the last one not full.
+        max_calls_per_tx=2,
+        web3=local_web3,
+    )
+
+    # Without Safe, each call is a separate transaction.
+    assert len(receipts) == len(spenders)
+    assert all(receipt["status"] == 1 for receipt in receipts)
+    assert [
+        wxdai.call("allowance", [api_keys.bet_from_address, spender], web3=local_web3)
+        for spender in spenders
+    ] == amounts
@@ -212,6 +212,30 @@ def test_omen_redeem_positions(
     omen_redeem_full_position_tx(api_keys=test_keys, market=market, web3=local_web3)
 
 
+def test_redeem_many_positions(local_web3: Web3, test_keys: APIKeys) -> None:
+    markets = OmenSubgraphHandler().get_omen_binary_markets_simple(
+        limit=3, filter_by=FilterBy.RESOLVED, sort_by=SortBy.NEWEST
+    )
+    assert len(markets) == 3
+
+    # Redeeming positions without any balance is a no-op, but the transactions must go through.
+    receipts = OmenConditionalTokenContract().redeem_many_positions(
+        api_keys=test_keys,
+        positions=[
+            (
+                market.collateral_token_contract_address_checksummed,
+                market.condition.id,
+                market.condition.index_sets,
+            )
+            for market in markets
+        ],
+        web3=local_web3,
+    )
+
+    assert len(receipts) == len(markets)
+    assert all(receipt["status"] == 1 for receipt in receipts)
+
+
 @pytest.mark.skip(reason=DEFAULT_REASON)
 def test_create_market_fund_market_remove_funding() -> None:
     """
@@ -0,0 +1,78 @@
+from ape_test import TestAccount
+from gnosis.safe import Safe
+from web3 import Web3
+
+from prediction_market_agent_tooling.config import APIKeys
+from prediction_market_agent_tooling.gtypes import Wei
+from prediction_market_agent_tooling.markets.omen.omen_contracts import (
+    WrappedxDaiContract,
+)
+from prediction_market_agent_tooling.tools.web3_utils import (
+    send_function_calls_on_contract_tx_using_safe_multisend,
+    send_xdai_to,
+    xdai_to_wei,
+    xdai_type,
+)
+
+
+def safe_keys(test_keys: APIKeys, test_safe: Safe) -> APIKeys:
+    return APIKeys(
+        BET_FROM_PRIVATE_KEY=test_keys.bet_from_private_key,
+        SAFE_ADDRESS=test_safe.address,
+    )
+
+
+def test_send_many_packs_calls_into_multisend_transactions(
+    test_safe: Safe, test_keys: APIKeys, local_web3: Web3, accounts: list[TestAccount]
+) -> None:
+    wxdai = WrappedxDaiContract()
+    api_keys = safe_keys(test_keys, test_safe)
+    spenders = [Web3.to_checksum_address(account.address) for account in accounts[1:6]]
+    amounts = [xdai_to_wei(xdai_type(i + 1)) for i in range(len(spenders))]
+
+    receipts = wxdai.send_many(
+        api_keys=api_keys,
+        calls=[
+            ("approve", [spender, amount]) for spender, amount in zip(spenders, amounts)
+        ],
+        max_calls_per_tx=2,
+        web3=local_web3,
+    )
+
+    # One Safe transaction per chunk of calls.
+    assert len(receipts) == 3
+    assert all(receipt["status"] == 1 for receipt in receipts)
+    # Approvals are made by the Safe itself, not by its owner.
+    assert [
+        wxdai.call("allowance", [test_safe.address, spender], web3=local_web3)
+        for spender in spenders
+    ] == amounts
+
+
+def test_multisend_sends_values_of_each_call(
+    test_safe: Safe, test_keys: APIKeys, local_web3: Web3
+) -> None:
+    wxdai = WrappedxDaiContract()
+    values = [xdai_to_wei(xdai_type(1)), xdai_to_wei(xdai_type(2))]
+    send_xdai_to(
+        web3=local_web3,
+        from_private_key=test_keys.bet_from_private_key,
+        to_address=test_safe.address,
+        value=Wei(sum(values)),
+    )
+    initial_balance = wxdai.balanceOf(test_safe.address, web3=local_web3)
+
+    receipt = send_function_calls_on_contract_tx_using_safe_multisend(
+        web3=local_web3,
+        contract_address=wxdai.address,
+        contract_abi=wxdai.abi,
+        from_private_key=test_keys.bet_from_private_key,
+        safe_address=test_safe.address,
+        calls=[("deposit", None), ("deposit", None)],
+        values=values,
+    )
+
+    assert receipt["status"] == 1
+    assert wxdai.balanceOf(test_safe.address, web3=local_web3) == Wei(
+        initial_balance + sum(values)
+    )